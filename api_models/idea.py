@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional
 
 class Idea(BaseModel):
@@ -9,3 +9,10 @@ class Idea(BaseModel):
     title: str
     body: str
     visibility: str = "public"
+
+class SimilarIdeasQuery(BaseModel):
+    title: str
+    description: str = ""
+    workspace_id: Optional[int] = None
+    limit: int = Field(10, ge=1, le=50)
+    threshold: Optional[float] = Field(None, ge=0.0, le=1.0)
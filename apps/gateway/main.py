@@ -1,6 +1,33 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
-from apps.gateway.routers import health, workspace, community, idea, search, reporting
+from apps.gateway.routers import health, workspace, community, idea, search, reporting, metrics, debug
+from apps.gateway.middleware import MetricsMiddleware, ServerTimingMiddleware, TenantMiddleware
+from apps.gateway.responses import ProfiledJSONResponse
+from domains.member.service import (
+    MEMBERSHIP_INDEX_ENABLED,
+    close_membership_service,
+    open_membership_service,
+)
+from ideahub_platform.authz.audit import decision_auditor
+from ideahub_platform.common.health import health_sampler
+from ideahub_platform.common.metrics import mark_process_dead
+from ideahub_platform.events.bus import event_bus
+from ideahub_platform.events.dedup import EventDeduplicator
+from ideahub_platform.events.log import open_event_log
+from ideahub_platform.events.outbox import OUTBOX_RELAY_ENABLED, OutboxRelay
+from ideahub_platform.events.transport import create_transport
+from ideahub_platform.search.indexer import (
+    SEARCH_BACKEND,
+    SEARCH_SUGGEST_ENABLED,
+    close_idea_index,
+    open_idea_index,
+    open_similar_index,
+    open_suggest_index,
+)
+from ideahub_platform.search.similar import SIMILAR_IDEAS_ENABLED
 from ideahub_platform.common.errors import (
     IdeaHubError,
     AuthenticationError,
@@ -10,7 +37,71 @@ from ideahub_platform.common.errors import (
     ConflictError,
 )
 
-app = FastAPI(title="IdeaScale Python API", version="0.1.0")
+SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING_ENABLED", "true").lower() == "true"
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Background samplers feed /health/detailed and /health/ready
+    await health_sampler.start()
+    # Committed outbox rows are relayed onto this worker's event bus, the
+    # transport (EVENT_TRANSPORT) fans published events out to the other workers
+    # and each worker logs the events it publishes to its own log in EVENT_LOG_DIR
+    relay = OutboxRelay() if OUTBOX_RELAY_ENABLED else None
+    transport = create_transport()
+    event_log = open_event_log()
+    # The in-memory search, suggestion and near-duplicate indexes are fed by
+    # idea events, so they need the bus too
+    memory_search = SEARCH_BACKEND == "memory"
+    if memory_search:
+        await asyncio.to_thread(open_idea_index)
+    if SEARCH_SUGGEST_ENABLED:
+        await asyncio.to_thread(open_suggest_index)
+    if SIMILAR_IDEAS_ENABLED:
+        await asyncio.to_thread(open_similar_index)
+    # Request subjects carry their workspace memberships from this cache,
+    # which membership events invalidate
+    if MEMBERSHIP_INDEX_ENABLED:
+        open_membership_service(event_bus)
+    bus_task = None
+    if (relay or transport or event_log or memory_search or MEMBERSHIP_INDEX_ENABLED
+            or SEARCH_SUGGEST_ENABLED or SIMILAR_IDEAS_ENABLED):
+        event_bus.set_transport(transport)
+        event_bus.set_event_log(event_log)
+        # Outbox and transport redeliveries are dropped by event_id
+        event_bus.add_middleware(EventDeduplicator())
+        bus_task = asyncio.create_task(event_bus.start())
+    if relay:
+        await relay.start()
+    try:
+        yield
+    finally:
+        if relay:
+            await relay.stop()
+        if bus_task:
+            await event_bus.stop()
+            await bus_task
+        if event_log:
+            await asyncio.to_thread(event_log.close)
+        if memory_search:
+            await asyncio.to_thread(close_idea_index)
+        close_membership_service()
+        await health_sampler.stop()
+        decision_auditor.stop()
+        mark_process_dead()
+
+app = FastAPI(
+    title="IdeaScale Python API",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ProfiledJSONResponse,
+)
+
+# Resolve the tenant workspace once per request into request.state.workspace
+app.add_middleware(TenantMiddleware)
+# Per-request query counts and db/authz/serialize Server-Timing
+app.add_middleware(ServerTimingMiddleware, emit_header=SERVER_TIMING_ENABLED)
+# Added last so it is outermost and times the whole middleware stack
+app.add_middleware(MetricsMiddleware)
 
 # Global exception handler to normalize IdeaHub errors to HTTP responses with string detail
 @app.exception_handler(IdeaHubError)
@@ -38,3 +129,5 @@ app.include_router(community.router)
 app.include_router(idea.router)
 app.include_router(search.router)
 app.include_router(reporting.router)
+app.include_router(metrics.router)
+app.include_router(debug.router)
@@ -0,0 +1,105 @@
+# Gateway ASGI middleware
+import time
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Receive, Scope, Send
+from ideahub_platform.common.metrics import HTTP_REQUEST_DURATION
+from ideahub_platform.common.profiling import profile_request
+from ideahub_platform.common.tenant import CachedTenantResolver, get_tenant_resolver
+
+
+class TenantMiddleware:
+    """Resolves the request's workspace once and stores it on `request.state`.
+
+    The workspace is taken from the `<slug>.<TENANT_BASE_DOMAIN>` subdomain or a
+    `/workspace/<slug>` path prefix. Downstream handlers read
+    `request.state.workspace` (a `WorkspaceRef` or None) instead of querying.
+    """
+
+    def __init__(self, app: ASGIApp, resolver: CachedTenantResolver = None):
+        self.app = app
+        self.resolver = resolver or get_tenant_resolver()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        host = Headers(scope=scope).get("host", "")
+        slug = self.resolver.extract_slug(host, scope.get("path", ""))
+        workspace = None
+        if slug:
+            found, workspace = self.resolver.peek(slug)
+            if not found:
+                # Cache miss: the DB lookup is blocking, keep it off the event loop
+                workspace = await run_in_threadpool(self.resolver.resolve, slug)
+
+        state = scope.setdefault("state", {})
+        state["workspace_slug"] = slug
+        state["workspace"] = workspace
+        await self.app(scope, receive, send)
+
+
+class MetricsMiddleware:
+    """Records request latency labelled by method, route template and status.
+
+    The route label is the matched path template (e.g. `/workspaces/{workspace_id}`),
+    so label cardinality stays bounded; unmatched paths are grouped as `unmatched`.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.labels(
+                scope["method"],
+                getattr(route, "path", "unmatched"),
+                str(status_code),
+            ).observe(time.perf_counter() - started)
+
+
+class ServerTimingMiddleware:
+    """Profiles each request and reports db/authz/serialize time in `Server-Timing`.
+
+    Statement counts come from the SQLAlchemy cursor hooks, which also log a
+    warning when one statement shape repeats beyond DB_QUERY_REPEAT_WARN_THRESHOLD.
+    """
+
+    def __init__(self, app: ASGIApp, emit_header: bool = True):
+        self.app = app
+        self.emit_header = emit_header
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        with profile_request(label=f"{scope['method']} {scope['path']}") as profile:
+
+            async def send_wrapper(message) -> None:
+                if message["type"] == "http.response.start" and self.emit_header:
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing", profile.server_timing(time.perf_counter() - started)
+                    )
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,16 @@
+# Gateway response classes
+import time
+from typing import Any
+from fastapi.responses import JSONResponse
+from ideahub_platform.common.profiling import add_phase_time
+
+
+class ProfiledJSONResponse(JSONResponse):
+    """JSONResponse that reports its rendering time as the `serialize` phase."""
+
+    def render(self, content: Any) -> bytes:
+        started = time.perf_counter()
+        try:
+            return super().render(content)
+        finally:
+            add_phase_time("serialize", time.perf_counter() - started)
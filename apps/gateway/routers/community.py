@@ -1,7 +1,63 @@
-from fastapi import APIRouter
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from apps.gateway.subject import debug_subject
+from domains.community.repository import CommunityRepository
+from domains.community.rules import COMMUNITY_BINDING
+from domains.community.service import CommunityService
+from ideahub_platform.authz.registry import get_engine
+from ideahub_platform.common.errors import AuthorizationError, NotFoundError
+from ideahub_platform.db.base import get_db
 
 router = APIRouter(prefix="/communities")
 
+authz_engine = get_engine()
+
+def get_community_service(db: Session = Depends(get_db)) -> CommunityService:
+    return CommunityService(CommunityRepository(db))
+
+@router.get("")
+def list_communities(
+    workspace_id: Optional[int] = Query(None),
+    fields: Optional[str] = Query(None, description="Comma-separated fields (description is opt-in)"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    subject=Depends(debug_subject),
+    svc: CommunityService = Depends(get_community_service)
+):
+    """Communities the caller may read, newest first with keyset pagination."""
+    items, next_cursor = svc.list(
+        svc.fields(fields),
+        workspace_id=workspace_id,
+        limit=limit,
+        cursor=cursor,
+        visibility_filter=authz_engine.sql_filter(subject, "COMMUNITY_READ", COMMUNITY_BINDING),
+    )
+    return {"items": items, "next_cursor": next_cursor}
+
 @router.get("/{community_id}")
-def get_community(community_id: int):
-    return {"id": community_id, "name": "Community", "workspace_id": 1, "public": True}
+def get_community(
+    community_id: int,
+    fields: Optional[str] = Query(None, description="Comma-separated fields (description is opt-in)"),
+    subject=Depends(debug_subject),
+    svc: CommunityService = Depends(get_community_service)
+):
+    """Get a community by ID with authorization."""
+    community = svc.get(
+        community_id,
+        svc.fields(fields),
+        visibility_filter=authz_engine.sql_filter(subject, "COMMUNITY_READ", COMMUNITY_BINDING),
+    )
+    if community is not None:
+        return community
+    if svc.exists(community_id):
+        raise AuthorizationError(
+            message="Access denied",
+            error_code="ACCESS_DENIED",
+            details={"community_id": community_id},
+        )
+    raise NotFoundError(
+        message="Community not found",
+        error_code="COMMUNITY_NOT_FOUND",
+        details={"community_id": community_id},
+    )
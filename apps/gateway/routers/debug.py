@@ -0,0 +1,43 @@
+import os
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from ideahub_platform.authz.audit import get_decision_auditor
+from ideahub_platform.common.errors import NotFoundError
+from ideahub_platform.db.slow_queries import get_slow_query_recorder
+
+# SQL text and authz decisions are sensitive, so these routes are off by default
+DEBUG_ENDPOINTS_ENABLED = os.getenv("DEBUG_ENDPOINTS_ENABLED", "false").lower() == "true"
+
+def require_debug_endpoints():
+    if not DEBUG_ENDPOINTS_ENABLED:
+        raise NotFoundError("Not found", error_code="NOT_FOUND")
+
+router = APIRouter(prefix="/debug", tags=["debug"], dependencies=[Depends(require_debug_endpoints)])
+
+@router.get("/slow-queries")
+def get_slow_queries(limit: int = Query(50, ge=1, le=1000, description="Number of entries to return")):
+    """Most recent slow queries (enable with DB_SLOW_QUERY_LOG=true)."""
+    recorder = get_slow_query_recorder()
+    entries = recorder.entries(limit)
+    return {
+        "enabled": recorder.enabled,
+        "threshold_ms": recorder.threshold_ms,
+        "explain_sample_rate": recorder.explain_sample_rate,
+        "returned_count": len(entries),
+        "items": [entry.to_dict() for entry in entries],
+    }
+
+@router.get("/authz-decisions")
+def get_authz_decisions(
+    limit: int = Query(100, ge=1, le=1000, description="Number of entries to return"),
+    allow: Optional[bool] = Query(None, description="Only grants (true) or denials (false)")
+):
+    """Recently sampled authorization decisions."""
+    auditor = get_decision_auditor()
+    records = auditor.recent(limit, allow)
+    return {
+        "allow_sample_rate": auditor.allow_sample_rate,
+        "deny_sample_rate": auditor.deny_sample_rate,
+        "returned_count": len(records),
+        "items": [record.to_dict() for record in records],
+    }
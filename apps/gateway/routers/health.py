@@ -1,10 +1,9 @@
 from fastapi import APIRouter, Request, Header
 from ideahub_platform.db.base import db_manager
+from ideahub_platform.common.health import health_sampler
 from ideahub_platform.common.logging import get_logger
 from ideahub_platform.i18n import get_text
 from datetime import datetime
-import psutil
-import os
 from typing import Optional
 
 logger = get_logger(__name__)
@@ -25,16 +24,10 @@ async def health(accept_language: Optional[str] = Header(None)):
 async def detailed_health(request: Request):
     """Detailed health check with system metrics."""
     
-    # Database health check
-    db_healthy = await db_manager.health_check()
-    
-    # System metrics
-    cpu_percent = psutil.cpu_percent(interval=1)
-    memory = psutil.virtual_memory()
-    disk = psutil.disk_usage('/')
-    
-    # Application metrics
-    process = psutil.Process(os.getpid())
+    # Served from the background sampler; nothing here blocks the event loop
+    db_status = await health_sampler.database()
+    snapshot = health_sampler.system
+    db_healthy = db_status.healthy
     
     health_data = {
         "status": "healthy" if db_healthy else "unhealthy",
@@ -43,29 +36,23 @@ async def detailed_health(request: Request):
         "checks": {
             "database": {
                 "status": "healthy" if db_healthy else "unhealthy",
+                "checked_at": db_status.checked_at.isoformat(),
+                "latency_ms": db_status.latency_ms,
                 "connection_info": db_manager.get_connection_info()
             },
             "system": {
-                "cpu_percent": cpu_percent,
-                "memory_percent": memory.percent,
-                "memory_available": memory.available,
-                "disk_percent": disk.percent,
-                "disk_free": disk.free
+                **snapshot.system,
+                "sampled_at": snapshot.timestamp.isoformat()
             },
-            "application": {
-                "process_id": process.pid,
-                "memory_usage": process.memory_info().rss,
-                "cpu_percent": process.cpu_percent(),
-                "threads": process.num_threads()
-            }
+            "application": snapshot.application
         }
     }
     
-    logger.info("Detailed health check", extra_fields={
+    logger.debug("Detailed health check", extra_fields={
         "request_id": getattr(request.state, "request_id", "unknown"),
         "db_healthy": db_healthy,
-        "cpu_percent": cpu_percent,
-        "memory_percent": memory.percent
+        "cpu_percent": snapshot.system["cpu_percent"],
+        "memory_percent": snapshot.system["memory_percent"]
     })
     
     return health_data
@@ -73,9 +60,9 @@ async def detailed_health(request: Request):
 @router.get("/health/ready")
 async def readiness_check():
     """Readiness check for Kubernetes."""
-    db_healthy = await db_manager.health_check()
+    db_status = await health_sampler.database()
     
-    if db_healthy:
+    if db_status.healthy:
         return {"status": "ready"}
     else:
         return {"status": "not_ready", "reason": "database_unavailable"}
@@ -1,7 +1,164 @@
-from fastapi import APIRouter
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.orm import Session
+from api_models.idea import SimilarIdeasQuery
+from apps.gateway.subject import debug_subject
+from domains.idea.repository import IdeaRepository
+from domains.idea.rules import IDEA_BINDING
+from domains.idea.service import IdeaService
+from ideahub_platform.authz.registry import get_engine
+from ideahub_platform.common.errors import AuthorizationError, NotFoundError, ValidationError
+from ideahub_platform.db.base import get_db
+from ideahub_platform.reporting.related import RelatedIdeasService
+from ideahub_platform.search import indexer
+from ideahub_platform.search.index import IndexedIdea
 
 router = APIRouter(prefix="/ideas")
 
+authz_engine = get_engine()
+
+# Most ids accepted by a bulk GET /ideas?ids=
+MAX_BULK_IDS = 100
+# Near-duplicates ranked before dropping those the caller may not read
+MAX_SIMILAR_CANDIDATES = 200
+
+def get_idea_service(db: Session = Depends(get_db)) -> IdeaService:
+    return IdeaService(IdeaRepository(db))
+
+def parse_ids(ids: str) -> List[int]:
+    try:
+        values = [int(value) for value in ids.split(",") if value.strip()]
+    except ValueError:
+        raise ValidationError("ids must be comma-separated integers", error_code="INVALID_IDS")
+    if len(values) > MAX_BULK_IDS:
+        raise ValidationError(
+            f"At most {MAX_BULK_IDS} ids per request",
+            error_code="TOO_MANY_IDS",
+            details={"count": len(values), "max": MAX_BULK_IDS},
+        )
+    return values
+
+@router.post("/similar")
+def similar_ideas(
+    query: SimilarIdeasQuery,
+    request: Request,
+    subject=Depends(debug_subject),
+    svc: IdeaService = Depends(get_idea_service)
+):
+    """Existing ideas the caller may read that look like near-duplicates of the given text.
+
+    Only ids and similarity are returned; callers load the ideas through the
+    idea endpoints.
+    """
+    workspace_id = query.workspace_id
+    if workspace_id is None:
+        workspace = getattr(request.state, "workspace", None)
+        workspace_id = workspace.id if workspace else None
+    items = []
+    if indexer.similar_index is not None and workspace_id is not None:
+        matches = indexer.similar_index.similar(
+            workspace_id,
+            indexer.idea_text(query.title, query.description),
+            limit=MAX_SIMILAR_CANDIDATES,
+            threshold=query.threshold,
+        )
+        # Scores reveal idea text, so unreadable ideas are dropped before ranking is cut
+        rows = {
+            row["id"]: row for row in svc.get_many(
+                [idea_id for idea_id, _ in matches],
+                ["id", "community_id", "author_id", "visibility"],
+            )
+        }
+        candidates = [
+            (IndexedIdea(idea_id, "", row["community_id"], workspace_id, row["author_id"],
+                         row["visibility"] == "public"), score)
+            for idea_id, score in matches
+            if (row := rows.get(idea_id)) is not None
+        ]
+        decision = authz_engine.decide_many(
+            subject, "IDEA_READ", [idea for idea, _ in candidates],
+            {"request_id": getattr(request.state, "request_id", "unknown")},
+        )
+        items = [
+            {"id": idea.id, "similarity": round(score, 4)}
+            for (idea, score), allowed in zip(candidates, decision.allow) if allowed
+        ][:query.limit]
+    return {"items": items}
+
+@router.get("")
+def list_ideas(
+    ids: Optional[str] = Query(None, description="Comma-separated ids to fetch in one call"),
+    community_id: Optional[int] = Query(None),
+    workspace_id: Optional[int] = Query(None),
+    fields: Optional[str] = Query(None, description="Comma-separated fields (description and metadata are opt-in)"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    subject=Depends(debug_subject),
+    svc: IdeaService = Depends(get_idea_service)
+):
+    """Ideas the caller may read: by `ids`, or newest first with keyset pagination."""
+    names = svc.fields(fields)
+    visibility_filter = authz_engine.sql_filter(subject, "IDEA_READ", IDEA_BINDING)
+    if ids is not None:
+        return {"items": svc.get_many(parse_ids(ids), names, visibility_filter)}
+    items, next_cursor = svc.list(
+        names,
+        community_id=community_id,
+        workspace_id=workspace_id,
+        limit=limit,
+        cursor=cursor,
+        visibility_filter=visibility_filter,
+    )
+    return {"items": items, "next_cursor": next_cursor}
+
+def readable_idea(svc: IdeaService, idea_id: int, names: List[str], subject) -> dict:
+    """The idea's `names` fields; 403 if `subject` may not read it, 404 if it does not exist."""
+    idea = svc.get(
+        idea_id,
+        names,
+        visibility_filter=authz_engine.sql_filter(subject, "IDEA_READ", IDEA_BINDING),
+    )
+    if idea is not None:
+        return idea
+    if svc.exists(idea_id):
+        raise AuthorizationError(
+            message="Access denied",
+            error_code="ACCESS_DENIED",
+            details={"idea_id": idea_id},
+        )
+    raise NotFoundError(
+        message="Idea not found",
+        error_code="IDEA_NOT_FOUND",
+        details={"idea_id": idea_id},
+    )
+
 @router.get("/{idea_id}")
-def get_idea(idea_id: int):
-    return {"id": idea_id, "community_id": 1, "title": "Hello", "body": "World"}
+def get_idea(
+    idea_id: int,
+    fields: Optional[str] = Query(None, description="Comma-separated fields (description and metadata are opt-in)"),
+    subject=Depends(debug_subject),
+    svc: IdeaService = Depends(get_idea_service)
+):
+    """Get an idea by ID with authorization."""
+    return readable_idea(svc, idea_id, svc.fields(fields), subject)
+
+@router.get("/{idea_id}/related")
+def related_ideas(
+    idea_id: int,
+    limit: int = Query(10, ge=1, le=50),
+    subject=Depends(debug_subject),
+    svc: IdeaService = Depends(get_idea_service),
+    db: Session = Depends(get_db)
+):
+    """Ideas most similar to this one, precomputed by the related ideas job.
+
+    The caller must be able to read the idea itself: its neighbours and
+    their scores reveal what it says.
+    """
+    readable_idea(svc, idea_id, ["id"], subject)
+    items = RelatedIdeasService(db).related(
+        idea_id,
+        limit=limit,
+        visibility_filter=authz_engine.sql_filter(subject, "IDEA_READ", IDEA_BINDING),
+    )
+    return {"idea_id": idea_id, "items": items}
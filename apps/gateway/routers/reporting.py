@@ -7,7 +7,6 @@ from ideahub_platform.reporting.services import ReportingService
 from ideahub_platform.reporting.processors import (
     IdeaStatProcessor, CommunityStatProcessor, WorkspaceStatProcessor
 )
-from ideahub_platform.common.tenant import get_workspace_from_request
 from ideahub_platform.common.logging import get_logger
 from ideahub_platform.i18n import get_text
 
@@ -198,8 +197,8 @@ async def get_analytics_dashboard(
 ):
     """Get analytics dashboard data for the current workspace."""
     try:
-        # Extract workspace from request URL
-        workspace = get_workspace_from_request(str(request.url), db)
+        # Workspace is resolved once per request by TenantMiddleware
+        workspace = getattr(request.state, "workspace", None)
         
         if not workspace:
             raise HTTPException(status_code=404, detail="Workspace not found")
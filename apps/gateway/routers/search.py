@@ -1,7 +1,140 @@
-from fastapi import APIRouter, Query
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, Query, Request
+from sqlalchemy.orm import Session
+from apps.gateway.subject import build_subject, debug_subject
+from domains.idea.rules import IDEA_BINDING
+from ideahub_platform.authz.engine import Request as AuthRequest
+from ideahub_platform.authz.registry import get_engine
+from ideahub_platform.db.base import get_db
+from ideahub_platform.common.errors import AuthorizationError, ValidationError
+from ideahub_platform.search import IdeaSearchService, indexer
+from ideahub_platform.search.facets import TagFacetService
+from ideahub_platform.search.index import IndexedIdea
 
 router = APIRouter()
 
+authz_engine = get_engine()
+
 @router.get("/search")
-def search(q: str = Query(default="")):
-    return {"q": q, "items": []}
+def search(
+    request: Request,
+    q: str = Query(default=""),
+    workspace_id: Optional[int] = Query(None, description="Defaults to the request's tenant workspace"),
+    community_id: Optional[int] = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    x_debug_auth: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
+    """Ranked full-text search over ideas the caller may read."""
+    if not q.strip():
+        return {"q": q, "items": [], "next_cursor": None}
+
+    if workspace_id is None:
+        workspace = getattr(request.state, "workspace", None)
+        workspace_id = workspace.id if workspace else None
+
+    subject = build_subject(x_debug_auth)
+    if indexer.SEARCH_BACKEND == "memory" and indexer.idea_index is not None:
+        page = indexer.idea_index.search(
+            q,
+            workspace_id=workspace_id,
+            community_id=community_id,
+            limit=limit,
+            cursor=cursor,
+            allow=lambda ideas: authz_engine.decide_many(subject, "IDEA_READ", ideas).allow,
+        )
+        return {
+            "q": q,
+            "items": [hit.to_dict() for hit in page.items],
+            "next_cursor": page.next_cursor,
+        }
+
+    page = IdeaSearchService(db).search(
+        q,
+        workspace_id=workspace_id,
+        community_id=community_id,
+        limit=limit,
+        cursor=cursor,
+        visibility_filter=authz_engine.sql_filter(subject, "IDEA_READ", IDEA_BINDING),
+    )
+    return {
+        "q": q,
+        "items": [hit.to_dict() for hit in page.items],
+        "next_cursor": page.next_cursor,
+    }
+
+def reads_private_ideas(subject, workspace_id: int, request: Request) -> bool:
+    """Whether IDEA_READ lets `subject` read a non-public idea it does not own in the workspace."""
+    idea = IndexedIdea(None, "", None, workspace_id, None, False)
+    return authz_engine.decide(AuthRequest(
+        subject=subject,
+        action="IDEA_READ",
+        resource=idea,
+        ctx={"request_id": getattr(request.state, "request_id", "unknown")},
+    )).allow
+
+@router.get("/search/suggest")
+def suggest(
+    request: Request,
+    prefix: str = Query(default=""),
+    workspace_id: Optional[int] = Query(None, description="Defaults to the request's tenant workspace"),
+    limit: int = Query(10, ge=1, le=20),
+    subject=Depends(debug_subject)
+):
+    """Autocomplete: the most used title terms and tags, starting with `prefix`, of ideas the caller may read."""
+    if workspace_id is None:
+        workspace = getattr(request.state, "workspace", None)
+        workspace_id = workspace.id if workspace else None
+    items = []
+    if indexer.suggest_index is not None and workspace_id is not None:
+        # Callers who cannot read every idea only see terms from public ideas
+        public_only = not reads_private_ideas(subject, workspace_id, request)
+        items = [
+            {"text": text, "count": count}
+            for text, count in indexer.suggest_index.suggest(
+                workspace_id, prefix, limit, public_only=public_only
+            )
+        ]
+    return {"prefix": prefix, "items": items}
+
+@router.get("/search/facets")
+def tag_facets(
+    request: Request,
+    q: str = Query(default="", description="Count tags over this search's results instead"),
+    workspace_id: Optional[int] = Query(None, description="Defaults to the request's tenant workspace"),
+    community_id: Optional[int] = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    subject=Depends(debug_subject),
+    db: Session = Depends(get_db)
+):
+    """Tag counts over the ideas the caller may read in a workspace, a community or matching `q`."""
+    if workspace_id is None:
+        workspace = getattr(request.state, "workspace", None)
+        workspace_id = workspace.id if workspace else None
+    if workspace_id is None:
+        raise ValidationError("workspace_id is required", error_code="WORKSPACE_REQUIRED")
+
+    decision = authz_engine.decide(AuthRequest(
+        subject=subject,
+        action="WORKSPACE_READ",
+        resource={"id": workspace_id},
+        ctx={"request_id": getattr(request.state, "request_id", "unknown")},
+    ))
+    if not decision.allow:
+        raise AuthorizationError(
+            message=f"Access denied: {decision.reason}",
+            error_code="ACCESS_DENIED",
+            details={"workspace_id": workspace_id, "reason": decision.reason}
+        )
+
+    items = TagFacetService(db).facets(
+        workspace_id,
+        community_id=community_id,
+        q=q.strip() or None,
+        limit=limit,
+        visibility_filter=authz_engine.sql_filter(subject, "IDEA_READ", IDEA_BINDING),
+        # Cached counts come in two classes: every idea, or public ideas only
+        public_only=not reads_private_ideas(subject, workspace_id, request),
+    )
+    return {"workspace_id": workspace_id, "community_id": community_id, "q": q, "items": items}
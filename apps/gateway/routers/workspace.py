@@ -1,5 +1,6 @@
 from fastapi import APIRouter, HTTPException, Header, Depends, Request
 from typing import Optional
+from apps.gateway.subject import build_subject
 from domains.workspace.repository import WorkspaceRepository
 from domains.workspace.service import WorkspaceService
 from mappers.workspace_mapper import map_workspace
@@ -25,13 +26,7 @@ def get_workspace(
     """Get workspace by ID with authorization."""
     
     # Create subject object for authorization
-    is_authenticated = x_debug_auth != "anon"
-    subject = type('Subject', (), {
-        'is_authenticated': is_authenticated,
-        'id': 1,  # Mock user ID
-        'roles': ['user'],
-        'is_admin': False
-    })()
+    subject = build_subject(x_debug_auth)
     
     # Create authorization request
     auth_request = AuthRequest(
@@ -0,0 +1,17 @@
+from typing import Optional
+from fastapi import Header
+from domains.member.service import attach_memberships
+
+def build_subject(x_debug_auth: Optional[str] = None):
+    """Mock request subject (anonymous when `x-debug-auth: anon`) with its workspace memberships."""
+    subject = type('Subject', (), {
+        'is_authenticated': x_debug_auth != "anon",
+        'id': 1,  # Mock user ID
+        'roles': ['user'],
+        'is_admin': False
+    })()
+    return attach_memberships(subject)
+
+def debug_subject(x_debug_auth: Optional[str] = Header(None)):
+    """FastAPI dependency form of `build_subject`."""
+    return build_subject(x_debug_auth)
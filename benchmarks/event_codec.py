@@ -0,0 +1,96 @@
+"""Benchmark: slotted event envelope + binary codec vs. the previous dataclasses + JSON.
+
+The baseline is the old `Event` (a regular dataclass with a `datetime`
+timestamp and a free-form dict payload) serialized as JSON. Reports
+encode/decode throughput, encoded size and per-event memory.
+
+    python -m benchmarks.event_codec
+"""
+import json
+import timeit
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+from ideahub_platform.events import codec
+from ideahub_platform.events.event_types import Event, EventType, IdeaEventData
+
+ITERATIONS = 50000
+MEMORY_EVENTS = 100000
+
+
+@dataclass
+class LegacyEvent:
+    """The pre-envelope `Event` from events/bus.py."""
+    event_type: EventType
+    data: Dict[str, Any]
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+    event_id: Optional[str] = None
+    correlation_id: Optional[str] = None
+    user_id: Optional[str] = None
+
+
+def legacy_encode(event: LegacyEvent) -> bytes:
+    return json.dumps({
+        "event_type": event.event_type.value,
+        "data": event.data,
+        "timestamp": event.timestamp.isoformat(),
+        "event_id": event.event_id,
+        "correlation_id": event.correlation_id,
+        "user_id": event.user_id,
+    }).encode()
+
+
+def legacy_decode(payload: bytes) -> LegacyEvent:
+    message = json.loads(payload)
+    return LegacyEvent(
+        event_type=EventType(message["event_type"]),
+        data=message["data"],
+        timestamp=datetime.fromisoformat(message["timestamp"]),
+        event_id=message["event_id"],
+        correlation_id=message["correlation_id"],
+        user_id=message["user_id"],
+    )
+
+
+def legacy_event(n: int) -> LegacyEvent:
+    return LegacyEvent(EventType.IDEA_CREATED, {
+        "idea_id": n, "community_id": 7, "author_id": 42,
+        "title": "Improve onboarding flow", "visibility": "public",
+    }, event_id=f"{n:032x}")
+
+
+def new_event(n: int) -> Event:
+    return Event(EventType.IDEA_CREATED,
+                 IdeaEventData(n, 7, 42, "Improve onboarding flow", "public"),
+                 event_id=f"{n:032x}")
+
+
+def per_event_bytes(factory) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    events = [factory(n) for n in range(MEMORY_EVENTS)]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del events
+    return used / MEMORY_EVENTS
+
+
+def main():
+    cases = {
+        "dataclass + JSON": (legacy_event(1), legacy_encode, legacy_decode, legacy_event),
+        "slotted + binary": (new_event(1), codec.encode, codec.decode, new_event),
+    }
+    print(f"{ITERATIONS} events per measurement, memory over {MEMORY_EVENTS} events")
+    for name, (event, encode, decode, factory) in cases.items():
+        payload = encode(event)
+        t_encode = timeit.timeit(lambda: encode(event), number=ITERATIONS)
+        t_decode = timeit.timeit(lambda: decode(payload), number=ITERATIONS)
+        print(f"{name:>17}: encode {ITERATIONS / t_encode:9.0f}/s"
+              f"  decode {ITERATIONS / t_decode:9.0f}/s"
+              f"  {len(payload):4d} bytes/event"
+              f"  {per_event_bytes(factory):6.0f} bytes in memory/event")
+
+
+if __name__ == "__main__":
+    main()
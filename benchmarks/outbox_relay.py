@@ -0,0 +1,84 @@
+"""Benchmark: sustained outbox throughput with a concurrent producer and relay.
+
+A producer thread commits idea events to the outbox in small transactions
+(as request handlers would) while the relay drains it in batches. Reports
+produced and relayed events/sec and the relay lag at the end of the run.
+
+    python -m benchmarks.outbox_relay
+    OUTBOX_BENCH_DATABASE_URL=postgresql+psycopg2://... python -m benchmarks.outbox_relay
+
+The default is a temporary SQLite file, where FOR UPDATE SKIP LOCKED is a
+no-op; point it at PostgreSQL for representative numbers.
+"""
+import logging
+import os
+import tempfile
+import threading
+import time
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from ideahub_platform.db.models.outbox import OutboxEvent
+from ideahub_platform.events.bus import Event, EventBus
+from ideahub_platform.events.event_types import EventType
+from ideahub_platform.events.outbox import OutboxRelay, add_to_outbox
+
+DURATION = float(os.getenv("OUTBOX_BENCH_SECONDS", "10"))
+EVENTS_PER_TRANSACTION = 10
+BATCH_SIZE = 500
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    url = os.getenv("OUTBOX_BENCH_DATABASE_URL")
+    if not url:
+        url = f"sqlite:///{tempfile.mkdtemp()}/outbox.db"
+    engine = create_engine(url)
+    OutboxEvent.__table__.drop(engine, checkfirst=True)
+    OutboxEvent.__table__.create(engine)
+    session_factory = sessionmaker(bind=engine)
+
+    stop = threading.Event()
+    produced = 0
+
+    def produce():
+        nonlocal produced
+        n = 0
+        while not stop.is_set():
+            with session_factory() as session:
+                for _ in range(EVENTS_PER_TRANSACTION):
+                    n += 1
+                    add_to_outbox(session, Event(EventType.IDEA_CREATED,
+                                                 {"idea_id": n, "workspace_id": n % 50}))
+                session.commit()
+            produced = n
+
+    bus = EventBus()
+    relay = OutboxRelay(session_factory, bus, batch_size=BATCH_SIZE)
+
+    def dispatch(events):
+        for event in events:
+            bus.publish_sync(event)
+
+    producer = threading.Thread(target=produce)
+    started = time.perf_counter()
+    producer.start()
+    relayed = 0
+    while time.perf_counter() - started < DURATION:
+        count = relay.relay_batch(dispatch)
+        relayed += count
+        if count < BATCH_SIZE:
+            time.sleep(0.01)
+    stop.set()
+    producer.join()
+    elapsed = time.perf_counter() - started
+
+    with session_factory() as session:
+        backlog = session.scalar(select(func.count()).where(OutboxEvent.processed_at.is_(None)))
+    print(f"{engine.dialect.name}, {elapsed:.1f} s, relay batch size {BATCH_SIZE}")
+    print(f"  produced {produced / elapsed:10.0f} events/s")
+    print(f"  relayed  {relayed / elapsed:10.0f} events/s")
+    print(f"  backlog at end: {backlog} rows")
+
+
+if __name__ == "__main__":
+    main()
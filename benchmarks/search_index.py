@@ -0,0 +1,94 @@
+"""Benchmark: in-memory BM25 idea index over a synthetic corpus.
+
+Builds an index of SEARCH_BENCH_DOCS ideas (default 1M) whose words follow
+a Zipf distribution over a 50k-word vocabulary, then reports build time,
+memory, query latency percentiles for rare/common/multi-term queries and
+snapshot save/load times.
+
+    python -m benchmarks.search_index
+    SEARCH_BENCH_DOCS=100000 python -m benchmarks.search_index
+"""
+import gc
+import os
+import random
+import resource
+import statistics
+import tempfile
+import time
+from ideahub_platform.search.index import InvertedIndex
+
+DOCS = int(os.getenv("SEARCH_BENCH_DOCS", "1000000"))
+VOCABULARY = 50000
+TITLE_WORDS = 6
+DESCRIPTION_WORDS = 40
+WORKSPACES = 50
+QUERIES = 500
+
+
+def rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def percentile(samples, p):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+def main():
+    rng = random.Random(42)
+    words = [f"w{n}" for n in range(VOCABULARY)]
+    weights = [1 / (rank + 1) for rank in range(VOCABULARY)]
+    cumulative = []
+    total = 0.0
+    for weight in weights:
+        total += weight
+        cumulative.append(total)
+
+    def text(count):
+        return " ".join(rng.choices(words, cum_weights=cumulative, k=count))
+
+    before = rss_mb()
+    index = InvertedIndex()
+    started = time.perf_counter()
+    for idea_id in range(1, DOCS + 1):
+        workspace = idea_id % WORKSPACES + 1
+        index.add(idea_id, text(TITLE_WORDS), text(DESCRIPTION_WORDS),
+                  community_id=workspace * 10, workspace_id=workspace, owner_id=idea_id % 1000)
+    build = time.perf_counter() - started
+    gc.collect()
+    print(f"docs={DOCS} terms={index.term_count} build={build:.1f}s "
+          f"({DOCS / build:,.0f} docs/s) rss_growth~{rss_mb() - before:,.0f} MiB")
+
+    queries = {
+        "rare": lambda: words[rng.randrange(10000, VOCABULARY)],
+        "common": lambda: words[rng.randrange(10, 100)],
+        "two-term": lambda: f"{words[rng.randrange(100, 1000)]} {words[rng.randrange(1000, 10000)]}",
+        "workspace": lambda: words[rng.randrange(100, 1000)],
+    }
+    for name, make in queries.items():
+        samples = []
+        for _ in range(QUERIES):
+            q = make()
+            workspace_id = rng.randrange(1, WORKSPACES + 1) if name == "workspace" else None
+            started = time.perf_counter()
+            index.search(q, workspace_id=workspace_id, limit=20)
+            samples.append((time.perf_counter() - started) * 1000)
+        print(f"{name:>10}: p50={statistics.median(samples):.2f}ms "
+              f"p99={percentile(samples, 0.99):.2f}ms")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "ideas.idx")
+        started = time.perf_counter()
+        index.save(path)
+        saved = time.perf_counter() - started
+        size = os.path.getsize(path) / 1024 / 1024
+        del index
+        gc.collect()
+        started = time.perf_counter()
+        InvertedIndex.load(path)
+        loaded = time.perf_counter() - started
+    print(f"snapshot: {size:,.0f} MiB, save={saved:.1f}s load={loaded:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
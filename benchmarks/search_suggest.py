@@ -0,0 +1,67 @@
+"""Benchmark: /search/suggest prefix lookups over a synthetic corpus.
+
+Indexes SUGGEST_BENCH_DOCS ideas (default 1M) spread over 50 workspaces,
+with Zipf-distributed title words and tags, then replays keystroke-style
+prefixes (1-5 characters of a vocabulary word) while a share of
+iterations update ideas, invalidating cached prefixes as they would in
+production. Reports lookup latency percentiles.
+
+    python -m benchmarks.search_suggest
+"""
+import os
+import random
+import statistics
+import time
+from ideahub_platform.search.suggest import SuggestIndex
+
+DOCS = int(os.getenv("SUGGEST_BENCH_DOCS", "1000000"))
+VOCABULARY = 50000
+TITLE_WORDS = 6
+WORKSPACES = 50
+LOOKUPS = 20000
+UPDATE_RATIO = 0.1
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+
+def percentile(samples, p):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+def main():
+    rng = random.Random(7)
+    words = ["".join(rng.choices(LETTERS, k=rng.randint(3, 10))) for _ in range(VOCABULARY)]
+    tags = [f"{words[n]} {words[n + 1]}" for n in range(0, 2000, 2)]
+    cumulative = []
+    total = 0.0
+    for rank in range(VOCABULARY):
+        total += 1 / (rank + 1)
+        cumulative.append(total)
+
+    def idea(idea_id):
+        title = " ".join(rng.choices(words, cum_weights=cumulative, k=TITLE_WORDS))
+        return idea_id, idea_id % WORKSPACES + 1, title, rng.sample(tags, 2)
+
+    index = SuggestIndex()
+    started = time.perf_counter()
+    for idea_id in range(1, DOCS + 1):
+        index.add(*idea(idea_id))
+    build = time.perf_counter() - started
+    print(f"docs={DOCS} build={build:.1f}s ({DOCS / build:,.0f} docs/s)")
+
+    samples = []
+    for _ in range(LOOKUPS):
+        if rng.random() < UPDATE_RATIO:
+            index.add(*idea(rng.randrange(1, DOCS + 1)))
+        word = rng.choices(words, cum_weights=cumulative)[0]
+        prefix = word[:rng.randint(1, min(5, len(word)))]
+        workspace_id = rng.randrange(1, WORKSPACES + 1)
+        started = time.perf_counter()
+        index.suggest(workspace_id, prefix, 10)
+        samples.append((time.perf_counter() - started) * 1000)
+    print(f"lookups={LOOKUPS}: p50={statistics.median(samples):.3f}ms "
+          f"p99={percentile(samples, 0.99):.3f}ms max={max(samples):.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
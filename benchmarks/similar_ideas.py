@@ -0,0 +1,56 @@
+"""Benchmark: near-duplicate lookup cost as a workspace grows.
+
+Indexes synthetic idea texts into one workspace in steps up to
+SIMILAR_BENCH_DOCS (default 200k) and, at each size, times lookups of
+lightly edited copies of indexed ideas. With LSH banding the lookup time
+should stay roughly flat while a brute-force scan grows linearly.
+
+    python -m benchmarks.similar_ideas
+"""
+import os
+import random
+import statistics
+import time
+from ideahub_platform.search.similar import SimilarIdeaIndex
+
+DOCS = int(os.getenv("SIMILAR_BENCH_DOCS", "200000"))
+STEPS = 4
+WORDS_PER_IDEA = 30
+VOCABULARY = 20000
+LOOKUPS = 300
+
+
+def main():
+    rng = random.Random(3)
+    words = [f"w{n}" for n in range(VOCABULARY)]
+    texts = {}
+    index = SimilarIdeaIndex()
+    print(f"num_perm={index.num_perm} bands={index.bands} rows={index.rows} "
+          f"capacity={index.capacity:,} ideas")
+
+    next_id = 1
+    for step in range(1, STEPS + 1):
+        target = DOCS * step // STEPS
+        started = time.perf_counter()
+        while next_id <= target:
+            texts[next_id] = " ".join(rng.choices(words, k=WORDS_PER_IDEA))
+            index.add(next_id, 1, texts[next_id])
+            next_id += 1
+        added = time.perf_counter() - started
+
+        samples, found = [], 0
+        for _ in range(LOOKUPS):
+            idea_id = rng.randrange(1, target + 1)
+            edited = texts[idea_id].split()
+            edited[rng.randrange(len(edited))] = "changed"
+            started = time.perf_counter()
+            matches = index.similar(1, " ".join(edited))
+            samples.append((time.perf_counter() - started) * 1000)
+            found += any(m == idea_id for m, _ in matches)
+        print(f"ideas={target:>9,}: add={added / (DOCS // STEPS) * 1e6:.0f}us/idea "
+              f"lookup p50={statistics.median(samples):.2f}ms "
+              f"max={max(samples):.2f}ms recall={found / LOOKUPS:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,48 @@
-# Community repository stub
-# This is a stub file for future community repository implementation
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import exists, select
+from sqlalchemy.orm import Session
+from ideahub_platform.db.models.community import Community
+from ideahub_platform.db.projection import Projection, keyset_page
+
+COMMUNITY_FIELDS = Projection(
+    {
+        "id": Community.id,
+        "workspace_id": Community.workspace_id,
+        "name": Community.name,
+        "description": Community.description,
+        "public": Community.public,
+        "created_at": Community.created_at,
+        "updated_at": Community.updated_at,
+    },
+    default=("id", "workspace_id", "name", "public", "created_at", "updated_at"),
+)
+COMMUNITY_SORT = ("created_at", "id")
+
+class CommunityRepository:
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+
+    def get(self, community_id: int, fields: Sequence[str],
+            visibility_filter: Any = None) -> Optional[Dict[str, Any]]:
+        stmt = COMMUNITY_FIELDS.select(fields).where(Community.id == community_id)
+        if visibility_filter is not None:
+            stmt = stmt.where(visibility_filter)
+        row = self.db_session.execute(stmt).first()
+        return COMMUNITY_FIELDS.to_dict(row, fields) if row else None
+
+    def exists(self, community_id: int) -> bool:
+        return self.db_session.execute(
+            select(exists().where(Community.id == community_id))
+        ).scalar()
+
+    def list(self, fields: Sequence[str], workspace_id: Optional[int] = None, limit: int = 20,
+             cursor: Optional[str] = None, visibility_filter: Any = None
+             ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Newest communities first, keyset-paginated on (created_at, id)."""
+        stmt = COMMUNITY_FIELDS.select(fields, extra=COMMUNITY_SORT)
+        if workspace_id is not None:
+            stmt = stmt.where(Community.workspace_id == workspace_id)
+        if visibility_filter is not None:
+            stmt = stmt.where(visibility_filter)
+        return keyset_page(self.db_session, stmt, COMMUNITY_FIELDS, fields, COMMUNITY_SORT,
+                           limit, cursor)
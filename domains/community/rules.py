@@ -0,0 +1,10 @@
+# Community authorization rules
+from ideahub_platform.authz.sql import ResourceBinding
+from ideahub_platform.db.models.community import Community
+
+# How community rows expose the resource attributes policies read, for
+# Engine.sql_filter(subject, "COMMUNITY_READ", COMMUNITY_BINDING)
+COMMUNITY_BINDING = ResourceBinding(
+    public=Community.public.is_(True),
+    workspace_id=Community.workspace_id,
+)
@@ -1,2 +1,22 @@
-# Community service stub
-# This is a stub file for future community service implementation
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from .repository import COMMUNITY_FIELDS, CommunityRepository
+
+class CommunityService:
+    def __init__(self, repo: CommunityRepository):
+        self.repo = repo
+
+    def fields(self, fields: Optional[str]) -> List[str]:
+        """Validated field names for a `fields=` query parameter."""
+        return COMMUNITY_FIELDS.parse(fields)
+
+    def get(self, community_id: int, fields: Sequence[str],
+            visibility_filter: Any = None) -> Optional[Dict[str, Any]]:
+        return self.repo.get(community_id, fields, visibility_filter)
+
+    def exists(self, community_id: int) -> bool:
+        return self.repo.exists(community_id)
+
+    def list(self, fields: Sequence[str], workspace_id: Optional[int] = None, limit: int = 20,
+             cursor: Optional[str] = None, visibility_filter: Any = None
+             ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        return self.repo.list(fields, workspace_id, limit, cursor, visibility_filter)
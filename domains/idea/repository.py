@@ -1,2 +1,65 @@
-# Idea repository stub
-# This is a stub file for future idea repository implementation
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import exists, select
+from sqlalchemy.orm import Session
+from ideahub_platform.db.models.community import Community
+from ideahub_platform.db.models.idea import Idea
+from ideahub_platform.db.projection import Projection, keyset_page
+
+# `description` and `metadata` can be large, so they are only read when asked for
+IDEA_FIELDS = Projection(
+    {
+        "id": Idea.id,
+        "community_id": Idea.community_id,
+        "author_id": Idea.author_id,
+        "title": Idea.title,
+        "description": Idea.description,
+        "visibility": Idea.visibility,
+        "status": Idea.status,
+        "tags": Idea.tags,
+        "metadata": Idea.extra_data,
+        "created_at": Idea.created_at,
+        "updated_at": Idea.updated_at,
+    },
+    default=("id", "community_id", "author_id", "title", "visibility", "status", "tags",
+             "created_at", "updated_at"),
+)
+IDEA_SORT = ("created_at", "id")
+
+class IdeaRepository:
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+
+    def get(self, idea_id: int, fields: Sequence[str],
+            visibility_filter: Any = None) -> Optional[Dict[str, Any]]:
+        stmt = IDEA_FIELDS.select(fields).where(Idea.id == idea_id)
+        if visibility_filter is not None:
+            stmt = stmt.where(visibility_filter)
+        row = self.db_session.execute(stmt).first()
+        return IDEA_FIELDS.to_dict(row, fields) if row else None
+
+    def exists(self, idea_id: int) -> bool:
+        return self.db_session.execute(select(exists().where(Idea.id == idea_id))).scalar()
+
+    def get_many(self, idea_ids: Sequence[int], fields: Sequence[str],
+                 visibility_filter: Any = None) -> List[Dict[str, Any]]:
+        """Ideas by id in one query, in the order requested; unknown or hidden ids are skipped."""
+        stmt = IDEA_FIELDS.select(fields).where(Idea.id.in_(idea_ids))
+        if visibility_filter is not None:
+            stmt = stmt.where(visibility_filter)
+        by_id = {row.id: IDEA_FIELDS.to_dict(row, fields) for row in self.db_session.execute(stmt)}
+        return [by_id[idea_id] for idea_id in dict.fromkeys(idea_ids) if idea_id in by_id]
+
+    def list(self, fields: Sequence[str], community_id: Optional[int] = None,
+             workspace_id: Optional[int] = None, limit: int = 20, cursor: Optional[str] = None,
+             visibility_filter: Any = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Newest ideas first, keyset-paginated on (created_at, id)."""
+        stmt = IDEA_FIELDS.select(fields, extra=IDEA_SORT)
+        if community_id is not None:
+            stmt = stmt.where(Idea.community_id == community_id)
+        if workspace_id is not None:
+            stmt = stmt.join(Community, Community.id == Idea.community_id).where(
+                Community.workspace_id == workspace_id
+            )
+        if visibility_filter is not None:
+            stmt = stmt.where(visibility_filter)
+        return keyset_page(self.db_session, stmt, IDEA_FIELDS, fields, IDEA_SORT, limit, cursor)
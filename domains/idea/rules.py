@@ -1,2 +1,17 @@
-# Idea rules stub
-# This is a stub file for future idea rules implementation
+# Idea authorization rules
+from sqlalchemy import select
+from ideahub_platform.authz.sql import ResourceBinding
+from ideahub_platform.db.models.community import Community
+from ideahub_platform.db.models.idea import Idea
+
+# How idea rows expose the resource attributes policies read, for
+# Engine.sql_filter(subject, "IDEA_READ", IDEA_BINDING)
+IDEA_BINDING = ResourceBinding(
+    public=Idea.visibility == "public",
+    owner_id=Idea.author_id,
+    workspace_id=(
+        select(Community.workspace_id)
+        .where(Community.id == Idea.community_id)
+        .scalar_subquery()
+    ),
+)
@@ -1,2 +1,26 @@
-# Idea service stub
-# This is a stub file for future idea service implementation
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from .repository import IDEA_FIELDS, IdeaRepository
+
+class IdeaService:
+    def __init__(self, repo: IdeaRepository):
+        self.repo = repo
+
+    def fields(self, fields: Optional[str]) -> List[str]:
+        """Validated field names for a `fields=` query parameter."""
+        return IDEA_FIELDS.parse(fields)
+
+    def get(self, idea_id: int, fields: Sequence[str],
+            visibility_filter: Any = None) -> Optional[Dict[str, Any]]:
+        return self.repo.get(idea_id, fields, visibility_filter)
+
+    def exists(self, idea_id: int) -> bool:
+        return self.repo.exists(idea_id)
+
+    def get_many(self, idea_ids: Sequence[int], fields: Sequence[str],
+                 visibility_filter: Any = None) -> List[Dict[str, Any]]:
+        return self.repo.get_many(idea_ids, fields, visibility_filter)
+
+    def list(self, fields: Sequence[str], community_id: Optional[int] = None,
+             workspace_id: Optional[int] = None, limit: int = 20, cursor: Optional[str] = None,
+             visibility_filter: Any = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        return self.repo.list(fields, community_id, workspace_id, limit, cursor, visibility_filter)
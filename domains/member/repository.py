@@ -1,2 +1,20 @@
-# Member repository stub
-# This is a stub file for future member repository implementation
+from typing import Callable, List, Optional, Tuple
+from sqlalchemy import select
+from ideahub_platform.db.models.member import workspace_members
+
+class MemberRepository:
+    def __init__(self, session_factory: Optional[Callable] = None):
+        if session_factory is None:
+            from ideahub_platform.db.base import db_manager
+            session_factory = db_manager.get_db_session
+        self.session_factory = session_factory
+
+    def get_memberships(self, member_id: int) -> List[Tuple[int, str]]:
+        """(workspace_id, role) pairs for a member, ordered by workspace_id."""
+        stmt = (
+            select(workspace_members.c.workspace_id, workspace_members.c.role)
+            .where(workspace_members.c.member_id == member_id)
+            .order_by(workspace_members.c.workspace_id)
+        )
+        with self.session_factory() as session:
+            return [(row[0], row[1]) for row in session.execute(stmt)]
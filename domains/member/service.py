@@ -1,2 +1,126 @@
-# Member service stub
-# This is a stub file for future member service implementation
+import os
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Iterator, Optional, Tuple
+from ideahub_platform.common.cache import TTLCache
+from ideahub_platform.common.logging import get_logger
+from ideahub_platform.events.bus import Event, EventBus
+from ideahub_platform.events.event_types import EventType, payload_dict
+from .repository import MemberRepository
+
+logger = get_logger(__name__)
+
+MEMBERSHIP_INDEX_ENABLED = os.getenv("MEMBERSHIP_INDEX_ENABLED", "true").lower() == "true"
+MEMBERSHIP_CACHE_TTL = float(os.getenv("MEMBERSHIP_CACHE_TTL", "300"))
+MEMBERSHIP_CACHE_SIZE = int(os.getenv("MEMBERSHIP_CACHE_SIZE", "50000"))
+
+MEMBERSHIP_EVENTS = (EventType.MEMBER_JOINED, EventType.MEMBER_LEFT, EventType.MEMBER_ROLE_CHANGED)
+
+class MembershipSet:
+    """A member's workspaces as a sorted int array with roles stored alongside.
+
+    Supports `workspace_id in memberships` in O(log n), which is what
+    `predicates.is_workspace_member` relies on.
+    """
+    __slots__ = ("_workspace_ids", "_roles")
+
+    def __init__(self, memberships: Iterable[Tuple[int, str]] = ()):
+        pairs = sorted(memberships)
+        self._workspace_ids = array("q", (workspace_id for workspace_id, _ in pairs))
+        self._roles = tuple(role for _, role in pairs)
+
+    def _index(self, workspace_id) -> int:
+        try:
+            i = bisect_left(self._workspace_ids, workspace_id)
+        except TypeError:
+            return -1
+        if i < len(self._workspace_ids) and self._workspace_ids[i] == workspace_id:
+            return i
+        return -1
+
+    def __contains__(self, workspace_id) -> bool:
+        return self._index(workspace_id) >= 0
+
+    def role_in(self, workspace_id: int) -> Optional[str]:
+        """The member's role in a workspace, or None if not a member."""
+        i = self._index(workspace_id)
+        return self._roles[i] if i >= 0 else None
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._workspace_ids)
+
+    def __len__(self) -> int:
+        return len(self._workspace_ids)
+
+    def fingerprint(self) -> Tuple:
+        """Hashable identity, used by the authz decision cache."""
+        return (self._workspace_ids.tobytes(), self._roles)
+
+    def __repr__(self) -> str:
+        return f"MembershipSet({list(zip(self._workspace_ids, self._roles))})"
+
+class MembershipService:
+    """Serves workspace memberships from memory, loading each member once.
+
+    Entries are invalidated by MEMBER_JOINED / MEMBER_LEFT / MEMBER_ROLE_CHANGED
+    events (their data must carry `member_id`), with the TTL as a backstop.
+    """
+
+    def __init__(self, repo: MemberRepository, ttl: float = MEMBERSHIP_CACHE_TTL,
+                 maxsize: int = MEMBERSHIP_CACHE_SIZE):
+        self.repo = repo
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def memberships_for(self, member_id: int) -> MembershipSet:
+        memberships = self._cache.get(member_id)
+        if memberships is None:
+            memberships = MembershipSet(self.repo.get_memberships(member_id))
+            self._cache.set(member_id, memberships)
+        return memberships
+
+    def is_member(self, member_id: int, workspace_id: int) -> bool:
+        return workspace_id in self.memberships_for(member_id)
+
+    def invalidate(self, member_id: Optional[int] = None) -> None:
+        if member_id is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(member_id)
+
+    def handle_membership_event(self, event: Event) -> None:
+        data = payload_dict(event.data)
+        member_id = data.get("member_id")
+        if member_id is None:
+            logger.warning(f"Membership event without member_id: {event.event_type.value}")
+            self.invalidate()
+        else:
+            self.invalidate(member_id)
+
+    def subscribe(self, bus: EventBus) -> None:
+        """Invalidate cached memberships when membership events are published."""
+        for event_type in MEMBERSHIP_EVENTS:
+            bus.subscribe(event_type, self.handle_membership_event)
+
+
+# Global service, opened by the gateway lifespan when MEMBERSHIP_INDEX_ENABLED=true
+membership_service: Optional[MembershipService] = None
+
+def open_membership_service(bus: EventBus) -> MembershipService:
+    """Create the global membership service and subscribe it to membership events."""
+    global membership_service
+    membership_service = MembershipService(MemberRepository())
+    membership_service.subscribe(bus)
+    return membership_service
+
+def close_membership_service() -> None:
+    global membership_service
+    membership_service = None
+
+def attach_memberships(subject, service: Optional[MembershipService] = None):
+    """Set `subject.workspace_memberships` for authenticated subjects; returns the subject."""
+    service = service or membership_service
+    if service is not None and getattr(subject, "is_authenticated", False):
+        subject_id = getattr(subject, "id", None)
+        if subject_id is not None:
+            subject.workspace_memberships = service.memberships_for(subject_id)
+    return subject
@@ -0,0 +1,165 @@
+# Sampled, asynchronous authorization decision audit stream
+import os
+import queue
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from ideahub_platform.common.logging import get_logger
+from ideahub_platform.common.metrics import AUTHZ_AUDIT_RECORDS
+
+logger = get_logger(__name__)
+
+# Audit configuration
+AUTHZ_AUDIT_ALLOW_SAMPLE_RATE = float(os.getenv("AUTHZ_AUDIT_ALLOW_SAMPLE_RATE", "0.01"))
+AUTHZ_AUDIT_DENY_SAMPLE_RATE = float(os.getenv("AUTHZ_AUDIT_DENY_SAMPLE_RATE", "1.0"))
+AUTHZ_AUDIT_BUFFER_SIZE = int(os.getenv("AUTHZ_AUDIT_BUFFER_SIZE", "1000"))
+AUTHZ_AUDIT_QUEUE_SIZE = int(os.getenv("AUTHZ_AUDIT_QUEUE_SIZE", "10000"))
+
+
+@dataclass(frozen=True)
+class DecisionRecord:
+    """One sampled authorization decision."""
+    timestamp: float
+    action: str
+    allow: bool
+    reason: str
+    subject_id: Any = None
+    resource_id: Any = None
+    request_id: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _resource_id(resource: Any) -> Any:
+    if isinstance(resource, dict):
+        return resource.get("id")
+    return getattr(resource, "id", None)
+
+
+class DecisionAuditor:
+    """Samples decisions into a ring buffer and logs them from a background thread.
+
+    `record` is the only hot-path call: a random draw, and for sampled
+    decisions a deque append and a non-blocking queue put. Formatting and log
+    I/O happen on the writer thread; if it falls behind, records are dropped
+    (and counted) rather than slowing requests down.
+    """
+
+    def __init__(self, allow_sample_rate: float = AUTHZ_AUDIT_ALLOW_SAMPLE_RATE,
+                 deny_sample_rate: float = AUTHZ_AUDIT_DENY_SAMPLE_RATE,
+                 capacity: int = AUTHZ_AUDIT_BUFFER_SIZE,
+                 queue_size: int = AUTHZ_AUDIT_QUEUE_SIZE,
+                 sampler: Callable[[], float] = random.random):
+        self.allow_sample_rate = allow_sample_rate
+        self.deny_sample_rate = deny_sample_rate
+        self.sampler = sampler
+        self._recent: deque = deque(maxlen=capacity)
+        self._queue: "queue.Queue[Optional[DecisionRecord]]" = queue.Queue(maxsize=queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _sampled(self, allow: bool) -> bool:
+        rate = self.allow_sample_rate if allow else self.deny_sample_rate
+        return rate > 0 and (rate >= 1 or self.sampler() < rate)
+
+    def record(self, req, decision) -> None:
+        """Sample a decision into the audit stream."""
+        if not self._sampled(decision.allow):
+            return
+        ctx = req.ctx or {}
+        self._append(DecisionRecord(
+            timestamp=time.time(),
+            action=req.action,
+            allow=decision.allow,
+            reason=decision.reason,
+            subject_id=getattr(req.subject, "id", None),
+            resource_id=_resource_id(req.resource),
+            request_id=ctx.get("request_id"),
+        ))
+
+    def record_batch(self, subject, action: str, resources: Sequence[Any], batch,
+                     ctx: Optional[Dict[str, Any]] = None) -> None:
+        """Sample the per-item decisions of `Engine.decide_many` into the audit stream."""
+        ctx = ctx or {}
+        now = time.time()
+        subject_id = getattr(subject, "id", None)
+        request_id = ctx.get("request_id")
+        for resource, allowed, reason in zip(resources, batch.allow, batch.reasons):
+            allowed = bool(allowed)
+            if self._sampled(allowed):
+                self._append(DecisionRecord(
+                    timestamp=now,
+                    action=action,
+                    allow=allowed,
+                    reason=reason,
+                    subject_id=subject_id,
+                    resource_id=_resource_id(resource),
+                    request_id=request_id,
+                ))
+
+    def _append(self, entry: DecisionRecord) -> None:
+        self._recent.append(entry)
+        if self._thread is None:
+            self.start()
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            AUTHZ_AUDIT_RECORDS.labels("dropped").inc()
+
+    def recent(self, limit: Optional[int] = None, allow: Optional[bool] = None
+               ) -> List[DecisionRecord]:
+        """Sampled decisions, newest first, optionally only allows or denies."""
+        items = list(self._recent)
+        items.reverse()
+        if allow is not None:
+            items = [r for r in items if r.allow == allow]
+        return items[:limit] if limit else items
+
+    def start(self) -> None:
+        """Start the background writer (called lazily on the first sampled record)."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="authz-audit-writer", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Flush queued records and stop the writer."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            entry = self._queue.get()
+            if entry is None:
+                return
+            try:
+                self._write(entry)
+            except Exception as e:
+                logger.error(f"Authorization audit write failed: {e}")
+
+    def _write(self, entry: DecisionRecord) -> None:
+        AUTHZ_AUDIT_RECORDS.labels("written").inc()
+        fields = entry.to_dict()
+        if entry.allow:
+            logger.info(f"Access granted: {entry.reason} for {entry.action}", extra_fields=fields)
+        else:
+            logger.warning(f"Access denied: {entry.reason} for {entry.action}", extra_fields=fields)
+
+
+# Global auditor used by the registry engine
+decision_auditor = DecisionAuditor()
+
+
+def get_decision_auditor() -> DecisionAuditor:
+    """Get the global authorization decision auditor."""
+    return decision_auditor
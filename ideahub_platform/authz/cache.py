@@ -0,0 +1,93 @@
+# Bounded, versioned cache of authorization decisions
+import os
+from typing import Any, Hashable, Optional, Tuple
+from ideahub_platform.common.cache import TTLCache
+from ideahub_platform.common.metrics import AUTHZ_DECISION_CACHE
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Decision cache configuration
+AUTHZ_DECISION_CACHE_ENABLED = os.getenv("AUTHZ_DECISION_CACHE_ENABLED", "false").lower() == "true"
+AUTHZ_DECISION_CACHE_TTL = float(os.getenv("AUTHZ_DECISION_CACHE_TTL", "5"))
+AUTHZ_DECISION_CACHE_SIZE = int(os.getenv("AUTHZ_DECISION_CACHE_SIZE", "10000"))
+
+# Resource attributes read by the built-in predicates
+RESOURCE_ATTRIBUTES = ("id", "owner_id", "public", "workspace_id")
+
+_MISSING = object()
+
+
+def _freeze(value: Any) -> Hashable:
+    """Turn roles/membership collections and plain values into hashable keys."""
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return frozenset(value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    fingerprint = getattr(value, "fingerprint", None)
+    if callable(fingerprint):
+        return fingerprint()
+    hash(value)
+    return value
+
+
+def subject_fingerprint(subject: Any) -> Hashable:
+    """Identity plus everything the predicates read from the subject."""
+    if subject is None:
+        return None
+    return (
+        getattr(subject, "id", None),
+        bool(getattr(subject, "is_authenticated", False)),
+        bool(getattr(subject, "is_admin", False)),
+        _freeze(getattr(subject, "roles", ())),
+        _freeze(getattr(subject, "workspace_memberships", ())),
+    )
+
+
+def resource_fingerprint(resource: Any) -> Hashable:
+    """Relevant resource attributes (dict resources are keyed by their items)."""
+    if resource is None:
+        return None
+    if isinstance(resource, dict):
+        return _freeze(resource)
+    return tuple(getattr(resource, attr, None) for attr in RESOURCE_ATTRIBUTES)
+
+
+class DecisionCache:
+    """Caches `Engine.decide` results for a short TTL.
+
+    Keys combine the subject fingerprint, action, resource attributes and the
+    engine's policy version, so reloading policies invalidates every entry.
+    Only use it with predicates that depend on nothing but those inputs
+    (not `ctx`).
+    """
+
+    def __init__(self, ttl: float = AUTHZ_DECISION_CACHE_TTL,
+                 maxsize: int = AUTHZ_DECISION_CACHE_SIZE):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def key(self, req, version: int) -> Optional[Tuple]:
+        """Cache key for a request, or None if it cannot be fingerprinted."""
+        try:
+            return (version, req.action, subject_fingerprint(req.subject),
+                    resource_fingerprint(req.resource))
+        except TypeError:
+            return None
+
+    def get(self, key: Tuple):
+        decision = self._cache.get(key, _MISSING)
+        if decision is _MISSING:
+            AUTHZ_DECISION_CACHE.labels("miss").inc()
+            return None
+        AUTHZ_DECISION_CACHE.labels("hit").inc()
+        return decision
+
+    def put(self, key: Tuple, decision) -> None:
+        self._cache.set(key, decision)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        """Size and hit rate of this process's cache."""
+        return self._cache.stats()
@@ -1,6 +1,10 @@
 # Authorization DSL for policy definition
-from typing import Any, Dict, List, Callable
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Callable, Optional
 from .engine import Request, Policy
+from .predicates import (
+    RESOURCE, is_public_resource, is_resource_owner, is_workspace_member
+)
 import logging
 
 logger = logging.getLogger(__name__)
@@ -65,23 +69,123 @@ def admin() -> Callable[[Request], bool]:
 
 def has_role(role: str) -> Callable[[Request], bool]:
     """Check if user has specific role."""
-    from .predicates import has_role as has_role_predicate
-    return lambda req: has_role_predicate(req, role)
+    from .predicates import SUBJECT, has_role as has_role_predicate, scoped
+    return scoped(SUBJECT)(lambda req: has_role_predicate(req, role))
 
-def action_is(action: str) -> Callable[[Request], bool]:
-    """Check if request action matches."""
-    from .predicates import action_matches
-    return lambda req: action_matches(req, action)
+def action_is(*actions: str) -> Callable[[Request], bool]:
+    """Check if request action matches (indexed by the engine, not evaluated)."""
+    from .predicates import ActionMatcher
+    return ActionMatcher(*actions)
 
 def resource_owner() -> Callable[[Request], bool]:
     """Check if user owns the resource."""
-    from .predicates import is_resource_owner
-    return is_resource_owner
+    return ResourceOwner()
 
 def public_resource() -> Callable[[Request], bool]:
     """Check if resource is public."""
-    from .predicates import is_public_resource
-    return is_public_resource
+    return PublicResource()
+
+def workspace_member() -> Callable[[Request], bool]:
+    """Check if user is a member of the resource's workspace."""
+    return WorkspaceMember()
+
+# Declarative resource conditions
+#
+# Each condition is a normal predicate at runtime and can also be rendered as a
+# SQL expression against a `ResourceBinding` (see authz/sql.py), so list
+# queries only fetch rows the subject may see.
+
+class Condition(ABC):
+    """Declarative resource predicate, evaluable in Python or compilable to SQL."""
+    scope = RESOURCE
+
+    @abstractmethod
+    def __call__(self, req: Request) -> bool:
+        """Evaluate against a request at runtime."""
+
+    @abstractmethod
+    def to_sql(self, subject: Any, binding: Any):
+        """Render as a boolean SQLAlchemy expression over the binding's columns."""
+
+    @staticmethod
+    def _column(binding: Any, name: str):
+        column = getattr(binding, name, None)
+        if column is None:
+            from ideahub_platform.common.errors import PolicyCompilationError
+            raise PolicyCompilationError(
+                f"Resource binding has no '{name}' column",
+                error_code="POLICY_COMPILATION_FAILED",
+                details={"attribute": name},
+            )
+        return column
+
+class PublicResource(Condition):
+    """Resource is public (`resource.public`; e.g. `Idea.visibility == 'public'`)."""
+
+    def __init__(self):
+        self.batch = is_public_resource.batch
+
+    def __call__(self, req: Request) -> bool:
+        return is_public_resource(req)
+
+    def to_sql(self, subject: Any, binding: Any):
+        return self._column(binding, "public")
+
+class ResourceOwner(Condition):
+    """Subject owns the resource (`resource.owner_id`; e.g. `Idea.author_id`)."""
+
+    def __init__(self):
+        self.batch = is_resource_owner.batch
+
+    def __call__(self, req: Request) -> bool:
+        return is_resource_owner(req)
+
+    def to_sql(self, subject: Any, binding: Any):
+        from sqlalchemy import false
+        subject_id = getattr(subject, "id", None)
+        if subject_id is None:
+            return false()
+        return self._column(binding, "owner_id") == subject_id
+
+class WorkspaceMember(Condition):
+    """Subject is a member of the resource's workspace (`resource.workspace_id`)."""
+
+    def __call__(self, req: Request) -> bool:
+        return is_workspace_member(req, getattr(req.resource, "workspace_id", None))
+
+    def to_sql(self, subject: Any, binding: Any):
+        from sqlalchemy import exists, false, select
+        column = self._column(binding, "workspace_id")
+        memberships = getattr(subject, "workspace_memberships", None)
+        if memberships is not None:
+            workspace_ids = list(memberships)
+            return column.in_(workspace_ids) if workspace_ids else false()
+        subject_id = getattr(subject, "id", None)
+        if subject_id is None:
+            return false()
+        # No membership list on the subject: let the database check the association table
+        from ideahub_platform.db.models.member import workspace_members
+        return exists(
+            select(workspace_members.c.workspace_id).where(
+                workspace_members.c.member_id == subject_id,
+                workspace_members.c.workspace_id == column,
+            )
+        )
+
+# Plain predicate functions with a declarative equivalent
+DECLARATIVE_EQUIVALENTS: Dict[Callable, Condition] = {
+    is_public_resource: PublicResource(),
+    is_resource_owner: ResourceOwner(),
+}
+
+def as_condition(predicate: Callable) -> Optional[Condition]:
+    """Get the declarative form of a predicate, or None if it is opaque."""
+    if isinstance(predicate, Condition):
+        return predicate
+    try:
+        return DECLARATIVE_EQUIVALENTS.get(predicate)
+    except TypeError:
+        return None
 
 # Example usage:
 # workspace_read_policy = (
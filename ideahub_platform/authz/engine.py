@@ -1,6 +1,12 @@
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
 import logging
+import time
+from .predicates import SUBJECT, ActionMatcher
+from .audit import DecisionAuditor
+from .cache import DecisionCache
+from ideahub_platform.common.metrics import AUTHZ_DECISION_DURATION
+from ideahub_platform.common.profiling import add_phase_time
 
 logger = logging.getLogger(__name__)
 
@@ -10,6 +16,19 @@ class Decision:
     reason: str = "ok"
     details: Optional[Dict[str, Any]] = None
 
+@dataclass
+class BatchDecision:
+    """Per-item outcome of `Engine.decide_many`: a 0/1 allow mask plus reasons."""
+    allow: bytearray
+    reasons: List[str]
+
+    def __len__(self) -> int:
+        return len(self.allow)
+
+    def filter(self, items: Sequence[Any]) -> List[Any]:
+        """Keep the items that were allowed."""
+        return [item for item, allowed in zip(items, self.allow) if allowed]
+
 Predicate = Callable[["Request"], bool]
 
 @dataclass
@@ -38,28 +57,222 @@ class Policy:
             logger.error(f"Policy evaluation error: {e}", exc_info=True)
         return None
 
+class CompiledPolicy:
+    """A policy with its action constraint lifted into the engine's dispatch table.
+
+    `predicates` holds only the conditions left to evaluate once the action is
+    known to match. Policies whose `eval` is overridden are kept opaque and
+    evaluated as-is.
+    """
+    __slots__ = ("policy", "predicates", "actions", "opaque")
+
+    def __init__(self, policy: Policy):
+        self.policy = policy
+        self.opaque = type(policy).eval is not Policy.eval
+        self.actions: Optional[FrozenSet[str]] = None
+        self.predicates: List[Predicate] = list(policy.when)
+        if self.opaque:
+            return
+        residual = []
+        for predicate in policy.when:
+            if isinstance(predicate, ActionMatcher):
+                # Several action constraints on one policy must all hold
+                self.actions = (predicate.actions if self.actions is None
+                                else self.actions & predicate.actions)
+            else:
+                residual.append(predicate)
+        self.predicates = residual
+
+    def eval(self, req: Request) -> Optional[Decision]:
+        """Evaluate the residual predicates; the caller guarantees the action matches."""
+        if self.opaque:
+            return self.policy.eval(req)
+        try:
+            for predicate in self.predicates:
+                if not predicate(req):
+                    return None
+        except Exception as e:
+            logger.error(f"Policy evaluation error: {e}", exc_info=True)
+            return None
+        policy = self.policy
+        return Decision(
+            allow=(policy.effect == "allow"),
+            reason=policy.reason,
+            details={"policy_priority": policy.priority}
+        )
+
 class Engine:
-    def __init__(self, policies: List[Policy]):
-        self.policies = sorted(policies, key=lambda p: p.priority, reverse=True)
+    def __init__(self, policies: List[Policy], cache: Optional[DecisionCache] = None,
+                 auditor: Optional[DecisionAuditor] = None):
+        self.version = 0
+        self.cache = cache
+        self.auditor = auditor
+        self.load(policies)
+
+    def load(self, policies: List[Policy]) -> None:
+        """Replace the policy set and recompile the action dispatch table.
+
+        Policies constrained by an `ActionMatcher` are indexed under each of
+        their actions; all others go to the "any action" list. Every candidate
+        list keeps the global priority order, so decisions are identical to
+        evaluating all policies in turn.
+        """
+        ordered = sorted(policies, key=lambda p: p.priority, reverse=True)
+        indexed: Dict[str, List[Tuple[int, CompiledPolicy]]] = {}
+        any_action: List[Tuple[int, CompiledPolicy]] = []
+        for position, policy in enumerate(ordered):
+            compiled = CompiledPolicy(policy)
+            if compiled.actions is None:
+                any_action.append((position, compiled))
+            else:
+                # An empty action set can never match and is dropped
+                for action in compiled.actions:
+                    indexed.setdefault(action, []).append((position, compiled))
+
+        self.policies = ordered
+        self._any_action: List[CompiledPolicy] = [c for _, c in any_action]
+        self._dispatch: Dict[str, List[CompiledPolicy]] = {
+            action: [c for _, c in sorted(entries + any_action, key=lambda e: e[0])]
+            for action, entries in indexed.items()
+        }
+        self.version += 1
+        if self.cache is not None:
+            # Keys embed the version; clearing just frees the stale entries early
+            self.cache.clear()
+
+    def candidates(self, action: str) -> List[CompiledPolicy]:
+        """Policies that can apply to `action`, in priority order."""
+        return self._dispatch.get(action, self._any_action)
 
     def decide(self, req: Request) -> Decision:
+        started = time.perf_counter()
+        try:
+            cache = self.cache
+            key = cache.key(req, self.version) if cache is not None else None
+            decision = cache.get(key) if key is not None else None
+            if decision is None:
+                decision = self._decide(req)
+                if key is not None:
+                    cache.put(key, decision)
+            if self.auditor is not None:
+                self.auditor.record(req, decision)
+            return decision
+        finally:
+            elapsed = time.perf_counter() - started
+            AUTHZ_DECISION_DURATION.labels(req.action).observe(elapsed)
+            add_phase_time("authz", elapsed)
+
+    def _decide(self, req: Request) -> Decision:
         last: Optional[Decision] = None
         
-        for p in self.policies:
+        for p in self.candidates(req.action):
             try:
                 d = p.eval(req)
                 if d is not None:
                     if d.allow:
-                        logger.info(f"Access granted: {d.reason} for {req.action}")
                         return d
                     last = d
             except Exception as e:
                 logger.error(f"Policy evaluation error: {e}", exc_info=True)
                 continue
-                
-        if last:
-            logger.warning(f"Access denied: {last.reason} for {req.action}")
-        else:
-            logger.warning(f"No policy matched for {req.action}")
-            
+        
+        # Grants and denials are reported through the sampled audit stream (authz/audit.py)
         return last or Decision(False, "no_policy_matched")
+
+    def sql_filter(self, subject: Any, action: str, binding: Any,
+                   ctx: Optional[Dict[str, Any]] = None):
+        """SQLAlchemy WHERE clause selecting the rows `subject` may `action` (see authz/sql.py)."""
+        from .sql import compile_filter
+        return compile_filter(self, subject, action, binding, ctx)
+
+    def decide_many(self, subject: Any, action: str, resources: Sequence[Any],
+                    ctx: Optional[Dict[str, Any]] = None) -> BatchDecision:
+        """Decide `action` for one subject over many resources (e.g. a listing page).
+
+        Produces the same per-item result as calling `decide` per resource, but
+        subject-scoped predicates run once per batch and resource-scoped ones
+        run column-wise (through their `batch` form when available) only over
+        items still undecided.
+        """
+        started = time.perf_counter()
+        ctx = ctx if ctx is not None else {}
+        count = len(resources)
+        allow = bytearray(count)
+        reasons = ["no_policy_matched"] * count
+        pending = list(range(count))
+        item_requests: Dict[int, Request] = {}
+        subject_request = Request(subject=subject, action=action, resource=None, ctx=ctx)
+        subject_results: Dict[Any, bool] = {}
+
+        def item_request(i: int) -> Request:
+            req = item_requests.get(i)
+            if req is None:
+                req = item_requests[i] = Request(subject, action, resources[i], ctx)
+            return req
+
+        def check(predicate: Predicate, req: Request) -> bool:
+            try:
+                return bool(predicate(req))
+            except Exception as e:
+                logger.error(f"Policy evaluation error: {e}", exc_info=True)
+                return False
+
+        try:
+            for compiled in self.candidates(action):
+                if not pending:
+                    break
+                if compiled.opaque:
+                    for i in pending:
+                        d = compiled.eval(item_request(i))
+                        if d is not None:
+                            reasons[i] = d.reason
+                            allow[i] = 1 if d.allow else 0
+                    pending = [i for i in pending if not allow[i]]
+                    continue
+                else:
+                    per_item = []
+                    applies = True
+                    for predicate in compiled.predicates:
+                        if getattr(predicate, "scope", None) == SUBJECT:
+                            if predicate not in subject_results:
+                                subject_results[predicate] = check(predicate, subject_request)
+                            if not subject_results[predicate]:
+                                applies = False
+                                break
+                        else:
+                            per_item.append(predicate)
+                    if not applies:
+                        continue
+                    matched = pending
+                    for predicate in per_item:
+                        batch = getattr(predicate, "batch", None)
+                        if batch is not None:
+                            try:
+                                flags = batch(subject, [resources[i] for i in matched])
+                            except Exception as e:
+                                logger.error(f"Policy evaluation error: {e}", exc_info=True)
+                                flags = [False] * len(matched)
+                            matched = [i for i, ok in zip(matched, flags) if ok]
+                        else:
+                            matched = [i for i in matched if check(predicate, item_request(i))]
+                        if not matched:
+                            break
+                if not matched:
+                    continue
+
+                reason = compiled.policy.reason
+                for i in matched:
+                    reasons[i] = reason
+                if compiled.policy.effect == "allow":
+                    for i in matched:
+                        allow[i] = 1
+                    pending = [i for i in pending if not allow[i]]
+        finally:
+            AUTHZ_DECISION_DURATION.labels(action).observe(time.perf_counter() - started)
+            add_phase_time("authz", time.perf_counter() - started)
+
+        logger.debug(f"Batch decision for {action}: {sum(allow)} of {count} allowed")
+        decision = BatchDecision(allow=allow, reasons=reasons)
+        if self.auditor is not None:
+            self.auditor.record_batch(subject, action, resources, decision, ctx)
+        return decision
@@ -1,9 +1,25 @@
 # Production-ready authorization predicates
 import logging
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Sequence
 
 logger = logging.getLogger(__name__)
 
+# Predicate scopes: what a predicate reads. The engine evaluates subject-scoped
+# predicates once per batch and resource-scoped ones per item.
+SUBJECT = "subject"
+RESOURCE = "resource"
+ACTION = "action"
+
+def scoped(scope: str, batch: Callable[[Any, Sequence[Any]], List[bool]] = None):
+    """Mark a predicate with its scope and optional vectorized batch form."""
+    def mark(predicate):
+        predicate.scope = scope
+        if batch is not None:
+            predicate.batch = batch
+        return predicate
+    return mark
+
+@scoped(SUBJECT)
 def is_authenticated(req) -> bool:
     """Check if the subject is authenticated."""
     try:
@@ -12,6 +28,7 @@ def is_authenticated(req) -> bool:
         logger.error(f"Authentication check failed: {e}")
         return False
 
+@scoped(SUBJECT)
 def is_admin(req) -> bool:
     """Check if the subject has admin privileges."""
     try:
@@ -38,16 +55,30 @@ def is_workspace_member(req, workspace_id: int) -> bool:
         logger.error(f"Workspace membership check failed: {e}")
         return False
 
+def _owners_batch(subject, resources: Sequence[Any]) -> List[bool]:
+    subject_id = getattr(subject, "id", None)
+    if subject_id is None:
+        return [False] * len(resources)
+    return [getattr(resource, "owner_id", None) == subject_id for resource in resources]
+
+@scoped(RESOURCE, batch=_owners_batch)
 def is_resource_owner(req) -> bool:
     """Check if the subject owns the resource."""
     try:
         subject_id = getattr(req.subject, "id", None)
+        if subject_id is None:
+            # Anonymous subjects own nothing, matching ResourceOwner.to_sql
+            return False
         resource_owner_id = getattr(req.resource, "owner_id", None)
         return subject_id == resource_owner_id
     except Exception as e:
         logger.error(f"Resource ownership check failed: {e}")
         return False
 
+def _public_batch(subject, resources: Sequence[Any]) -> List[bool]:
+    return [bool(getattr(resource, "public", False)) for resource in resources]
+
+@scoped(RESOURCE, batch=_public_batch)
 def is_public_resource(req) -> bool:
     """Check if the resource is public."""
     try:
@@ -63,3 +94,25 @@ def action_matches(req, action: str) -> bool:
     except Exception as e:
         logger.error(f"Action match check failed: {e}")
         return False
+
+class ActionMatcher:
+    """Predicate matching a fixed set of actions.
+
+    Unlike an opaque `lambda r: action_matches(r, ...)`, the engine can read
+    `actions` and index the policy by action instead of evaluating it.
+    """
+    __slots__ = ("actions",)
+    scope = ACTION
+
+    def __init__(self, *actions: str):
+        self.actions = frozenset(actions)
+
+    def __call__(self, req) -> bool:
+        try:
+            return req.action in self.actions
+        except Exception as e:
+            logger.error(f"Action match check failed: {e}")
+            return False
+
+    def __repr__(self) -> str:
+        return f"ActionMatcher({', '.join(sorted(self.actions))})"
@@ -1,7 +1,10 @@
+from .audit import decision_auditor
+from .cache import AUTHZ_DECISION_CACHE_ENABLED, DecisionCache
 from .engine import Engine, Policy
+from .dsl import action_is
 from .predicates import (
     is_authenticated, is_admin, has_role, is_workspace_member,
-    is_resource_owner, is_public_resource, action_matches
+    is_resource_owner, is_public_resource
 )
 import logging
 
@@ -20,13 +23,13 @@ policies = [
     # Workspace policies
     Policy(
         "allow", 
-        [is_authenticated, lambda r: action_matches(r, "WORKSPACE_READ")], 
+        [is_authenticated, action_is("WORKSPACE_READ")], 
         reason="workspace_read_authenticated", 
         priority=50
     ),
     Policy(
         "allow", 
-        [is_authenticated, lambda r: action_matches(r, "WORKSPACE_WRITE")], 
+        [is_authenticated, action_is("WORKSPACE_WRITE")], 
         reason="workspace_write_authenticated", 
         priority=50
     ),
@@ -34,13 +37,13 @@ policies = [
     # Community policies
     Policy(
         "allow", 
-        [is_authenticated, lambda r: action_matches(r, "COMMUNITY_READ")], 
+        [is_authenticated, action_is("COMMUNITY_READ")], 
         reason="community_read_authenticated", 
         priority=40
     ),
     Policy(
         "allow", 
-        [is_public_resource, lambda r: action_matches(r, "COMMUNITY_READ")], 
+        [is_public_resource, action_is("COMMUNITY_READ")], 
         reason="community_read_public", 
         priority=35
     ),
@@ -48,19 +51,19 @@ policies = [
     # Idea policies
     Policy(
         "allow", 
-        [is_authenticated, lambda r: action_matches(r, "IDEA_READ")], 
+        [is_authenticated, action_is("IDEA_READ")], 
         reason="idea_read_authenticated", 
         priority=30
     ),
     Policy(
         "allow", 
-        [is_public_resource, lambda r: action_matches(r, "IDEA_READ")], 
+        [is_public_resource, action_is("IDEA_READ")], 
         reason="idea_read_public", 
         priority=25
     ),
     Policy(
         "allow", 
-        [is_authenticated, is_resource_owner, lambda r: action_matches(r, "IDEA_WRITE")], 
+        [is_authenticated, is_resource_owner, action_is("IDEA_WRITE")], 
         reason="idea_write_owner", 
         priority=30
     ),
@@ -68,7 +71,7 @@ policies = [
     # Search policies
     Policy(
         "allow", 
-        [is_authenticated, lambda r: action_matches(r, "SEARCH")], 
+        [is_authenticated, action_is("SEARCH")], 
         reason="search_authenticated", 
         priority=20
     ),
@@ -76,21 +79,29 @@ policies = [
     # Deny policies (lowest priority)
     Policy(
         "deny", 
-        [lambda r: action_matches(r, action) for action in ["WORKSPACE_READ", "COMMUNITY_READ", "IDEA_READ", "SEARCH"]], 
+        [action_is(action) for action in ["WORKSPACE_READ", "COMMUNITY_READ", "IDEA_READ", "SEARCH"]], 
         reason="access_denied_unauthenticated", 
         priority=10
     ),
 ]
 
-authz_engine = Engine(policies)
+authz_engine = Engine(
+    policies,
+    cache=DecisionCache() if AUTHZ_DECISION_CACHE_ENABLED else None,
+    auditor=decision_auditor,
+)
 
 def get_engine() -> Engine:
     """Get the authorization engine instance."""
     return authz_engine
 
 def reload_policies(new_policies: list) -> None:
-    """Reload policies (useful for dynamic policy updates)."""
-    global authz_engine, policies
+    """Reload policies (useful for dynamic policy updates).
+
+    The engine is recompiled in place so modules holding a reference from
+    get_engine() see the new policies.
+    """
+    global policies
     policies = new_policies
-    authz_engine = Engine(policies)
-    logger.info("Authorization policies reloaded")
+    authz_engine.load(policies)
+    logger.info(f"Authorization policies reloaded (version {authz_engine.version})")
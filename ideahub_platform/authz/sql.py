@@ -0,0 +1,75 @@
+# Compile authorization policies into SQL WHERE filters for row-level list queries
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from sqlalchemy import and_, false, or_, true
+from sqlalchemy.sql.elements import ColumnElement
+from ideahub_platform.common.errors import PolicyCompilationError
+from .dsl import as_condition
+from .engine import Engine, Request
+from .predicates import SUBJECT
+import logging
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class ResourceBinding:
+    """Maps the resource attributes read by policies onto a queried entity.
+
+    `public` is a boolean expression; `owner_id` and `workspace_id` are column
+    (or scalar subquery) expressions.
+    """
+    public: Optional[ColumnElement] = None
+    owner_id: Optional[ColumnElement] = None
+    workspace_id: Optional[ColumnElement] = None
+
+def compile_filter(engine: Engine, subject: Any, action: str, binding: ResourceBinding,
+                   ctx: Optional[Dict[str, Any]] = None) -> ColumnElement:
+    """Build a WHERE clause selecting exactly the rows `engine.decide` would allow.
+
+    A row is allowed iff some allow policy matches it; deny policies never
+    override an allow in this engine, so they do not contribute. Subject-scoped
+    predicates are evaluated here and fold to constants; resource predicates
+    must have a declarative form, otherwise PolicyCompilationError is raised.
+    """
+    probe = Request(subject=subject, action=action, resource=None, ctx=ctx or {})
+    clauses = []
+    for compiled in engine.candidates(action):
+        policy = compiled.policy
+        if policy.effect != "allow":
+            continue
+        if compiled.opaque:
+            raise _uncompilable(policy, "custom Policy.eval")
+
+        parts = []
+        applies = True
+        for predicate in compiled.predicates:
+            if getattr(predicate, "scope", None) == SUBJECT:
+                try:
+                    applies = bool(predicate(probe))
+                except Exception as e:
+                    logger.error(f"Policy evaluation error: {e}", exc_info=True)
+                    applies = False
+                if not applies:
+                    break
+                continue
+            condition = as_condition(predicate)
+            if condition is None:
+                raise _uncompilable(policy, repr(predicate))
+            parts.append(condition.to_sql(subject, binding))
+        if not applies:
+            continue
+        if not parts:
+            # Unconditional allow for this subject: no row filter needed
+            return true()
+        clauses.append(and_(*parts) if len(parts) > 1 else parts[0])
+
+    if not clauses:
+        return false()
+    return or_(*clauses) if len(clauses) > 1 else clauses[0]
+
+def _uncompilable(policy, what: str) -> PolicyCompilationError:
+    return PolicyCompilationError(
+        f"Policy '{policy.reason}' has no SQL form: {what}",
+        error_code="POLICY_COMPILATION_FAILED",
+        details={"policy": policy.reason, "predicate": what},
+    )
@@ -49,6 +49,10 @@ class ExternalServiceError(IdeaHubError):
     """External service integration errors."""
     pass
 
+class PolicyCompilationError(IdeaHubError):
+    """Authorization policy cannot be compiled (e.g. to a SQL filter)."""
+    pass
+
 def handle_exception(exc: Exception) -> HTTPException:
     """Convert internal exceptions to HTTP exceptions."""
     
@@ -0,0 +1,153 @@
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+import psutil
+from ideahub_platform.common.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Sampling configuration
+HEALTH_SAMPLE_INTERVAL = float(os.getenv("HEALTH_SAMPLE_INTERVAL", "5"))
+HEALTH_DB_PROBE_INTERVAL = float(os.getenv("HEALTH_DB_PROBE_INTERVAL", "10"))
+HEALTH_DISK_PATH = os.getenv("HEALTH_DISK_PATH", "/")
+
+
+@dataclass(frozen=True)
+class SystemSnapshot:
+    """Point-in-time system and process metrics."""
+    timestamp: datetime
+    system: Dict[str, Any] = field(default_factory=dict)
+    application: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class DatabaseStatus:
+    """Result of the most recent database probe."""
+    healthy: bool
+    checked_at: datetime
+    latency_ms: float
+
+
+class HealthSampler:
+    """Collects system metrics and probes the database in the background.
+
+    Health endpoints read the latest snapshots instead of sampling inline, so a
+    probe never blocks the event loop (psutil's `cpu_percent(interval=1)` used to
+    stall it for a full second).
+    """
+
+    def __init__(self, db_probe: Callable[[], bool] = None,
+                 sample_interval: float = HEALTH_SAMPLE_INTERVAL,
+                 db_probe_interval: float = HEALTH_DB_PROBE_INTERVAL,
+                 disk_path: str = HEALTH_DISK_PATH):
+        self.db_probe = db_probe
+        self.sample_interval = sample_interval
+        self.db_probe_interval = db_probe_interval
+        self.disk_path = disk_path
+        self._process = psutil.Process(os.getpid())
+        self._system: Optional[SystemSnapshot] = None
+        self._database: Optional[DatabaseStatus] = None
+        self._tasks = []
+        # Prime the CPU counters: non-blocking cpu_percent() reports usage since the previous call
+        psutil.cpu_percent(interval=None)
+        self._process.cpu_percent(interval=None)
+
+    def sample_system(self) -> SystemSnapshot:
+        """Collect a system snapshot without blocking on a CPU interval."""
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage(self.disk_path)
+        process = self._process
+        with process.oneshot():
+            application = {
+                "process_id": process.pid,
+                "memory_usage": process.memory_info().rss,
+                "cpu_percent": process.cpu_percent(interval=None),
+                "threads": process.num_threads(),
+            }
+        snapshot = SystemSnapshot(
+            timestamp=datetime.utcnow(),
+            system={
+                "cpu_percent": psutil.cpu_percent(interval=None),
+                "memory_percent": memory.percent,
+                "memory_available": memory.available,
+                "disk_percent": disk.percent,
+                "disk_free": disk.free,
+            },
+            application=application,
+        )
+        self._system = snapshot
+        return snapshot
+
+    def probe_database_sync(self) -> DatabaseStatus:
+        """Run the database probe (blocking) and record the result."""
+        if self.db_probe is None:
+            from ideahub_platform.db.base import db_manager
+            self.db_probe = db_manager.check_connection
+        started = time.perf_counter()
+        try:
+            healthy = bool(self.db_probe())
+        except Exception as e:
+            logger.error(f"Database probe failed: {e}")
+            healthy = False
+        status = DatabaseStatus(
+            healthy=healthy,
+            checked_at=datetime.utcnow(),
+            latency_ms=round((time.perf_counter() - started) * 1000, 3),
+        )
+        self._database = status
+        return status
+
+    @property
+    def system(self) -> SystemSnapshot:
+        """Latest system snapshot (sampled on first access if the sampler is not running)."""
+        return self._system or self.sample_system()
+
+    async def database(self) -> DatabaseStatus:
+        """Latest database status (probed on first access if the sampler is not running)."""
+        if self._database is None:
+            return await asyncio.to_thread(self.probe_database_sync)
+        return self._database
+
+    async def start(self) -> None:
+        """Start the background sampling tasks."""
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._run(self.sample_system, self.sample_interval)),
+            asyncio.create_task(self._run(self.probe_database_sync, self.db_probe_interval)),
+        ]
+        logger.info("Health sampler started", extra_fields={
+            "sample_interval": self.sample_interval,
+            "db_probe_interval": self.db_probe_interval,
+        })
+
+    async def stop(self) -> None:
+        """Stop the background sampling tasks."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        logger.info("Health sampler stopped")
+
+    async def _run(self, sample: Callable[[], Any], interval: float) -> None:
+        """Run a blocking sampler in a worker thread every `interval` seconds."""
+        while True:
+            try:
+                await asyncio.to_thread(sample)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Health sampling error: {e}")
+            await asyncio.sleep(interval)
+
+
+# Global sampler instance, started from the application lifespan
+health_sampler = HealthSampler()
+
+
+def get_health_sampler() -> HealthSampler:
+    """Get the global health sampler instance."""
+    return health_sampler
@@ -0,0 +1,159 @@
+# Prometheus metrics shared across the application
+#
+# Under `uvicorn --workers N` set PROMETHEUS_MULTIPROC_DIR to an empty,
+# writable directory before the workers start: prometheus_client then stores
+# samples in per-process mmap files and /metrics aggregates them.
+import os
+from typing import Tuple
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+PROMETHEUS_MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR") or os.getenv("prometheus_multiproc_dir")
+
+# Latency buckets tuned for API calls (seconds)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Finer buckets for in-process work (authz, event handlers)
+FAST_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+                0.01, 0.025, 0.1, 1.0)
+
+# HTTP
+HTTP_REQUEST_DURATION = Histogram(
+    "ideahub_http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+
+# Database connection pool
+DB_POOL_CHECKED_OUT = Gauge(
+    "ideahub_db_pool_checked_out",
+    "Connections currently checked out of the SQLAlchemy pool",
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "ideahub_db_pool_overflow",
+    "Overflow connections currently open beyond pool_size",
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKOUTS = Counter(
+    "ideahub_db_pool_checkouts_total",
+    "Connections checked out of the SQLAlchemy pool",
+)
+DB_POOL_SATURATED = Counter(
+    "ideahub_db_pool_saturated_total",
+    "Checkouts that left the pool fully used (further checkouts wait for pool_timeout)",
+)
+
+# Event bus
+EVENT_QUEUE_DEPTH = Gauge(
+    "ideahub_event_queue_depth",
+    "Events waiting in the in-process event bus queue",
+    multiprocess_mode="livesum",
+)
+EVENT_HANDLER_DURATION = Histogram(
+    "ideahub_event_handler_duration_seconds",
+    "Event handler latency",
+    ["event_type", "handler"],
+    buckets=FAST_BUCKETS,
+)
+EVENT_BATCH_SIZE = Histogram(
+    "ideahub_event_batch_size",
+    "Events delivered per batch to subscribe_batch handlers",
+    ["event_type"],
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
+EVENT_DROPPED = Counter(
+    "ideahub_event_dropped_total",
+    "Events discarded from a full event bus queue (drop_oldest overflow policy)",
+    ["event_type"],
+)
+
+EVENT_DEDUP_HITS = Counter(
+    "ideahub_event_dedup_hits_total",
+    "Redelivered events dropped by event_id deduplication",
+    ["event_type", "consumer"],
+)
+EVENT_LOG_APPENDS = Counter(
+    "ideahub_event_log_appends_total",
+    "Events appended to the durable local event log",
+)
+EVENT_TRANSPORT_MESSAGES = Counter(
+    "ideahub_event_transport_messages_total",
+    "Cross-worker event transport messages by outcome (sent, received, coalesced, failed)",
+    ["outcome"],
+)
+EVENT_TRANSPORT_RECONNECTS = Counter(
+    "ideahub_event_transport_reconnects_total",
+    "Event transport reconnect attempts by connection (listen, notify) and outcome (ok, failed)",
+    ["connection", "outcome"],
+)
+
+# Transactional outbox
+OUTBOX_EVENTS_RELAYED = Counter(
+    "ideahub_outbox_events_relayed_total",
+    "Outbox rows dispatched to the event bus (throughput = rate of this counter)",
+)
+OUTBOX_EVENTS_FAILED = Counter(
+    "ideahub_outbox_events_failed_total",
+    "Outbox rows the relay could not decode and dead-lettered",
+)
+OUTBOX_RELAY_LAG = Histogram(
+    "ideahub_outbox_relay_lag_seconds",
+    "Time from an outbox row's commit to its dispatch by the relay",
+    buckets=LATENCY_BUCKETS,
+)
+
+# Search
+SEARCH_QUERY_DURATION = Histogram(
+    "ideahub_search_query_duration_seconds",
+    "Idea search query latency by backend",
+    ["backend"],
+    buckets=LATENCY_BUCKETS,
+)
+
+# Authorization
+AUTHZ_DECISION_DURATION = Histogram(
+    "ideahub_authz_decision_duration_seconds",
+    "Authorization engine decision latency",
+    ["action"],
+    buckets=FAST_BUCKETS,
+)
+AUTHZ_DECISION_CACHE = Counter(
+    "ideahub_authz_decision_cache_total",
+    "Authorization decision cache lookups (hit rate = hit / (hit + miss))",
+    ["result"],
+)
+AUTHZ_AUDIT_RECORDS = Counter(
+    "ideahub_authz_audit_records_total",
+    "Sampled authorization decisions written to or dropped from the audit stream",
+    ["outcome"],
+)
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Render all metrics in the Prometheus text format, aggregating workers if needed."""
+    if PROMETHEUS_MULTIPROC_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: int = None) -> None:
+    """Drop a worker's live gauges from the multiprocess directory on shutdown."""
+    if PROMETHEUS_MULTIPROC_DIR:
+        multiprocess.mark_process_dead(pid or os.getpid())
+
+
+def handler_name(handler) -> str:
+    """Stable, low-cardinality label for a callable."""
+    name = getattr(handler, "__qualname__", None) or handler.__class__.__qualname__
+    return f"{getattr(handler, '__module__', '')}.{name}".lstrip(".")
@@ -0,0 +1,54 @@
+# Opaque cursors for keyset pagination
+import base64
+import json
+import math
+from datetime import datetime
+from typing import Any, List, Sequence
+from ideahub_platform.common.errors import ValidationError
+
+_DATETIME_TAG = "$dt"
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {_DATETIME_TAG: value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and _DATETIME_TAG in value:
+        return datetime.fromisoformat(value[_DATETIME_TAG])
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort key of the last row on a page as an opaque, URL-safe cursor."""
+    raw = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _has_type(value: Any, expected: type) -> bool:
+    if isinstance(value, bool) or expected is bool:
+        return type(value) is expected
+    if expected is float:
+        return isinstance(value, (int, float)) and math.isfinite(value)
+    return isinstance(value, expected)
+
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> List[Any]:
+    """Decode a cursor from `encode_cursor` whose values must have the sort key's `types`."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if isinstance(values, list):
+            values = [_decode_value(v) for v in values]
+    except (ValueError, TypeError):
+        values = None
+    if (not isinstance(values, list) or len(values) != len(types)
+            or not all(map(_has_type, values, types))):
+        raise ValidationError(
+            message="Invalid pagination cursor",
+            error_code="INVALID_CURSOR",
+            details={"cursor": cursor},
+        )
+    return values
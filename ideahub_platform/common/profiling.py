@@ -0,0 +1,125 @@
+# Per-request profiling: query counts and phase timings
+import os
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, Optional
+from ideahub_platform.common.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Warn when one statement shape runs more than this many times in a request (N+1 smell)
+QUERY_REPEAT_WARN_THRESHOLD = int(os.getenv("DB_QUERY_REPEAT_WARN_THRESHOLD", "10"))
+
+
+@dataclass
+class RequestProfile:
+    """Counters collected while handling a single request (or test block)."""
+    label: str = ""
+    statements: int = 0
+    rows: int = 0
+    shapes: Counter = field(default_factory=Counter)
+    phases: Dict[str, float] = field(default_factory=dict)
+    repeat_threshold: int = QUERY_REPEAT_WARN_THRESHOLD
+    _warned: set = field(default_factory=set, repr=False)
+
+    @property
+    def db_time(self) -> float:
+        """Seconds spent executing SQL."""
+        return self.phases.get("db", 0.0)
+
+    def add_time(self, phase: str, seconds: float) -> None:
+        """Accumulate time spent in a phase."""
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def record_query(self, statement: str, rows: int, seconds: float) -> None:
+        """Record one executed statement and flag repeated shapes."""
+        self.statements += 1
+        if rows > 0:
+            self.rows += rows
+        self.add_time("db", seconds)
+        self.shapes[statement] += 1
+        count = self.shapes[statement]
+        if count > self.repeat_threshold and statement not in self._warned:
+            self._warned.add(statement)
+            logger.warning("Repeated query shape detected (possible N+1)", extra_fields={
+                "label": self.label,
+                "count": count,
+                "threshold": self.repeat_threshold,
+                "statement": statement[:500],
+            })
+
+    def repeated_shapes(self, threshold: Optional[int] = None) -> Dict[str, int]:
+        """Statement shapes executed more than `threshold` times."""
+        limit = self.repeat_threshold if threshold is None else threshold
+        return {sql: n for sql, n in self.shapes.items() if n > limit}
+
+    def server_timing(self, total: Optional[float] = None) -> str:
+        """Render the profile as a `Server-Timing` header value."""
+        metrics = [f'db;dur={self.db_time * 1000:.2f};desc="{self.statements} queries"']
+        for phase in ("authz", "serialize"):
+            metrics.append(f"{phase};dur={self.phases.get(phase, 0.0) * 1000:.2f}")
+        if total is not None:
+            metrics.append(f"total;dur={total * 1000:.2f}")
+        return ", ".join(metrics)
+
+
+_current_profile: ContextVar[Optional[RequestProfile]] = ContextVar(
+    "ideahub_request_profile", default=None
+)
+
+
+def current_profile() -> Optional[RequestProfile]:
+    """Get the profile of the request being handled, if any."""
+    return _current_profile.get()
+
+
+def add_phase_time(phase: str, seconds: float) -> None:
+    """Add time to a phase of the current request; no-op outside a profile."""
+    profile = _current_profile.get()
+    if profile is not None:
+        profile.add_time(phase, seconds)
+
+
+@contextmanager
+def timed_phase(phase: str) -> Iterator[None]:
+    """Time a block as part of the given phase of the current request."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_phase_time(phase, time.perf_counter() - started)
+
+
+@contextmanager
+def profile_request(label: str = "", repeat_threshold: int = QUERY_REPEAT_WARN_THRESHOLD
+                    ) -> Iterator[RequestProfile]:
+    """Collect query counts and phase timings for the enclosed block.
+
+    Used by the gateway middleware per request, and by tests:
+
+        with profile_request() as profile:
+            provider.get_community_statistics(workspace_id)
+        assert profile.statements <= 2
+    """
+    profile = RequestProfile(label=label, repeat_threshold=repeat_threshold)
+    token = _current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
+
+
+@contextmanager
+def query_budget(max_statements: int, label: str = "") -> Iterator[RequestProfile]:
+    """Fail with AssertionError if the block executes more than `max_statements` queries."""
+    with profile_request(label) as profile:
+        yield profile
+    if profile.statements > max_statements:
+        worst = profile.shapes.most_common(3)
+        raise AssertionError(
+            f"Query budget exceeded: {profile.statements} > {max_statements}; "
+            f"most repeated: {worst}"
+        )
@@ -1,10 +1,34 @@
-from typing import Optional
+import os
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+from urllib.parse import urlsplit
 from sqlalchemy.orm import Session
 from ideahub_platform.db.models.workspace import Workspace
+from ideahub_platform.common.cache import TTLCache
 from ideahub_platform.common.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Tenant resolution configuration
+TENANT_BASE_DOMAIN = os.getenv("TENANT_BASE_DOMAIN", "").lower().strip(".")
+TENANT_CACHE_TTL = float(os.getenv("TENANT_CACHE_TTL", "60"))
+TENANT_NEGATIVE_CACHE_TTL = float(os.getenv("TENANT_NEGATIVE_CACHE_TTL", "5"))
+TENANT_CACHE_SIZE = int(os.getenv("TENANT_CACHE_SIZE", "4096"))
+
+# Subdomains that never identify a workspace
+RESERVED_SUBDOMAINS = frozenset({"www", "api", "app", "admin"})
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class WorkspaceRef:
+    """Detached, immutable view of a workspace safe to share across requests."""
+    id: int
+    name: str
+    url: str
+
+
 class TenantResolver:
     """Resolves workspace/tenant from URL or subdomain."""
     
@@ -16,9 +40,8 @@ class TenantResolver:
         try:
             # Extract workspace identifier from URL
             # Example: /workspace/acme-corp/communities -> acme-corp
-            parts = url.strip('/').split('/')
-            if len(parts) >= 2 and parts[0] == 'workspace':
-                workspace_url = parts[1]
+            workspace_url = slug_from_path(url)
+            if workspace_url:
                 return self._find_by_url(workspace_url)
             return None
         except Exception as e:
@@ -50,6 +73,98 @@ class TenantResolver:
             logger.error(f"Database error finding workspace by URL {workspace_url}: {e}")
             return None
 
+
+def slug_from_path(path: str) -> Optional[str]:
+    """Extract the workspace slug from a `/workspace/<slug>/...` path or full URL."""
+    if "://" in path:
+        path = urlsplit(path).path
+    parts = path.strip('/').split('/')
+    if len(parts) >= 2 and parts[0] == 'workspace' and parts[1]:
+        return parts[1]
+    return None
+
+
+def slug_from_host(host: str, base_domain: str = TENANT_BASE_DOMAIN) -> Optional[str]:
+    """Extract the workspace slug from `<slug>.<base_domain>` hosts."""
+    if not host or not base_domain:
+        return None
+    hostname = host.split(':', 1)[0].lower().rstrip('.')
+    suffix = "." + base_domain
+    if not hostname.endswith(suffix):
+        return None
+    subdomain = hostname[:-len(suffix)]
+    if not subdomain or "." in subdomain or subdomain in RESERVED_SUBDOMAINS:
+        return None
+    return subdomain
+
+
+def _load_workspace_ref(workspace_url: str) -> Optional[WorkspaceRef]:
+    """Load a workspace by URL identifier using a short-lived session."""
+    from ideahub_platform.db.base import db_manager
+
+    with db_manager.get_db_session() as session:
+        workspace = TenantResolver(session).resolve_from_subdomain(workspace_url)
+        if workspace is None:
+            return None
+        return WorkspaceRef(id=workspace.id, name=workspace.name, url=workspace.url)
+
+
+class CachedTenantResolver:
+    """Resolves a workspace slug once and serves repeat lookups from memory.
+
+    Misses are cached for a shorter time so unknown hosts cannot force a DB
+    query on every request.
+    """
+
+    def __init__(self, loader: Callable[[str], Optional[WorkspaceRef]] = _load_workspace_ref,
+                 base_domain: str = TENANT_BASE_DOMAIN, ttl: float = TENANT_CACHE_TTL,
+                 negative_ttl: float = TENANT_NEGATIVE_CACHE_TTL,
+                 maxsize: int = TENANT_CACHE_SIZE):
+        self.loader = loader
+        self.base_domain = base_domain
+        self.negative_ttl = negative_ttl
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def extract_slug(self, host: str, path: str) -> Optional[str]:
+        """Get the workspace slug for a request, preferring the subdomain."""
+        return slug_from_host(host, self.base_domain) or slug_from_path(path)
+
+    def peek(self, slug: str) -> Tuple[bool, Optional[WorkspaceRef]]:
+        """Return `(found, workspace)` from the cache without touching the database."""
+        cached = self._cache.get(slug, _MISSING)
+        if cached is _MISSING:
+            return False, None
+        return True, cached
+
+    def resolve(self, slug: str) -> Optional[WorkspaceRef]:
+        """Resolve a slug, hitting the database only on a cache miss."""
+        cached = self._cache.get(slug, _MISSING)
+        if cached is not _MISSING:
+            return cached
+        try:
+            workspace = self.loader(slug)
+        except Exception as e:
+            logger.error(f"Error resolving tenant {slug}: {e}")
+            return None
+        self._cache.set(slug, workspace, ttl=None if workspace else self.negative_ttl)
+        return workspace
+
+    def invalidate(self, slug: Optional[str] = None) -> None:
+        """Drop one slug (or everything) from the cache, e.g. after a workspace rename."""
+        if slug is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(slug)
+
+
+tenant_resolver = CachedTenantResolver()
+
+
+def get_tenant_resolver() -> CachedTenantResolver:
+    """Get the process-wide cached tenant resolver."""
+    return tenant_resolver
+
+
 def get_workspace_from_request(request_url: str, db_session: Session) -> Optional[Workspace]:
     """Convenience function to get workspace from request URL."""
     resolver = TenantResolver(db_session)
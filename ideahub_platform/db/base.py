@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker, declarative_base
 from sqlalchemy.pool import QueuePool
 from sqlalchemy.exc import SQLAlchemyError
@@ -6,6 +6,11 @@ import os
 import logging
 from typing import Optional
 from contextlib import contextmanager
+from ideahub_platform.db.instrumentation import install_query_instrumentation
+from ideahub_platform.db.slow_queries import DB_SLOW_QUERY_LOG, slow_query_recorder
+from ideahub_platform.common.metrics import (
+    DB_POOL_CHECKED_OUT, DB_POOL_CHECKOUTS, DB_POOL_OVERFLOW, DB_POOL_SATURATED
+)
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +42,28 @@ engine = create_engine(
     }
 )
 
+# Per-request statement counts and DB time (see common.profiling)
+install_query_instrumentation(engine)
+if DB_SLOW_QUERY_LOG:
+    slow_query_recorder.install(engine)
+
+def _update_pool_gauges(pool) -> None:
+    DB_POOL_CHECKED_OUT.set(pool.checkedout())
+    DB_POOL_OVERFLOW.set(max(pool.overflow(), 0))
+
+@event.listens_for(engine, "checkout")
+def _on_pool_checkout(dbapi_connection, connection_record, connection_proxy):
+    """Track pool usage; a checkout that uses the last slot means the next one waits."""
+    pool = engine.pool
+    DB_POOL_CHECKOUTS.inc()
+    if pool.checkedout() >= DB_POOL_SIZE + DB_MAX_OVERFLOW:
+        DB_POOL_SATURATED.inc()
+    _update_pool_gauges(pool)
+
+@event.listens_for(engine, "checkin")
+def _on_pool_checkin(dbapi_connection, connection_record):
+    _update_pool_gauges(engine.pool)
+
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -70,6 +97,10 @@ class DatabaseManager:
             
     async def health_check(self) -> bool:
         """Check database connectivity."""
+        return self.check_connection()
+            
+    def check_connection(self) -> bool:
+        """Check database connectivity (blocking; run off the event loop)."""
         try:
             with self.get_db_session() as session:
                 result = session.execute(text("SELECT 1"))
@@ -0,0 +1,30 @@
+# SQLAlchemy cursor hooks feeding the per-request profile
+import time
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from ideahub_platform.common.profiling import current_profile
+
+_START_KEY = "ideahub_query_start"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if current_profile() is not None:
+        conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = current_profile()
+    if profile is None:
+        return
+    starts = conn.info.get(_START_KEY)
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    profile.record_query(statement, getattr(cursor, "rowcount", -1), elapsed)
+
+
+def install_query_instrumentation(engine: Engine) -> None:
+    """Attach statement/row/time counters to an engine (idempotent)."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
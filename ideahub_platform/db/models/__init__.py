@@ -4,12 +4,17 @@ from .workspace import Workspace
 from .community import Community
 from .member import Member
 from .idea import Idea
+from .idea_tag import IdeaTag, TagFacetVersion
 from .campaign import Campaign
+from .outbox import OutboxEvent
 
 __all__ = [
     "Workspace",
     "Community", 
     "Member",
     "Idea",
+    "IdeaTag",
+    "TagFacetVersion",
     "Campaign",
+    "OutboxEvent",
 ]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, Index, String, Text, Boolean, DateTime, ForeignKey
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from ideahub_platform.db.base import Base
@@ -15,6 +15,11 @@ class Community(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        # Keyset pagination on (created_at, id) within a workspace
+        Index("ix_communities_workspace_created_id", "workspace_id", "created_at", "id"),
+    )
+
     # Relationships
     workspace = relationship("Workspace", back_populates="communities")
     ideas = relationship("Idea", back_populates="community", cascade="all, delete-orphan")
@@ -1,8 +1,13 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, JSON
+from sqlalchemy import Column, Computed, Integer, Index, String, Text, Boolean, DateTime, ForeignKey, JSON
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from ideahub_platform.db.base import Base
 
+# Text search configuration of Idea.search_vector; queries must use the same one.
+# Changing it requires rebuilding the generated column (and its GIN index).
+SEARCH_LANGUAGE = "english"
+
 
 class Idea(Base):
     __tablename__ = "ideas"
@@ -18,6 +23,20 @@ class Idea(Base):
     extra_data = Column("metadata", JSON, default=dict)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    # Full-text document, weighted title (A) > tags (B) > description (C); maintained by PostgreSQL
+    search_vector = deferred(Column(TSVECTOR, Computed(
+        f"setweight(to_tsvector('{SEARCH_LANGUAGE}', coalesce(title, '')), 'A') || "
+        f"setweight(to_tsvector('{SEARCH_LANGUAGE}', coalesce(tags::text, '')), 'B') || "
+        f"setweight(to_tsvector('{SEARCH_LANGUAGE}', coalesce(description, '')), 'C')",
+        persisted=True,
+    )))
+
+    __table_args__ = (
+        Index("ix_ideas_search_vector", "search_vector", postgresql_using="gin"),
+        # Keyset pagination on (created_at, id), overall and per community
+        Index("ix_ideas_created_id", "created_at", "id"),
+        Index("ix_ideas_community_created_id", "community_id", "created_at", "id"),
+    )
 
     # Relationships
     community = relationship("Community", back_populates="ideas")
@@ -0,0 +1,190 @@
+from typing import Iterable, List, Set
+from sqlalchemy import (
+    BigInteger, Boolean, Column, ForeignKey, Index, Integer, String, delete, event, insert, inspect,
+    literal, select, update,
+)
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, object_session
+from ideahub_platform.db.base import Base
+from ideahub_platform.db.models.community import Community
+from ideahub_platform.db.models.idea import Idea
+from ideahub_platform.db.models.workspace import Workspace
+
+TAG_MAX_LENGTH = 100
+
+
+def normalize_tag(tag) -> str:
+    """Lowercase a tag and collapse its whitespace."""
+    return " ".join(str(tag).lower().split())
+
+
+def normalized_tags(tags: Iterable) -> List[str]:
+    """Distinct normalized tags in first-seen order."""
+    seen = {}
+    for tag in tags or ():
+        tag = normalize_tag(tag)[:TAG_MAX_LENGTH]
+        if tag:
+            seen.setdefault(tag, None)
+    return list(seen)
+
+
+class IdeaTag(Base):
+    """One normalized tag of an idea, mirroring `Idea.tags` for indexed lookups.
+
+    Rows are rewritten in the idea's own flush by the mapper listeners
+    below; Core bulk writes to `ideas` bypass them.
+    """
+    __tablename__ = "idea_tags"
+
+    idea_id = Column(Integer, ForeignKey("ideas.id", ondelete="CASCADE"), primary_key=True)
+    tag = Column(String(TAG_MAX_LENGTH), primary_key=True)
+    # Denormalized so facet counts are index-only GROUP BYs
+    community_id = Column(Integer, nullable=False)
+    workspace_id = Column(Integer, nullable=False)
+    public = Column(Boolean, nullable=False, default=True)
+
+    __table_args__ = (
+        Index("ix_idea_tags_workspace_tag", "workspace_id", "public", "tag"),
+        Index("ix_idea_tags_community_tag", "community_id", "public", "tag"),
+        Index("ix_idea_tags_tag", "tag"),
+    )
+
+
+class TagFacetVersion(Base):
+    """Per-workspace counter bumped whenever the workspace's idea tags change.
+
+    Kept off `workspaces` and bumped after the writing transaction commits,
+    in its own short transaction, so idea writes neither hold a lock on a
+    shared row nor touch `Workspace.updated_at`. A workspace without a row
+    is at version 0.
+    """
+    __tablename__ = "tag_facet_versions"
+
+    workspace_id = Column(Integer, ForeignKey("workspaces.id", ondelete="CASCADE"), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+
+
+# Session.info key of the workspaces whose tags changed in the open transaction
+_CHANGED_WORKSPACES = "idea_tags.changed_workspaces"
+
+
+def _workspace_of(connection, community_id: int):
+    return connection.execute(
+        select(Community.workspace_id).where(Community.id == community_id)
+    ).scalar()
+
+
+def bump_versions(connection, workspace_ids: Set[int]) -> None:
+    """Increment the tag facet version of each workspace, creating missing rows."""
+    for workspace_id in sorted(workspace_ids - {None}):
+        bumped = connection.execute(
+            update(TagFacetVersion)
+            .where(TagFacetVersion.workspace_id == workspace_id)
+            .values(version=TagFacetVersion.version + 1)
+        ).rowcount
+        if bumped:
+            continue
+        try:
+            with connection.begin_nested():
+                connection.execute(insert(TagFacetVersion).values(workspace_id=workspace_id, version=1))
+        except IntegrityError:
+            # A concurrent writer created the row first
+            connection.execute(
+                update(TagFacetVersion)
+                .where(TagFacetVersion.workspace_id == workspace_id)
+                .values(version=TagFacetVersion.version + 1)
+            )
+
+
+def _mark_changed(target: Idea, workspace_ids: Set[int]) -> None:
+    session = object_session(target)
+    if session is not None and workspace_ids - {None}:
+        session.info.setdefault(_CHANGED_WORKSPACES, set()).update(workspace_ids - {None})
+
+
+def _write_tags(connection, idea: Idea) -> Set[int]:
+    """Replace an idea's tag rows; returns the workspaces whose tags changed."""
+    removed = connection.execute(
+        delete(IdeaTag).where(IdeaTag.idea_id == idea.id).returning(IdeaTag.workspace_id)
+    ).scalars().all()
+    tags = normalized_tags(idea.tags)
+    workspace_id = _workspace_of(connection, idea.community_id)
+    if tags:
+        public = idea.visibility == "public"
+        connection.execute(insert(IdeaTag), [
+            {"idea_id": idea.id, "tag": tag, "community_id": idea.community_id,
+             "workspace_id": workspace_id, "public": public}
+            for tag in tags
+        ])
+    return set(removed) | ({workspace_id} if tags else set())
+
+
+@event.listens_for(Idea, "after_insert")
+def _idea_inserted(mapper, connection, target: Idea) -> None:
+    if normalized_tags(target.tags):
+        _mark_changed(target, _write_tags(connection, target))
+
+
+@event.listens_for(Idea, "after_update")
+def _idea_updated(mapper, connection, target: Idea) -> None:
+    attrs = inspect(target).attrs
+    if any(attrs[name].history.has_changes() for name in ("tags", "community_id", "visibility")):
+        _mark_changed(target, _write_tags(connection, target))
+
+
+@event.listens_for(Idea, "after_delete")
+def _idea_deleted(mapper, connection, target: Idea) -> None:
+    removed = connection.execute(
+        delete(IdeaTag).where(IdeaTag.idea_id == target.id).returning(IdeaTag.workspace_id)
+    ).scalars().all()
+    _mark_changed(target, set(removed))
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_committed(session: Session) -> None:
+    workspace_ids = session.info.pop(_CHANGED_WORKSPACES, None)
+    if not workspace_ids:
+        return
+    # The session's transaction is over; a crash before this point leaves
+    # cached facets stale until TAG_FACET_CACHE_TTL
+    bind = session.get_bind(TagFacetVersion)
+    if isinstance(bind, Engine):
+        with bind.begin() as connection:
+            bump_versions(connection, workspace_ids)
+    else:
+        bump_versions(bind, workspace_ids)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_changes(session: Session, previous_transaction) -> None:
+    if previous_transaction.parent is None:
+        session.info.pop(_CHANGED_WORKSPACES, None)
+
+
+def rebuild_idea_tags(connection, chunk_size: int = 1000) -> int:
+    """Backfill idea_tags from `Idea.tags` for every idea; returns rows written."""
+    connection.execute(delete(IdeaTag))
+    rows = connection.execution_options(yield_per=chunk_size).execute(
+        select(Idea.id, Idea.community_id, Community.workspace_id, Idea.visibility, Idea.tags)
+        .join(Community, Community.id == Idea.community_id)
+    )
+    written = 0
+    for chunk in rows.partitions():
+        values = [
+            {"idea_id": idea_id, "tag": tag, "community_id": community_id,
+             "workspace_id": workspace_id, "public": visibility == "public"}
+            for idea_id, community_id, workspace_id, visibility, tags in chunk
+            for tag in normalized_tags(tags)
+        ]
+        if values:
+            connection.execute(insert(IdeaTag), values)
+            written += len(values)
+    connection.execute(update(TagFacetVersion).values(version=TagFacetVersion.version + 1))
+    connection.execute(insert(TagFacetVersion).from_select(
+        ["workspace_id", "version"],
+        select(Workspace.id, literal(1)).where(
+            ~Workspace.id.in_(select(TagFacetVersion.workspace_id))
+        ),
+    ))
+    return written
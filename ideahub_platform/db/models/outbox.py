@@ -0,0 +1,33 @@
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, JSON, String
+from sqlalchemy.sql import func
+from ideahub_platform.db.base import Base
+
+
+class OutboxEvent(Base):
+    """A domain event written in the same transaction as the change that raised it.
+
+    Rows are relayed to the event bus by `ideahub_platform.events.outbox.OutboxRelay`
+    and marked processed; pending rows are found through a partial index.
+    Rows the relay cannot decode are marked processed with `error` set, so
+    they stay in the table for inspection without blocking the rows after them.
+    """
+    __tablename__ = "outbox"
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    event_type = Column(String(100), nullable=False)
+    payload = Column(JSON, nullable=False, default=dict)
+    event_id = Column(String(64), nullable=False, unique=True)
+    correlation_id = Column(String(64))
+    user_id = Column(String(64))
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    processed_at = Column(DateTime(timezone=True))
+    error = Column(String(255))
+
+    __table_args__ = (
+        Index(
+            "ix_outbox_pending",
+            "id",
+            postgresql_where=processed_at.is_(None),
+            sqlite_where=processed_at.is_(None),
+        ),
+    )
@@ -19,4 +19,4 @@ class Workspace(Base):
 
     # Relationships
     communities = relationship("Community", back_populates="workspace", cascade="all, delete-orphan")
-    members = relationship("Member", back_populates="workspace", cascade="all, delete-orphan")
+    members = relationship("Member", secondary="workspace_members", back_populates="workspaces")
@@ -0,0 +1,72 @@
+# Column projections (`fields=`) and keyset pagination for list endpoints
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+from sqlalchemy import Select, select, tuple_
+from sqlalchemy.orm import Session
+from ideahub_platform.common.errors import ValidationError
+from ideahub_platform.common.pagination import decode_cursor, encode_cursor
+
+
+class Projection:
+    """The columns of an entity a client may ask for by name.
+
+    Only the requested columns are selected (a Core select, not ORM
+    entities), so large columns left out of `default` are never read
+    unless named in `fields=`.
+    """
+
+    def __init__(self, columns: Mapping[str, Any], default: Sequence[str],
+                 required: Sequence[str] = ("id",)):
+        self.columns = dict(columns)
+        self.default = list(default)
+        self.required = list(required)
+
+    def parse(self, fields: Optional[str]) -> List[str]:
+        """Field names from a comma-separated `fields=` value (None means the defaults)."""
+        if not fields:
+            names = list(self.default)
+        else:
+            names = [name.strip() for name in fields.split(",") if name.strip()]
+            unknown = [name for name in names if name not in self.columns]
+            if unknown:
+                raise ValidationError(
+                    message=f"Unknown fields: {', '.join(unknown)}",
+                    error_code="INVALID_FIELDS",
+                    details={"fields": unknown, "allowed": sorted(self.columns)},
+                )
+        for name in reversed(self.required):
+            if name not in names:
+                names.insert(0, name)
+        return list(dict.fromkeys(names))
+
+    def select(self, names: Sequence[str], extra: Sequence[str] = ()) -> Select:
+        """SELECT of the named columns, labelled by name, plus `extra` ones (e.g. sort keys)."""
+        wanted = list(dict.fromkeys([*names, *extra]))
+        return select(*(self.columns[name].label(name) for name in wanted))
+
+    @staticmethod
+    def to_dict(row, names: Sequence[str]) -> Dict[str, Any]:
+        mapping = row._mapping
+        return {name: mapping[name] for name in names}
+
+
+def keyset_page(session: Session, stmt: Select, projection: Projection, names: Sequence[str],
+                sort: Sequence[str], limit: int, cursor: Optional[str] = None
+                ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Run `stmt` one page at a time, newest first on the `sort` columns.
+
+    `stmt` must already select the `sort` columns under their names. The
+    cursor holds the sort key of the last row, so each page is an index
+    range scan starting after it rather than an OFFSET.
+    """
+    keys = [projection.columns[name] for name in sort]
+    if cursor:
+        last = decode_cursor(cursor, [key.type.python_type for key in keys])
+        stmt = stmt.where(tuple_(*keys) < tuple_(*last))
+    stmt = stmt.order_by(*(key.desc() for key in keys)).limit(limit + 1)
+    rows = session.execute(stmt).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last_row = rows[-1]._mapping
+        next_cursor = encode_cursor([last_row[name] for name in sort])
+    return [projection.to_dict(row, names) for row in rows], next_cursor
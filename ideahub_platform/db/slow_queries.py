@@ -0,0 +1,171 @@
+# Opt-in slow query log with sampled EXPLAIN capture
+import os
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from ideahub_platform.common.logging import get_logger
+from ideahub_platform.common.profiling import current_profile
+
+logger = get_logger(__name__)
+
+# Slow query log configuration
+DB_SLOW_QUERY_LOG = os.getenv("DB_SLOW_QUERY_LOG", "false").lower() == "true"
+DB_SLOW_QUERY_THRESHOLD_MS = float(os.getenv("DB_SLOW_QUERY_THRESHOLD_MS", "200"))
+DB_SLOW_QUERY_EXPLAIN_SAMPLE_RATE = float(os.getenv("DB_SLOW_QUERY_EXPLAIN_SAMPLE_RATE", "0.1"))
+DB_SLOW_QUERY_BUFFER_SIZE = int(os.getenv("DB_SLOW_QUERY_BUFFER_SIZE", "200"))
+
+_START_KEY = "ideahub_slow_query_start"
+_EXPLAINABLE_PREFIXES = ("select", "with")
+# Only these are re-executed under EXPLAIN ANALYZE; a WITH can hide
+# INSERT/UPDATE/DELETE, so it only gets a plain EXPLAIN
+_ANALYZABLE_PREFIXES = ("select",)
+
+
+@dataclass(frozen=True)
+class SlowQuery:
+    """A statement that exceeded the slow query threshold."""
+    recorded_at: datetime
+    duration_ms: float
+    statement: str
+    parameter_shapes: Any
+    executemany: bool
+    label: str = ""
+    plan: Optional[Any] = None
+    explain_error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["recorded_at"] = self.recorded_at.isoformat()
+        return data
+
+
+def parameter_shapes(parameters: Any, executemany: bool = False) -> Any:
+    """Describe bind parameters by type only, so no values are retained."""
+    if executemany and isinstance(parameters, (list, tuple)):
+        first = parameters[0] if parameters else None
+        return {"rows": len(parameters), "row": parameter_shapes(first)}
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__ if parameters is not None else None
+
+
+class SlowQueryRecorder:
+    """Keeps the most recent slow statements in a bounded ring buffer.
+
+    For a sample of slow SELECT statements on PostgreSQL the query is
+    re-run under `EXPLAIN (ANALYZE, BUFFERS)` inside a savepoint that is
+    always rolled back, so neither a failing EXPLAIN nor side effects of the
+    second execution (e.g. volatile functions) reach the caller's
+    transaction. WITH queries get a plain EXPLAIN, which does not execute.
+    """
+
+    def __init__(self, threshold_ms: float = DB_SLOW_QUERY_THRESHOLD_MS,
+                 explain_sample_rate: float = DB_SLOW_QUERY_EXPLAIN_SAMPLE_RATE,
+                 capacity: int = DB_SLOW_QUERY_BUFFER_SIZE,
+                 sampler: Callable[[], float] = random.random):
+        self.threshold_ms = threshold_ms
+        self.explain_sample_rate = explain_sample_rate
+        self.sampler = sampler
+        self._entries: deque = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self.enabled = False
+
+    def install(self, engine: Engine) -> None:
+        """Attach the recorder to an engine (idempotent)."""
+        if not event.contains(engine, "before_cursor_execute", self._before_cursor_execute):
+            event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+            event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        self.enabled = True
+        logger.info("Slow query log enabled", extra_fields={
+            "threshold_ms": self.threshold_ms,
+            "explain_sample_rate": self.explain_sample_rate,
+        })
+
+    def entries(self, limit: Optional[int] = None) -> List[SlowQuery]:
+        """Recorded slow queries, newest first."""
+        with self._lock:
+            items = list(self._entries)
+        items.reverse()
+        return items[:limit] if limit else items
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def record(self, entry: SlowQuery) -> None:
+        with self._lock:
+            self._entries.append(entry)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get(_START_KEY)
+        if not starts:
+            return
+        duration_ms = (time.perf_counter() - starts.pop()) * 1000
+        if duration_ms < self.threshold_ms:
+            return
+
+        plan, explain_error = None, None
+        if (not executemany and conn.dialect.name == "postgresql"
+                and statement.lstrip().lower().startswith(_EXPLAINABLE_PREFIXES)
+                and self.sampler() < self.explain_sample_rate):
+            plan, explain_error = self._explain(cursor, statement, parameters)
+
+        profile = current_profile()
+        self.record(SlowQuery(
+            recorded_at=datetime.utcnow(),
+            duration_ms=round(duration_ms, 3),
+            statement=statement,
+            parameter_shapes=parameter_shapes(parameters, executemany),
+            executemany=executemany,
+            label=profile.label if profile else "",
+            plan=plan,
+            explain_error=explain_error,
+        ))
+        logger.warning("Slow query", extra_fields={
+            "duration_ms": round(duration_ms, 3),
+            "statement": statement[:500],
+            "label": profile.label if profile else "",
+        })
+
+    def _explain(self, cursor, statement, parameters):
+        """Run EXPLAIN on the raw DBAPI connection, bypassing these hooks."""
+        if statement.lstrip().lower().startswith(_ANALYZABLE_PREFIXES):
+            explain = "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) "
+        else:
+            explain = "EXPLAIN (FORMAT JSON) "
+        raw = cursor.connection.cursor()
+        try:
+            raw.execute("SAVEPOINT ideahub_explain")
+            try:
+                raw.execute(explain + statement, parameters)
+                return raw.fetchone()[0], None
+            except Exception as e:
+                return None, str(e)
+            finally:
+                raw.execute("ROLLBACK TO SAVEPOINT ideahub_explain")
+                raw.execute("RELEASE SAVEPOINT ideahub_explain")
+        except Exception as e:
+            logger.error(f"Slow query EXPLAIN failed: {e}")
+            return None, str(e)
+        finally:
+            raw.close()
+
+
+# Global recorder, installed on the engine when DB_SLOW_QUERY_LOG=true
+slow_query_recorder = SlowQueryRecorder()
+
+
+def get_slow_query_recorder() -> SlowQueryRecorder:
+    """Get the global slow query recorder."""
+    return slow_query_recorder
@@ -1,45 +1,129 @@
 # Production-ready event bus
 import asyncio
 import logging
-from typing import Any, Callable, Dict, List, Optional
-from datetime import datetime
-from dataclasses import dataclass, field
-from enum import Enum
+import os
+import time
+import uuid
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from ideahub_platform.events.event_types import Event, EventType
+from ideahub_platform.common.metrics import (
+    EVENT_BATCH_SIZE,
+    EVENT_DROPPED,
+    EVENT_HANDLER_DURATION,
+    EVENT_QUEUE_DEPTH,
+    handler_name,
+)
+
+if TYPE_CHECKING:
+    from ideahub_platform.events.log import EventLog
+    from ideahub_platform.events.transport import EventTransport
 
 logger = logging.getLogger(__name__)
 
-class EventType(Enum):
-    """Event types for the application."""
-    WORKSPACE_CREATED = "workspace.created"
-    WORKSPACE_UPDATED = "workspace.updated"
-    WORKSPACE_DELETED = "workspace.deleted"
-    COMMUNITY_CREATED = "community.created"
-    COMMUNITY_UPDATED = "community.updated"
-    COMMUNITY_DELETED = "community.deleted"
-    IDEA_CREATED = "idea.created"
-    IDEA_UPDATED = "idea.updated"
-    IDEA_DELETED = "idea.deleted"
-    MEMBER_JOINED = "member.joined"
-    MEMBER_LEFT = "member.left"
-
-@dataclass
-class Event:
-    """Domain event structure."""
-    event_type: EventType
-    data: Dict[str, Any]
-    timestamp: datetime = field(default_factory=datetime.utcnow)
-    event_id: Optional[str] = None
-    correlation_id: Optional[str] = None
-    user_id: Optional[str] = None
+# Worker pool configuration
+EVENT_BUS_WORKERS = int(os.getenv("EVENT_BUS_WORKERS", "4"))
+EVENT_BUS_MAX_QUEUE_SIZE = int(os.getenv("EVENT_BUS_MAX_QUEUE_SIZE", "10000"))
+EVENT_BUS_OVERFLOW = os.getenv("EVENT_BUS_OVERFLOW", "block")
+EVENT_BUS_ORDERING = os.getenv("EVENT_BUS_ORDERING", "key")
+EVENT_BUS_HANDLER_THREADS = int(os.getenv("EVENT_BUS_HANDLER_THREADS", "8"))
+
+OVERFLOW_POLICIES = ("block", "drop_oldest")
+ORDERING_MODES = ("none", "event_type", "key")
+
+# Queued behind pending events by stop() to shut a worker down
+_STOP = object()
+
+
+def _event_type_key(event: Event) -> Any:
+    return event.event_type
+
+
+def _workspace_key(event: Event) -> Any:
+    data = event.data
+    if isinstance(data, dict):
+        return data.get("workspace_id")
+    return getattr(data, "workspace_id", None)
+
+
+class BatchSubscription:
+    """A batch handler plus the events buffered for its next delivery."""
+
+    def __init__(self, event_type: EventType, handler: Callable[[List[Event]], Any],
+                 max_size: int, max_wait_ms: float):
+        self.event_type = event_type
+        self.handler = handler
+        self.max_size = max(1, max_size)
+        self.max_wait = max_wait_ms / 1000
+        self.buffer: List[Event] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    @property
+    def lock(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    def cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
 
 class EventBus:
-    """Production-ready event bus with async support."""
+    """Production-ready event bus with async support.
+
+    `start()` runs a pool of `workers` consumers. With `ordering="none"` they
+    share one queue; with `"event_type"` or `"key"` each worker owns a queue
+    and events are routed by hashing their ordering key, so events with the
+    same key are handled in publish order while different keys run in
+    parallel. The default key is the event's `workspace_id`.
+
+    Queues are bounded by `max_queue_size` (split across worker queues); when
+    full, `publish` either waits (`"block"`) or discards the oldest queued
+    event (`"drop_oldest"`). Sync handlers run in a thread pool so they never
+    block the event loop.
+
+    With a transport set (see `events/transport.py`), published events are
+    also sent to the buses of other worker processes, and events received
+    from them are queued here without being sent on again.
+
+    With an event log set (see `events/log.py`), every event published here
+    is appended to this worker's log (on the log's writer thread) before
+    dispatch. Each worker logs only its own events, so the log does not
+    depend on the transport; `replay()` merges every worker's log back into
+    the full history, e.g. to rebuild derived state for a new subscriber.
+    """
     
-    def __init__(self):
+    def __init__(self, workers: int = EVENT_BUS_WORKERS,
+                 max_queue_size: int = EVENT_BUS_MAX_QUEUE_SIZE,
+                 overflow: str = EVENT_BUS_OVERFLOW,
+                 ordering: str = EVENT_BUS_ORDERING,
+                 key_func: Optional[Callable[[Event], Any]] = None,
+                 executor: Optional[Executor] = None):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        if ordering not in ORDERING_MODES:
+            raise ValueError(f"Unknown ordering mode: {ordering}")
         self._handlers: Dict[EventType, List[Callable]] = {}
+        self._batch_handlers: Dict[EventType, List[BatchSubscription]] = {}
+        self._flush_tasks: Set[asyncio.Task] = set()
         self._middleware: List[Callable] = []
-        self._queue: asyncio.Queue = asyncio.Queue()
         self._running = False
+        self.workers = max(1, workers)
+        self.overflow = overflow
+        self.ordering = ordering
+        self.key_func = key_func or (
+            _event_type_key if ordering == "event_type" else _workspace_key
+        )
+        shards = 1 if ordering == "none" else self.workers
+        maxsize = max(1, max_queue_size // shards) if max_queue_size > 0 else 0
+        self._queues: List[asyncio.Queue] = [asyncio.Queue(maxsize=maxsize) for _ in range(shards)]
+        self._tasks: List[asyncio.Task] = []
+        self._executor = executor
+        self.transport: Optional["EventTransport"] = None
+        self.event_log: Optional["EventLog"] = None
         
     def subscribe(self, event_type: EventType, handler: Callable) -> None:
         """Subscribe to an event type."""
@@ -48,6 +132,21 @@ class EventBus:
         self._handlers[event_type].append(handler)
         logger.info(f"Handler subscribed to {event_type.value}")
         
+    def subscribe_batch(self, event_type: EventType, handler: Callable[[List[Event]], Any],
+                        max_size: int = 100, max_wait_ms: float = 50) -> BatchSubscription:
+        """Subscribe a handler that receives lists of events.
+
+        A batch is delivered once `max_size` events are buffered or `max_wait_ms`
+        after its first event, whichever comes first; `stop()` delivers any
+        partial batches before returning. Batches for one subscription are
+        delivered one at a time, in order.
+        """
+        subscription = BatchSubscription(event_type, handler, max_size, max_wait_ms)
+        self._batch_handlers.setdefault(event_type, []).append(subscription)
+        logger.info(f"Batch handler subscribed to {event_type.value} "
+                    f"(max_size={subscription.max_size}, max_wait_ms={max_wait_ms})")
+        return subscription
+
     def unsubscribe(self, event_type: EventType, handler: Callable) -> None:
         """Unsubscribe from an event type."""
         if event_type in self._handlers:
@@ -57,21 +156,53 @@ class EventBus:
             except ValueError:
                 logger.warning(f"Handler not found for {event_type.value}")
                 
+    def set_transport(self, transport: Optional["EventTransport"]) -> None:
+        """Fan published events out to other processes through `transport`."""
+        self.transport = transport
+
+    def set_event_log(self, event_log: Optional["EventLog"]) -> None:
+        """Append every event published on this bus to `event_log` before dispatch."""
+        self.event_log = event_log
+
+    def replay(self, event_types: Iterable[EventType] = None, since: float = 0.0
+               ) -> Iterator[Tuple[str, int, Event]]:
+        """Yield `(worker_log, offset, event)` from the logs of every worker, oldest first."""
+        if self.event_log is None:
+            raise RuntimeError("Event bus has no event log to replay")
+        from ideahub_platform.events.log import replay_all
+        return replay_all(os.path.dirname(self.event_log.directory), event_types, since)
+
     def add_middleware(self, middleware: Callable) -> None:
-        """Add middleware to the event bus."""
+        """Add middleware to the event bus.
+
+        Middleware is awaited with each published or received event and returns
+        the event to continue with, or None to drop it.
+        """
         self._middleware.append(middleware)
         logger.info("Middleware added to event bus")
+
+    @property
+    def queue_depth(self) -> int:
+        """Events waiting across all worker queues."""
+        return sum(queue.qsize() for queue in self._queues)
         
     async def publish(self, event: Event) -> None:
         """Publish an event asynchronously."""
         try:
-            # Apply middleware
-            for middleware in self._middleware:
-                event = await middleware(event)
+            if event.event_id is None:
+                event.event_id = uuid.uuid4().hex
+            event = await self._apply_middleware(event)
+            if event is None:
+                return
                 
+            if self.event_log is not None:
+                await self.event_log.append_async(event)
             # Add to queue for processing
-            await self._queue.put(event)
-            logger.info(f"Event published: {event.event_type.value}")
+            await self._enqueue(self._queue_for(event), event)
+            EVENT_QUEUE_DEPTH.set(self.queue_depth)
+            if self.transport is not None:
+                await self.transport.send(event)
+            logger.debug(f"Event published: {event.event_type.value}")
             
         except Exception as e:
             logger.error(f"Error publishing event: {e}", exc_info=True)
@@ -79,12 +210,20 @@ class EventBus:
     def publish_sync(self, event: Event) -> None:
         """Publish an event synchronously."""
         try:
+            if event.event_id is None:
+                event.event_id = uuid.uuid4().hex
             if event.event_type in self._handlers:
                 for handler in self._handlers[event.event_type]:
                     try:
                         handler(event)
                     except Exception as e:
                         logger.error(f"Handler error for {event.event_type.value}: {e}", exc_info=True)
+            # No loop to buffer on: batch handlers get a batch of one
+            for subscription in self._batch_handlers.get(event.event_type, ()):
+                try:
+                    subscription.handler([event])
+                except Exception as e:
+                    logger.error(f"Batch handler error for {event.event_type.value}: {e}", exc_info=True)
                         
             logger.info(f"Event published synchronously: {event.event_type.value}")
             
@@ -92,36 +231,167 @@ class EventBus:
             logger.error(f"Error publishing event synchronously: {e}", exc_info=True)
             
     async def start(self) -> None:
-        """Start the event bus processing."""
+        """Start the worker pool and process events until `stop()` is called."""
         self._running = True
-        logger.info("Event bus started")
-        
-        while self._running:
-            try:
-                event = await asyncio.wait_for(self._queue.get(), timeout=1.0)
-                await self._process_event(event)
-            except asyncio.TimeoutError:
-                continue
-            except Exception as e:
-                logger.error(f"Error in event bus processing: {e}", exc_info=True)
+        if len(self._queues) == 1:
+            queues = [self._queues[0]] * self.workers
+        else:
+            queues = self._queues
+        self._tasks = [
+            asyncio.create_task(self._worker(queue), name=f"event-bus-worker-{i}")
+            for i, queue in enumerate(queues)
+        ]
+        if self.transport is not None:
+            await self.transport.start(self._receive_remote)
+        logger.info(f"Event bus started with {self.workers} workers "
+                    f"(ordering={self.ordering}, overflow={self.overflow})")
+        await asyncio.gather(*self._tasks, return_exceptions=True)
                 
     async def stop(self) -> None:
-        """Stop the event bus processing."""
+        """Stop the event bus once queued events and partial batches have been processed."""
         self._running = False
+        if self.transport is not None:
+            await self.transport.stop()
+        tasks, self._tasks = self._tasks, []
+        if tasks:
+            # One sentinel per worker, queued behind pending events
+            if len(self._queues) == 1:
+                for _ in tasks:
+                    await self._queues[0].put(_STOP)
+            else:
+                for queue in self._queues:
+                    await queue.put(_STOP)
+            await asyncio.gather(*tasks, return_exceptions=True)
+        await self.flush_batches()
+        EVENT_QUEUE_DEPTH.set(self.queue_depth)
         logger.info("Event bus stopped")
+
+    async def flush_batches(self) -> None:
+        """Deliver every buffered batch now, including timer flushes in flight."""
+        for subscriptions in self._batch_handlers.values():
+            for subscription in subscriptions:
+                await self._flush_batch(subscription)
+        if self._flush_tasks:
+            await asyncio.gather(*list(self._flush_tasks), return_exceptions=True)
+
+    async def _receive_remote(self, event: Event) -> None:
+        """Queue an event published by another process (which logged it already)."""
+        event = await self._apply_middleware(event)
+        if event is None:
+            return
+        await self._enqueue(self._queue_for(event), event)
+        EVENT_QUEUE_DEPTH.set(self.queue_depth)
+
+    async def _apply_middleware(self, event: Event) -> Optional[Event]:
+        for middleware in self._middleware:
+            event = await middleware(event)
+            if event is None:
+                return None
+        return event
+
+    def _queue_for(self, event: Event) -> asyncio.Queue:
+        if len(self._queues) == 1:
+            return self._queues[0]
+        return self._queues[hash(self.key_func(event)) % len(self._queues)]
+
+    async def _enqueue(self, queue: asyncio.Queue, event: Event) -> None:
+        if self.overflow == "drop_oldest":
+            # Stop sentinels are set aside and re-queued last: a worker must never miss its _STOP
+            stops = 0
+            while queue.qsize() + stops >= queue.maxsize > 0 and not queue.empty():
+                dropped = queue.get_nowait()
+                queue.task_done()
+                if dropped is _STOP:
+                    stops += 1
+                else:
+                    self._dropped(dropped)
+            if queue.qsize() + stops < queue.maxsize or queue.maxsize <= 0:
+                queue.put_nowait(event)
+            else:
+                # Only sentinels left: the bus is stopping, the new event goes
+                self._dropped(event)
+            for _ in range(stops):
+                queue.put_nowait(_STOP)
+        else:
+            await queue.put(event)
+
+    def _dropped(self, event: Event) -> None:
+        EVENT_DROPPED.labels(event.event_type.value).inc()
+        logger.warning(f"Event queue full, dropped {event.event_type.value}")
+
+    async def _worker(self, queue: asyncio.Queue) -> None:
+        while True:
+            event = await queue.get()
+            try:
+                if event is _STOP:
+                    return
+                EVENT_QUEUE_DEPTH.set(self.queue_depth)
+                await self._process_event(event)
+            except Exception as e:
+                logger.error(f"Error in event bus processing: {e}", exc_info=True)
+            finally:
+                queue.task_done()
+
+    async def _call_handler(self, handler: Callable, event: Any) -> None:
+        if asyncio.iscoroutinefunction(handler):
+            await handler(event)
+        else:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=EVENT_BUS_HANDLER_THREADS, thread_name_prefix="event-handler"
+                )
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._executor, handler, event)
         
+    async def _add_to_batch(self, subscription: BatchSubscription, event: Event) -> None:
+        subscription.buffer.append(event)
+        if len(subscription.buffer) >= subscription.max_size:
+            await self._flush_batch(subscription)
+        elif subscription._timer is None:
+            subscription._timer = asyncio.get_running_loop().call_later(
+                subscription.max_wait, self._schedule_flush, subscription
+            )
+
+    def _schedule_flush(self, subscription: BatchSubscription) -> None:
+        subscription._timer = None
+        task = asyncio.create_task(self._flush_batch(subscription))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush_batch(self, subscription: BatchSubscription) -> None:
+        async with subscription.lock:
+            subscription.cancel_timer()
+            batch, subscription.buffer = subscription.buffer, []
+            if not batch:
+                return
+            event_type = subscription.event_type.value
+            EVENT_BATCH_SIZE.labels(event_type).observe(len(batch))
+            started = time.perf_counter()
+            try:
+                await self._call_handler(subscription.handler, batch)
+            except Exception as e:
+                logger.error(f"Batch handler error for {event_type}: {e}", exc_info=True)
+            finally:
+                EVENT_HANDLER_DURATION.labels(
+                    event_type, handler_name(subscription.handler)
+                ).observe(time.perf_counter() - started)
+
     async def _process_event(self, event: Event) -> None:
         """Process a single event."""
         try:
             if event.event_type in self._handlers:
-                for handler in self._handlers[event.event_type]:
+                for handler in list(self._handlers[event.event_type]):
+                    started = time.perf_counter()
                     try:
-                        if asyncio.iscoroutinefunction(handler):
-                            await handler(event)
-                        else:
-                            handler(event)
+                        await self._call_handler(handler, event)
                     except Exception as e:
                         logger.error(f"Handler error for {event.event_type.value}: {e}", exc_info=True)
+                    finally:
+                        EVENT_HANDLER_DURATION.labels(
+                            event.event_type.value, handler_name(handler)
+                        ).observe(time.perf_counter() - started)
+            for subscription in self._batch_handlers.get(event.event_type, ()):
+                await self._add_to_batch(subscription, event)
                         
         except Exception as e:
             logger.error(f"Error processing event: {e}", exc_info=True)
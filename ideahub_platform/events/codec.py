@@ -0,0 +1,258 @@
+# Versioned binary codec for event envelopes
+import json
+import struct
+from dataclasses import fields
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Tuple
+from ideahub_platform.events.event_types import (
+    CommunityEventData,
+    Event,
+    EventType,
+    IdeaEventData,
+    MemberEventData,
+    WorkspaceEventData,
+    payload_dict,
+)
+
+CODEC_VERSION = 1
+
+# Wire codes are part of the format: append new entries, never renumber
+EVENT_TYPE_CODES: Dict[EventType, int] = {
+    EventType.WORKSPACE_CREATED: 1,
+    EventType.WORKSPACE_UPDATED: 2,
+    EventType.WORKSPACE_DELETED: 3,
+    EventType.COMMUNITY_CREATED: 4,
+    EventType.COMMUNITY_UPDATED: 5,
+    EventType.COMMUNITY_DELETED: 6,
+    EventType.IDEA_CREATED: 7,
+    EventType.IDEA_UPDATED: 8,
+    EventType.IDEA_DELETED: 9,
+    EventType.IDEA_VOTED: 10,
+    EventType.IDEA_COMMENTED: 11,
+    EventType.MEMBER_JOINED: 12,
+    EventType.MEMBER_LEFT: 13,
+    EventType.MEMBER_ROLE_CHANGED: 14,
+    EventType.CAMPAIGN_CREATED: 15,
+    EventType.CAMPAIGN_UPDATED: 16,
+    EventType.CAMPAIGN_DELETED: 17,
+    EventType.CAMPAIGN_STARTED: 18,
+    EventType.CAMPAIGN_ENDED: 19,
+}
+PAYLOAD_SCHEMA_IDS: Dict[type, int] = {
+    WorkspaceEventData: 1,
+    CommunityEventData: 2,
+    IdeaEventData: 3,
+    MemberEventData: 4,
+}
+_EVENT_TYPES = {code: event_type for event_type, code in EVENT_TYPE_CODES.items()}
+
+# version, event type code, flags, timestamp
+_ENVELOPE = struct.Struct("<BBBd")
+_STR_LEN = struct.Struct("<I")
+_FLAG_EVENT_ID = 1
+_FLAG_CORRELATION_ID = 2
+_FLAG_USER_ID = 4
+_FLAG_TYPED = 8
+
+_FIXED_FORMATS = {int: "q", float: "d", bool: "?", datetime: "d"}
+
+# Tags used by the JSON payload form (see `payload_to_json`)
+_JSON_SCHEMA_TAG = "$schema"
+_JSON_DATETIME_TAG = "$dt"
+
+
+class EventCodecError(ValueError):
+    """A payload could not be encoded or decoded."""
+
+
+def _datetime_out(value: datetime) -> float:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _datetime_in(value: float) -> datetime:
+    return datetime.fromtimestamp(value, tz=timezone.utc)
+
+
+class _Schema:
+    """Encoder for one payload dataclass.
+
+    One struct holds the fixed-width fields followed by the byte length of
+    each string field; the UTF-8 strings follow it back to back.
+    """
+
+    def __init__(self, schema_id: int, cls: type):
+        self.schema_id = schema_id
+        self.cls = cls
+        fixed: List[Tuple[str, Any, Any]] = []
+        strings: List[str] = []
+        formats = ["<"]
+        for f in fields(cls):
+            if f.type is str:
+                strings.append(f.name)
+            elif f.type in _FIXED_FORMATS:
+                formats.append(_FIXED_FORMATS[f.type])
+                if f.type is datetime:
+                    fixed.append((f.name, _datetime_out, _datetime_in))
+                else:
+                    fixed.append((f.name, None, None))
+            else:
+                raise TypeError(f"Unsupported payload field type {f.type!r} on {cls.__name__}")
+        formats.append("I" * len(strings))
+        self.struct = struct.Struct("".join(formats))
+        self.fixed = fixed
+        self.strings = strings
+        self.fixed_count = len(fixed)
+        self.converts = any(out for _, out, _ in fixed)
+        # Position of each constructor argument in (fixed values + strings)
+        slots = [name for name, _, _ in fixed] + strings
+        self.order = [slots.index(f.name) for f in fields(cls)]
+
+    def encode(self, data: Any, parts: List[bytes]) -> None:
+        values = [getattr(data, name) for name, _, _ in self.fixed]
+        if self.converts:
+            values = [out(v) if out else v for v, (_, out, _) in zip(values, self.fixed)]
+        raw = [getattr(data, name).encode() for name in self.strings]
+        parts.append(self.struct.pack(*values, *map(len, raw)))
+        parts.extend(raw)
+
+    def decode(self, buf: bytes, pos: int) -> Tuple[Any, int]:
+        header = self.struct.unpack_from(buf, pos)
+        pos += self.struct.size
+        values = list(header[:self.fixed_count])
+        if self.converts:
+            values = [convert_in(v) if convert_in else v
+                      for v, (_, _, convert_in) in zip(values, self.fixed)]
+        for size in header[self.fixed_count:]:
+            values.append(bytes(buf[pos:pos + size]).decode())
+            pos += size
+        return self.cls(*[values[i] for i in self.order]), pos
+
+
+_SCHEMAS_BY_CLASS: Dict[type, _Schema] = {
+    cls: _Schema(schema_id, cls) for cls, schema_id in PAYLOAD_SCHEMA_IDS.items()
+}
+_SCHEMAS_BY_ID: Dict[int, _Schema] = {s.schema_id: s for s in _SCHEMAS_BY_CLASS.values()}
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {_JSON_DATETIME_TAG: value.isoformat()}
+    if isinstance(value, dict):
+        return {key: _json_value(v) for key, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_value(v) for v in value]
+    return value
+
+
+def _python_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if len(value) == 1 and _JSON_DATETIME_TAG in value:
+            return datetime.fromisoformat(value[_JSON_DATETIME_TAG])
+        return {key: _python_value(v) for key, v in value.items()}
+    if isinstance(value, list):
+        return [_python_value(v) for v in value]
+    return value
+
+
+def payload_to_json(data: Any) -> Dict[str, Any]:
+    """A payload as JSON-safe values, for JSON columns such as the outbox.
+
+    Datetimes become `{"$dt": isoformat}` and typed payloads carry their
+    schema id under `"$schema"`; `payload_from_json` reverses both.
+    """
+    payload = _json_value(payload_dict(data))
+    schema = _SCHEMAS_BY_CLASS.get(type(data))
+    if schema is not None:
+        payload[_JSON_SCHEMA_TAG] = schema.schema_id
+    return payload
+
+
+def payload_from_json(payload: Dict[str, Any]) -> Any:
+    """Decode a payload stored by `payload_to_json`."""
+    try:
+        data = _python_value(payload)
+        schema_id = data.pop(_JSON_SCHEMA_TAG, None)
+    except (AttributeError, TypeError, ValueError) as e:
+        raise EventCodecError(f"Undecodable JSON payload: {e}")
+    if schema_id is None:
+        return data
+    schema = _SCHEMAS_BY_ID.get(schema_id)
+    if schema is None:
+        raise EventCodecError(f"Unknown payload schema {schema_id}")
+    try:
+        return schema.cls(**data)
+    except TypeError as e:
+        raise EventCodecError(f"Payload does not match {schema.cls.__name__}: {e}")
+
+
+def encode(event: Event) -> bytes:
+    """Encode an event envelope.
+
+    Layout (little-endian): version u8, event type code u8, flags u8,
+    timestamp f64; the optional ids as u32-length-prefixed UTF-8; then either
+    a typed payload (schema id u8, fixed-width fields and string lengths,
+    strings) or a free-form dict payload as compact JSON.
+    """
+    flags = 0
+    parts: List[bytes] = [b""]
+    for flag, value in ((_FLAG_EVENT_ID, event.event_id),
+                        (_FLAG_CORRELATION_ID, event.correlation_id),
+                        (_FLAG_USER_ID, event.user_id)):
+        if value is not None:
+            flags |= flag
+            raw = str(value).encode()
+            parts.append(_STR_LEN.pack(len(raw)))
+            parts.append(raw)
+
+    data = event.data
+    schema = _SCHEMAS_BY_CLASS.get(type(data))
+    if schema is not None:
+        flags |= _FLAG_TYPED
+        parts.append(bytes((schema.schema_id,)))
+        schema.encode(data, parts)
+    else:
+        try:
+            parts.append(json.dumps(data, separators=(",", ":"), default=str).encode())
+        except (TypeError, ValueError) as e:
+            raise EventCodecError(f"Unencodable payload for {event.event_type.value}: {e}")
+
+    try:
+        type_code = EVENT_TYPE_CODES[event.event_type]
+    except KeyError:
+        raise EventCodecError(f"No wire code for event type {event.event_type.value}")
+    parts[0] = _ENVELOPE.pack(CODEC_VERSION, type_code, flags, event.timestamp)
+    return b"".join(parts)
+
+
+def decode(buf: bytes) -> Event:
+    """Decode bytes produced by `encode`."""
+    version, type_code, flags, timestamp = _ENVELOPE.unpack_from(buf, 0)
+    if version != CODEC_VERSION:
+        raise EventCodecError(f"Unsupported event codec version {version}")
+    pos = _ENVELOPE.size
+    ids = [None, None, None]
+    for i, flag in enumerate((_FLAG_EVENT_ID, _FLAG_CORRELATION_ID, _FLAG_USER_ID)):
+        if flags & flag:
+            (size,) = _STR_LEN.unpack_from(buf, pos)
+            pos += _STR_LEN.size
+            ids[i] = bytes(buf[pos:pos + size]).decode()
+            pos += size
+
+    if flags & _FLAG_TYPED:
+        schema = _SCHEMAS_BY_ID.get(buf[pos])
+        if schema is None:
+            raise EventCodecError(f"Unknown payload schema {buf[pos]}")
+        data, pos = schema.decode(buf, pos + 1)
+    else:
+        data = json.loads(bytes(buf[pos:]))
+
+    return Event(
+        event_type=_EVENT_TYPES[type_code],
+        data=data,
+        timestamp=timestamp,
+        event_id=ids[0],
+        correlation_id=ids[1],
+        user_id=ids[2],
+    )
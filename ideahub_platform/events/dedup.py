@@ -0,0 +1,87 @@
+# Consumer-side event deduplication by event_id
+import asyncio
+import functools
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional
+from ideahub_platform.common.metrics import EVENT_DEDUP_HITS, handler_name
+from ideahub_platform.events.event_types import Event
+
+# Deduplication window configuration
+EVENT_DEDUP_WINDOW_SECONDS = float(os.getenv("EVENT_DEDUP_WINDOW_SECONDS", "300"))
+EVENT_DEDUP_MAX_ENTRIES = int(os.getenv("EVENT_DEDUP_MAX_ENTRIES", "100000"))
+
+
+class EventDeduplicator:
+    """Remembers recently seen event ids for a bounded time window.
+
+    Ids live in an insertion-ordered dict, so lookups are O(1) and expiry
+    only ever pops from the front; at most `max_entries` ids are kept, the
+    oldest being forgotten first. A redelivery after the window (or after
+    its id was evicted) is treated as new. Events without an id pass through.
+
+    Use an instance as bus-wide middleware (`bus.add_middleware(dedup)`) or
+    wrap individual subscribers with `dedup.wrap(handler)`, each wrapper
+    keeping its own window.
+    """
+
+    def __init__(self, window_seconds: float = EVENT_DEDUP_WINDOW_SECONDS,
+                 max_entries: int = EVENT_DEDUP_MAX_ENTRIES, consumer: str = "bus",
+                 clock: Callable[[], float] = time.monotonic):
+        self.window_seconds = window_seconds
+        self.max_entries = max_entries
+        self.consumer = consumer
+        self.clock = clock
+        self._seen: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def is_duplicate(self, event: Event) -> bool:
+        """Record the event's id; True if it was already seen within the window."""
+        event_id = event.event_id
+        if event_id is None:
+            return False
+        now = self.clock()
+        with self._lock:
+            seen = self._seen
+            expires = seen.get(event_id)
+            if expires is not None and expires > now:
+                duplicate = True
+            else:
+                duplicate = False
+                if expires is not None:
+                    del seen[event_id]
+                seen[event_id] = now + self.window_seconds
+            # Drop expired ids from the front, then enforce the size bound
+            while seen:
+                oldest = next(iter(seen))
+                if seen[oldest] > now and len(seen) <= self.max_entries:
+                    break
+                del seen[oldest]
+        if duplicate:
+            EVENT_DEDUP_HITS.labels(event.event_type.value, self.consumer).inc()
+        return duplicate
+
+    async def __call__(self, event: Event) -> Optional[Event]:
+        """Event bus middleware: drop events whose id was already seen."""
+        return None if self.is_duplicate(event) else event
+
+    def wrap(self, handler: Callable) -> Callable:
+        """A subscriber that ignores redelivered events, with its own window."""
+        dedup = EventDeduplicator(self.window_seconds, self.max_entries,
+                                  consumer=handler_name(handler), clock=self.clock)
+
+        if asyncio.iscoroutinefunction(handler):
+            @functools.wraps(handler)
+            async def deduplicated(event: Event):
+                if not dedup.is_duplicate(event):
+                    return await handler(event)
+        else:
+            @functools.wraps(handler)
+            def deduplicated(event: Event):
+                if not dedup.is_duplicate(event):
+                    return handler(event)
+        return deduplicated
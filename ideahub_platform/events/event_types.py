@@ -1,8 +1,9 @@
 # Event type definitions
+import time
 from enum import Enum
-from typing import Dict, Any
-from dataclasses import dataclass
-from datetime import datetime
+from typing import Any, Dict, Optional, Union
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timezone
 
 class EventType(Enum):
     """Application event types."""
@@ -35,25 +36,8 @@ class EventType(Enum):
     CAMPAIGN_STARTED = "campaign.started"
     CAMPAIGN_ENDED = "campaign.ended"
 
-@dataclass
-class EventMetadata:
-    """Event metadata for tracking and auditing."""
-    event_id: str
-    correlation_id: str
-    user_id: str
-    timestamp: datetime
-    source: str = "ideahub-api"
-    version: str = "1.0"
-
-@dataclass
-class BaseEvent:
-    """Base event structure."""
-    event_type: EventType
-    data: Dict[str, Any]
-    metadata: EventMetadata
-
-# Event data schemas
-@dataclass
+# Event payload schemas (slotted, immutable; encoded field-by-field by events/codec.py)
+@dataclass(frozen=True, slots=True)
 class WorkspaceEventData:
     """Workspace event data."""
     workspace_id: int
@@ -61,7 +45,7 @@ class WorkspaceEventData:
     owner_id: int
     public_default: bool
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CommunityEventData:
     """Community event data."""
     community_id: int
@@ -69,7 +53,7 @@ class CommunityEventData:
     community_name: str
     public: bool
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IdeaEventData:
     """Idea event data."""
     idea_id: int
@@ -78,10 +62,37 @@ class IdeaEventData:
     title: str
     visibility: str
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MemberEventData:
     """Member event data."""
     member_id: int
     workspace_id: int
     role: str
     joined_at: datetime
+
+EventData = Union[WorkspaceEventData, CommunityEventData, IdeaEventData, MemberEventData]
+
+def payload_dict(data: Union[Dict[str, Any], EventData]) -> Dict[str, Any]:
+    """Payload as a plain dict, whether it is free-form or a typed schema."""
+    if isinstance(data, dict):
+        return data
+    return {f.name: getattr(data, f.name) for f in fields(data)}
+
+@dataclass(slots=True)
+class Event:
+    """Domain event envelope.
+
+    `data` is a typed payload (e.g. `IdeaEventData`) or a free-form dict;
+    `timestamp` is seconds since the epoch (UTC), see `created_at`.
+    """
+    event_type: EventType
+    data: Union[Dict[str, Any], EventData]
+    timestamp: float = field(default_factory=time.time)
+    event_id: Optional[str] = None
+    correlation_id: Optional[str] = None
+    user_id: Optional[str] = None
+
+    @property
+    def created_at(self) -> datetime:
+        """The event timestamp as an aware UTC datetime."""
+        return datetime.fromtimestamp(self.timestamp, tz=timezone.utc)
@@ -0,0 +1,331 @@
+# Durable, append-only event log for the event bus
+import asyncio
+import fcntl
+import heapq
+import itertools
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Tuple
+from ideahub_platform.common.metrics import EVENT_LOG_APPENDS
+from ideahub_platform.events import codec
+from ideahub_platform.events.event_types import Event
+
+logger = logging.getLogger(__name__)
+
+# Event log configuration (EVENT_LOG_DIR empty disables the log)
+EVENT_LOG_DIR = os.getenv("EVENT_LOG_DIR", "")
+EVENT_LOG_SEGMENT_BYTES = int(os.getenv("EVENT_LOG_SEGMENT_BYTES", str(64 * 1024 * 1024)))
+EVENT_LOG_FSYNC_INTERVAL = float(os.getenv("EVENT_LOG_FSYNC_INTERVAL", "1.0"))
+EVENT_LOG_RETENTION_BYTES = int(os.getenv("EVENT_LOG_RETENTION_BYTES", str(1024 * 1024 * 1024)))
+EVENT_LOG_RETENTION_HOURS = float(os.getenv("EVENT_LOG_RETENTION_HOURS", "168"))
+
+# Record: payload length, CRC32 of type + payload, event type length, type, payload
+_HEADER = struct.Struct("<IIB")
+_SEGMENT_SUFFIX = ".log"
+_LOCK_FILE = "LOCK"
+# Each worker process owns one log under EVENT_LOG_DIR
+_WORKER_PREFIX = "worker-"
+
+
+class EventLogLockedError(RuntimeError):
+    """Another process already owns the event log directory."""
+
+
+def _segment_name(base_offset: int) -> str:
+    return f"{base_offset:020d}{_SEGMENT_SUFFIX}"
+
+
+def _scan(buf, limit: int) -> Iterator[Tuple[int, bytes, int, int]]:
+    """Yield `(position, event_type, payload_start, payload_end)` for each record."""
+    pos = 0
+    header_size = _HEADER.size
+    while pos + header_size <= limit:
+        length, _, type_length = _HEADER.unpack_from(buf, pos)
+        if length == 0 and type_length == 0:
+            return
+        type_start = pos + header_size
+        payload_start = type_start + type_length
+        end = payload_start + length
+        if end > limit:
+            return
+        yield pos, bytes(buf[type_start:payload_start]), payload_start, end
+        pos = end
+
+
+def _valid(buf, pos: int, event_type: bytes, start: int, end: int) -> bool:
+    _, crc, _ = _HEADER.unpack_from(buf, pos)
+    return zlib.crc32(buf[start:end], zlib.crc32(event_type)) == crc
+
+
+class EventLogReader:
+    """Read-only access to the segments of an event log directory.
+
+    Used for the logs of other workers, which may be appending concurrently:
+    reading stops at the first incomplete record (failed CRC).
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def replay(self, from_offset: int = 0, event_types: Iterable = None
+               ) -> Iterator[Tuple[int, Event]]:
+        """Yield `(offset, event)` for logged events from `from_offset` on.
+
+        `event_types` filters on the raw record header, so skipped events are
+        never decoded.
+        """
+        wanted = None
+        if event_types is not None:
+            wanted = {getattr(t, "value", t).encode() for t in event_types}
+        segments = self._segments()
+        for i, base in enumerate(segments):
+            following = segments[i + 1] if i + 1 < len(segments) else None
+            if following is not None and following <= from_offset:
+                continue
+            offset = base
+            for event_type, payload in self._read_segment(base):
+                if offset >= from_offset and (wanted is None or event_type in wanted):
+                    yield offset, codec.decode(payload)
+                offset += 1
+
+    def _segments(self) -> List[int]:
+        return sorted(
+            int(name[:-len(_SEGMENT_SUFFIX)]) for name in os.listdir(self.directory)
+            if name.endswith(_SEGMENT_SUFFIX)
+        )
+
+    def _path(self, base_offset: int) -> str:
+        return os.path.join(self.directory, _segment_name(base_offset))
+
+    def _read_limit(self, base: int) -> Optional[int]:
+        """Bytes of a segment known to hold complete records, or None to verify CRCs."""
+        return None
+
+    def _read_segment(self, base: int) -> Iterator[Tuple[bytes, bytes]]:
+        limit = self._read_limit(base)
+        try:
+            with open(self._path(base), "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0 or limit == 0:
+                    return
+                buf = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            # Removed by retention while replaying
+            return
+        try:
+            for pos, event_type, start, end in _scan(buf, size if limit is None else limit):
+                if limit is None and not _valid(buf, pos, event_type, start, end):
+                    return
+                yield event_type, buf[start:end]
+        finally:
+            buf.close()
+
+
+class EventLog(EventLogReader):
+    """Segmented, memory-mapped append-only log of published events.
+
+    Each segment is preallocated to `segment_bytes` and mapped into memory;
+    appends copy a length-prefixed record into the map, and the map is
+    flushed to disk every `fsync_interval` seconds (and on rotation and
+    close). A record's offset is its sequence number across all segments;
+    segment files are named after the offset of their first record. Appends
+    from the event loop go through `append_async`, which runs them in order
+    on the log's own writer thread.
+
+    On open, the active segment is scanned and a torn or corrupt tail
+    (CRC mismatch) is discarded. Sealed segments are deleted oldest first
+    once the log exceeds `retention_bytes` or they are older than
+    `retention_seconds`.
+    """
+
+    def __init__(self, directory: str, segment_bytes: int = EVENT_LOG_SEGMENT_BYTES,
+                 fsync_interval: float = EVENT_LOG_FSYNC_INTERVAL,
+                 retention_bytes: int = EVENT_LOG_RETENTION_BYTES,
+                 retention_seconds: float = EVENT_LOG_RETENTION_HOURS * 3600):
+        super().__init__(directory)
+        self.segment_bytes = segment_bytes
+        self.fsync_interval = fsync_interval
+        self.retention_bytes = retention_bytes
+        self.retention_seconds = retention_seconds
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._lock_file = open(os.path.join(directory, _LOCK_FILE), "a")
+        try:
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            self._lock_file.close()
+            raise EventLogLockedError(f"Event log {directory} is in use by another process")
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        self._base_offset = 0
+        self._position = 0
+        self._last_sync = time.monotonic()
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._open_active()
+
+    @property
+    def next_offset(self) -> int:
+        """Offset the next appended event will get."""
+        return self._next_offset
+
+    def append(self, event: Event) -> int:
+        """Append an event and return its offset."""
+        event_type = event.event_type.value.encode()
+        payload = codec.encode(event)
+        record_size = _HEADER.size + len(event_type) + len(payload)
+        with self._lock:
+            if self._position + record_size > len(self._map):
+                self._rotate(record_size)
+            crc = zlib.crc32(payload, zlib.crc32(event_type))
+            pos = self._position
+            _HEADER.pack_into(self._map, pos, len(payload), crc, len(event_type))
+            start = pos + _HEADER.size
+            self._map[start:start + len(event_type)] = event_type
+            self._map[start + len(event_type):pos + record_size] = payload
+            self._position = pos + record_size
+            offset = self._next_offset
+            self._next_offset += 1
+            if time.monotonic() - self._last_sync >= self.fsync_interval:
+                self._sync()
+        EVENT_LOG_APPENDS.inc()
+        return offset
+
+    async def append_async(self, event: Event) -> int:
+        """`append` on the writer thread, so copies, rotation and flushes stay off the loop."""
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="event-log-writer")
+        return await asyncio.get_running_loop().run_in_executor(self._writer, self.append, event)
+
+    def flush(self) -> None:
+        """Flush appended records to disk."""
+        with self._lock:
+            self._sync()
+
+    def close(self) -> None:
+        """Flush and release the log."""
+        if self._writer is not None:
+            self._writer.shutdown(wait=True)
+            self._writer = None
+        with self._lock:
+            if self._map is not None:
+                self._sync()
+                self._map.close()
+                self._map = None
+                self._file.close()
+            fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+            self._lock_file.close()
+
+    def _read_limit(self, base: int) -> Optional[int]:
+        with self._lock:
+            # Our own active segment is read up to the last complete record
+            return self._position if base == self._base_offset else None
+
+    def _open_active(self) -> None:
+        segments = self._segments()
+        if not segments:
+            self._create_segment(0, self.segment_bytes)
+            self._next_offset = 0
+            return
+        base = segments[-1]
+        self._file = open(self._path(base), "r+b")
+        size = os.fstat(self._file.fileno()).st_size
+        if size < self.segment_bytes:
+            self._file.truncate(self.segment_bytes)
+            size = self.segment_bytes
+        self._map = mmap.mmap(self._file.fileno(), size)
+        self._base_offset = base
+        position, count = 0, 0
+        for pos, event_type, start, end in _scan(self._map, size):
+            if not _valid(self._map, pos, event_type, start, end):
+                logger.warning(f"Discarding corrupt event log tail at {_segment_name(base)}:{pos}")
+                break
+            position, count = end, count + 1
+        # Zero the discarded tail so a later scan stops at the last good record
+        self._map[position:size] = bytes(size - position)
+        self._position = position
+        self._next_offset = base + count
+
+    def _create_segment(self, base_offset: int, size: int) -> None:
+        self._file = open(self._path(base_offset), "w+b")
+        self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), size)
+        self._base_offset = base_offset
+        self._position = 0
+
+    def _rotate(self, record_size: int) -> None:
+        """Seal the active segment at its used size and start a new one."""
+        self._map.flush()
+        self._map.close()
+        self._file.truncate(self._position)
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._create_segment(self._next_offset, max(self.segment_bytes, record_size))
+        self._last_sync = time.monotonic()
+        self._apply_retention()
+
+    def _sync(self) -> None:
+        self._map.flush()
+        self._last_sync = time.monotonic()
+
+    def _apply_retention(self) -> None:
+        sealed = [base for base in self._segments() if base != self._base_offset]
+        sizes = {base: os.path.getsize(self._path(base)) for base in sealed}
+        total = sum(sizes.values()) + self._position
+        cutoff = time.time() - self.retention_seconds
+        for base in sealed:
+            path = self._path(base)
+            if total <= self.retention_bytes and os.path.getmtime(path) >= cutoff:
+                break
+            os.remove(path)
+            total -= sizes[base]
+            logger.info(f"Event log segment {_segment_name(base)} removed by retention")
+
+
+def worker_logs(directory: str) -> List[str]:
+    """Names of the per-worker logs under `directory`."""
+    if not os.path.isdir(directory):
+        return []
+    return sorted(name for name in os.listdir(directory) if name.startswith(_WORKER_PREFIX))
+
+
+def replay_all(directory: str, event_types: Iterable = None, since: float = 0.0
+               ) -> Iterator[Tuple[str, int, Event]]:
+    """Yield `(worker_log, offset, event)` from every worker's log, merged by timestamp.
+
+    Each log holds the events its worker published, so together they are
+    the complete history; events older than `since` (epoch seconds) are
+    skipped.
+    """
+    event_types = list(event_types) if event_types is not None else None
+
+    def entries(name: str) -> Iterator[Tuple[float, str, int, Event]]:
+        for offset, event in EventLogReader(os.path.join(directory, name)).replay(0, event_types):
+            if event.timestamp >= since:
+                yield event.timestamp, name, offset, event
+
+    merged = heapq.merge(*(entries(name) for name in worker_logs(directory)),
+                         key=lambda entry: entry[0])
+    for _, name, offset, event in merged:
+        yield name, offset, event
+
+
+def open_event_log(directory: str = EVENT_LOG_DIR) -> Optional[EventLog]:
+    """Open this worker's log: the first `worker-N` log under `directory` no other process holds.
+
+    Returns None when the log is disabled.
+    """
+    if not directory:
+        return None
+    for n in itertools.count():
+        try:
+            event_log = EventLog(os.path.join(directory, f"{_WORKER_PREFIX}{n}"))
+        except EventLogLockedError:
+            continue
+        logger.info(f"Event log opened at {event_log.directory}")
+        return event_log
@@ -0,0 +1,188 @@
+# Transactional outbox: durable domain events relayed to the event bus
+import asyncio
+import logging
+import os
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Callable, List, Optional
+from sqlalchemy import case, func, select, update
+from sqlalchemy.orm import Session
+from ideahub_platform.common.metrics import OUTBOX_EVENTS_FAILED, OUTBOX_EVENTS_RELAYED, OUTBOX_RELAY_LAG
+from ideahub_platform.db.models.outbox import OutboxEvent
+from ideahub_platform.events.bus import EventBus
+from ideahub_platform.events.codec import payload_from_json, payload_to_json
+from ideahub_platform.events.event_types import Event, EventType
+
+logger = logging.getLogger(__name__)
+
+# Relay configuration
+OUTBOX_RELAY_ENABLED = os.getenv("OUTBOX_RELAY_ENABLED", "false").lower() == "true"
+OUTBOX_RELAY_BATCH_SIZE = int(os.getenv("OUTBOX_RELAY_BATCH_SIZE", "500"))
+OUTBOX_RELAY_POLL_INTERVAL = float(os.getenv("OUTBOX_RELAY_POLL_INTERVAL", "0.5"))
+
+_PENDING_COLUMNS = (
+    OutboxEvent.id,
+    OutboxEvent.event_type,
+    OutboxEvent.payload,
+    OutboxEvent.event_id,
+    OutboxEvent.correlation_id,
+    OutboxEvent.user_id,
+    OutboxEvent.created_at,
+)
+
+
+def add_to_outbox(session: Session, event: Event) -> OutboxEvent:
+    """Stage an event in the caller's session; it is relayed only if the session commits."""
+    row = OutboxEvent(
+        event_type=event.event_type.value,
+        payload=payload_to_json(event.data),
+        event_id=event.event_id or uuid.uuid4().hex,
+        correlation_id=event.correlation_id,
+        user_id=event.user_id,
+    )
+    session.add(row)
+    return row
+
+
+def _row_event(row) -> Event:
+    return Event(
+        event_type=EventType(row.event_type),
+        data=payload_from_json(row.payload),
+        timestamp=_as_utc(row.created_at).timestamp(),
+        event_id=row.event_id,
+        correlation_id=row.correlation_id,
+        user_id=row.user_id,
+    )
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+class OutboxRelay:
+    """Moves committed outbox rows onto the event bus in batches.
+
+    Each batch is claimed with `SELECT ... FOR UPDATE SKIP LOCKED`, so several
+    relays (one per worker process) can poll the same table without handing
+    out a row twice; rows are dispatched in id order and marked processed
+    with a single UPDATE in the claiming transaction. A crash between
+    dispatch and commit re-delivers the batch, so consumers should be
+    idempotent on `event_id`. A row that cannot be decoded (unknown event
+    type, bad payload) is dead-lettered by the same UPDATE, with `error`
+    set, instead of holding back the rows behind it.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] = None, bus: EventBus = None,
+                 batch_size: int = OUTBOX_RELAY_BATCH_SIZE,
+                 poll_interval: float = OUTBOX_RELAY_POLL_INTERVAL):
+        if session_factory is None:
+            from ideahub_platform.db.base import SessionLocal
+            session_factory = SessionLocal
+        if bus is None:
+            from ideahub_platform.events.bus import event_bus
+            bus = event_bus
+        self.session_factory = session_factory
+        self.bus = bus
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self._task: Optional[asyncio.Task] = None
+        self._stopping: Optional[asyncio.Event] = None
+
+    def relay_batch(self, dispatch: Callable[[List[Event]], None]) -> int:
+        """Claim, dispatch and mark one batch of pending rows (blocking).
+
+        Returns the number of rows claimed, dispatched or dead-lettered.
+        """
+        session = self.session_factory()
+        try:
+            rows = session.execute(
+                select(*_PENDING_COLUMNS)
+                .where(OutboxEvent.processed_at.is_(None))
+                .order_by(OutboxEvent.id)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            ).all()
+            if not rows:
+                session.rollback()
+                return 0
+
+            events, relayed, errors = [], [], {}
+            for row in rows:
+                try:
+                    events.append(_row_event(row))
+                    relayed.append(row)
+                except ValueError as e:  # unknown event type or EventCodecError
+                    logger.error(f"Dead-lettering outbox row {row.id} ({row.event_type}): {e}")
+                    errors[row.id] = f"{type(e).__name__}: {e}"[:255]
+            if events:
+                dispatch(events)
+            session.execute(
+                update(OutboxEvent)
+                .where(OutboxEvent.id.in_([row.id for row in rows]))
+                .values(
+                    processed_at=func.now(),
+                    error=case(errors, value=OutboxEvent.id, else_=None) if errors else None,
+                )
+            )
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+        now = datetime.now(timezone.utc)
+        for row in relayed:
+            created_at = _as_utc(row.created_at)
+            if created_at is not None:
+                OUTBOX_RELAY_LAG.observe(max((now - created_at).total_seconds(), 0.0))
+        OUTBOX_EVENTS_RELAYED.inc(len(relayed))
+        if errors:
+            OUTBOX_EVENTS_FAILED.inc(len(errors))
+        return len(rows)
+
+    async def start(self) -> None:
+        """Start polling the outbox in the background."""
+        if self._task is not None:
+            return
+        self._stopping = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Outbox relay started (batch_size={self.batch_size})")
+
+    async def stop(self) -> None:
+        """Stop polling after the batch in flight has been committed."""
+        task, self._task = self._task, None
+        if task is not None:
+            self._stopping.set()
+            await asyncio.gather(task, return_exceptions=True)
+            logger.info("Outbox relay stopped")
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        def dispatch(events: List[Event]) -> None:
+            # Runs in the relay thread; wait until the bus has accepted the batch
+            asyncio.run_coroutine_threadsafe(self._publish(events), loop).result()
+
+        while not self._stopping.is_set():
+            started = time.perf_counter()
+            try:
+                relayed = await asyncio.to_thread(self.relay_batch, dispatch)
+            except Exception as e:
+                logger.error(f"Outbox relay batch failed: {e}", exc_info=True)
+                relayed = 0
+            if relayed:
+                logger.debug(f"Relayed {relayed} outbox events in "
+                             f"{(time.perf_counter() - started) * 1000:.1f} ms")
+            if relayed < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def _publish(self, events: List[Event]) -> None:
+        for event in events:
+            await self.bus.publish(event)
@@ -0,0 +1,412 @@
+# Cross-process event transports for the event bus
+import asyncio
+import base64
+import logging
+import os
+import struct
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Awaitable, Callable, FrozenSet, Iterable, List, Optional, Set, Tuple
+from ideahub_platform.common.metrics import EVENT_TRANSPORT_MESSAGES, EVENT_TRANSPORT_RECONNECTS
+from ideahub_platform.events import codec
+from ideahub_platform.events.event_types import Event, EventType
+
+logger = logging.getLogger(__name__)
+
+# Transport configuration
+EVENT_TRANSPORT = os.getenv("EVENT_TRANSPORT", "none")
+EVENT_TRANSPORT_CHANNEL = os.getenv("EVENT_TRANSPORT_CHANNEL", "ideahub_events")
+EVENT_TRANSPORT_COALESCE_MS = float(os.getenv("EVENT_TRANSPORT_COALESCE_MS", "10"))
+# Event types (values, comma-separated) whose identical repeats may be merged;
+# only pure invalidations belong here, every other event is always sent
+EVENT_TRANSPORT_COALESCE_TYPES = frozenset(
+    EventType(value.strip())
+    for value in os.getenv("EVENT_TRANSPORT_COALESCE_TYPES", "").split(",")
+    if value.strip()
+)
+
+# NOTIFY payloads must stay below 8000 bytes
+PG_NOTIFY_MAX_BYTES = 7999
+# Backoff between attempts to reopen a lost LISTEN/NOTIFY connection (seconds)
+PG_RECONNECT_MIN_DELAY = 0.5
+PG_RECONNECT_MAX_DELAY = 30.0
+
+Deliver = Callable[[Event], Awaitable[None]]
+
+
+def encode_event(event: Event, origin: str) -> bytes:
+    """Binary-encode an event (see `events/codec.py`), prefixed with its origin."""
+    raw_origin = origin.encode()
+    return bytes((len(raw_origin),)) + raw_origin + codec.encode(event)
+
+
+def decode_event(payload: bytes) -> Tuple[str, Event]:
+    """Inverse of `encode_event`; returns `(origin, event)`."""
+    size = payload[0]
+    return payload[1:1 + size].decode(), codec.decode(payload[1 + size:])
+
+
+def coalesce_key(event: Event, coalesce_types: FrozenSet[EventType] = EVENT_TRANSPORT_COALESCE_TYPES
+                 ) -> Any:
+    """Key merging repeats of an opt-in invalidation event, or None to always send it."""
+    if event.event_type not in coalesce_types:
+        return None
+    data = event.data
+    try:
+        if isinstance(data, dict):
+            return (event.event_type, frozenset(data.items()))
+        return (event.event_type, hash(data), data)
+    except TypeError:
+        # Unhashable payloads are never coalesced
+        return None
+
+
+class EventTransport(ABC):
+    """Fans events out to the event buses of other worker processes.
+
+    Outgoing events are buffered for `coalesce_ms` and sent together. Events
+    are never merged unless `key_func` gives them a key: by default only
+    repeats of the `coalesce_types` (pure cache invalidations) with the same
+    payload are sent once per window. Incoming events published by this
+    process are ignored, so local handlers never run twice.
+    """
+
+    def __init__(self, coalesce_ms: float = EVENT_TRANSPORT_COALESCE_MS,
+                 coalesce_types: Iterable[EventType] = EVENT_TRANSPORT_COALESCE_TYPES,
+                 key_func: Optional[Callable[[Event], Any]] = None):
+        self.origin = uuid.uuid4().hex[:12]
+        self.coalesce_ms = coalesce_ms
+        if key_func is None:
+            key_func = partial(coalesce_key, coalesce_types=frozenset(coalesce_types))
+        self.key_func = key_func
+        self._pending: "OrderedDict[Any, Event]" = OrderedDict()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flushing: Set[asyncio.Task] = set()
+        self._deliver: Optional[Deliver] = None
+
+    async def start(self, deliver: Deliver) -> None:
+        """Connect and deliver events from other processes to `deliver`."""
+        self._deliver = deliver
+        await self._connect()
+
+    async def stop(self) -> None:
+        """Send buffered events, then disconnect."""
+        await self.flush()
+        await self._close()
+
+    async def send(self, event: Event) -> None:
+        """Queue a local event for the other processes."""
+        key = self.key_func(event)
+        if key is None:
+            key = object()
+        elif key in self._pending:
+            EVENT_TRANSPORT_MESSAGES.labels("coalesced").inc()
+        self._pending[key] = event
+        if self.coalesce_ms <= 0:
+            await self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                self.coalesce_ms / 1000, self._schedule_flush
+            )
+
+    async def flush(self) -> None:
+        """Send every buffered event now."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        in_flight = [task for task in self._flushing if task is not asyncio.current_task()]
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+        events, self._pending = list(self._pending.values()), OrderedDict()
+        if not events:
+            return
+        try:
+            await self._send_payloads([encode_event(event, self.origin) for event in events])
+            EVENT_TRANSPORT_MESSAGES.labels("sent").inc(len(events))
+        except Exception as e:
+            EVENT_TRANSPORT_MESSAGES.labels("failed").inc(len(events))
+            logger.error(f"Event transport send failed: {e}", exc_info=True)
+
+    def _schedule_flush(self) -> None:
+        self._flush_handle = None
+        task = asyncio.create_task(self.flush())
+        self._flushing.add(task)
+        task.add_done_callback(self._flushing.discard)
+
+    async def _received(self, payload: bytes) -> None:
+        try:
+            origin, event = decode_event(payload)
+        except Exception as e:
+            logger.error(f"Undecodable event transport payload: {e}")
+            return
+        if origin == self.origin or self._deliver is None:
+            return
+        EVENT_TRANSPORT_MESSAGES.labels("received").inc()
+        await self._deliver(event)
+
+    @abstractmethod
+    async def _connect(self) -> None:
+        """Open the connection and start delivering received payloads to `_received`."""
+
+    @abstractmethod
+    async def _close(self) -> None:
+        """Close the connection."""
+
+    @abstractmethod
+    async def _send_payloads(self, payloads: List[bytes]) -> None:
+        """Send encoded events to the other processes."""
+
+
+class PostgresTransport(EventTransport):
+    """Fan-out over PostgreSQL `LISTEN/NOTIFY` on a dedicated connection.
+
+    Notifications are read from the connection's socket on the event loop;
+    a flush sends all buffered events with one `pg_notify` statement in a
+    worker thread. NOTIFY payloads are text, so encoded events are base64'd.
+    NOTIFY is only best-effort (nothing is replayed for a worker that was
+    disconnected), which suits cache invalidation and live feeds; durable
+    delivery goes through the outbox.
+
+    A lost LISTEN connection is reopened in the background with exponential
+    backoff; a lost NOTIFY connection fails the batch in flight and is
+    reopened by a later send, no sooner than the backoff allows.
+    """
+
+    def __init__(self, dsn: str = None, channel: str = EVENT_TRANSPORT_CHANNEL, **kwargs):
+        super().__init__(**kwargs)
+        self.dsn = dsn
+        self.channel = channel
+        self._listen_conn = None
+        self._listen_fd: Optional[int] = None
+        self._notify_conn = None
+        self._notify_delay = PG_RECONNECT_MIN_DELAY
+        self._notify_retry_at = 0.0
+        self._relistening: Optional[asyncio.Task] = None
+        self._receiving: Set[asyncio.Task] = set()
+
+    @staticmethod
+    def _connection_errors() -> Tuple[type, ...]:
+        import psycopg2
+
+        return (psycopg2.OperationalError, psycopg2.InterfaceError)
+
+    def _connect_raw(self):
+        import psycopg2
+        from sqlalchemy.engine import make_url
+
+        dsn = self.dsn
+        if dsn is None:
+            from ideahub_platform.db.base import DATABASE_URL
+            dsn = make_url(DATABASE_URL).set(drivername="postgresql").render_as_string(
+                hide_password=False
+            )
+        conn = psycopg2.connect(dsn, application_name="ideahub-event-transport")
+        conn.autocommit = True
+        return conn
+
+    async def _connect(self) -> None:
+        await self._listen()
+        self._notify_conn = await asyncio.to_thread(self._connect_raw)
+        logger.info(f"Event transport listening on channel {self.channel}")
+
+    async def _listen(self) -> None:
+        conn = await asyncio.to_thread(self._connect_raw)
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(f'LISTEN "{self.channel}"')
+        except Exception:
+            conn.close()
+            raise
+        self._listen_conn = conn
+        self._listen_fd = conn.fileno()
+        asyncio.get_running_loop().add_reader(self._listen_fd, self._on_readable)
+
+    async def _close(self) -> None:
+        task, self._relistening = self._relistening, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        self._drop_listener()
+        conn, self._notify_conn = self._notify_conn, None
+        if conn is not None:
+            conn.close()
+
+    def _drop_listener(self) -> None:
+        conn, self._listen_conn = self._listen_conn, None
+        if conn is None:
+            return
+        asyncio.get_running_loop().remove_reader(self._listen_fd)
+        self._listen_fd = None
+        try:
+            conn.close()
+        except self._connection_errors():
+            pass
+
+    async def _relisten(self) -> None:
+        delay = PG_RECONNECT_MIN_DELAY
+        while True:
+            try:
+                await self._listen()
+            except Exception as e:
+                EVENT_TRANSPORT_RECONNECTS.labels("listen", "failed").inc()
+                logger.warning(f"Event transport LISTEN reconnect failed, retrying in {delay:.1f}s: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, PG_RECONNECT_MAX_DELAY)
+                continue
+            EVENT_TRANSPORT_RECONNECTS.labels("listen", "ok").inc()
+            logger.info(f"Event transport listening on channel {self.channel} again")
+            self._relistening = None
+            return
+
+    def _on_readable(self) -> None:
+        conn = self._listen_conn
+        try:
+            conn.poll()
+        except self._connection_errors() as e:
+            logger.warning(f"Event transport LISTEN connection lost: {e}")
+            self._drop_listener()
+            self._relistening = asyncio.create_task(self._relisten())
+            return
+        while conn.notifies:
+            notify = conn.notifies.pop(0)
+            task = asyncio.create_task(self._received(base64.b64decode(notify.payload)))
+            self._receiving.add(task)
+            task.add_done_callback(self._receiving.discard)
+
+    async def _send_payloads(self, payloads: List[bytes]) -> None:
+        texts = []
+        for payload in payloads:
+            text = base64.b64encode(payload).decode()
+            if len(text) > PG_NOTIFY_MAX_BYTES:
+                EVENT_TRANSPORT_MESSAGES.labels("failed").inc()
+                logger.error(f"Event too large for NOTIFY ({len(text)} bytes), not sent")
+                continue
+            texts.append(text)
+        if texts:
+            await self._reopen_notify()
+            try:
+                await asyncio.to_thread(self._notify, texts)
+            except self._connection_errors():
+                conn, self._notify_conn = self._notify_conn, None
+                try:
+                    conn.close()
+                except self._connection_errors():
+                    pass
+                raise
+
+    async def _reopen_notify(self) -> None:
+        if self._notify_conn is not None:
+            return
+        loop = asyncio.get_running_loop()
+        if loop.time() < self._notify_retry_at:
+            raise ConnectionError("NOTIFY connection lost, waiting to reconnect")
+        try:
+            self._notify_conn = await asyncio.to_thread(self._connect_raw)
+        except Exception:
+            EVENT_TRANSPORT_RECONNECTS.labels("notify", "failed").inc()
+            self._notify_retry_at = loop.time() + self._notify_delay
+            self._notify_delay = min(self._notify_delay * 2, PG_RECONNECT_MAX_DELAY)
+            raise
+        EVENT_TRANSPORT_RECONNECTS.labels("notify", "ok").inc()
+        self._notify_delay = PG_RECONNECT_MIN_DELAY
+
+    def _notify(self, texts: List[str]) -> None:
+        with self._notify_conn.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_notify(%s, payload) FROM unnest(%s::text[]) AS payload",
+                (self.channel, texts),
+            )
+
+
+_FRAME = struct.Struct("!I")
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> bytes:
+    (size,) = _FRAME.unpack(await reader.readexactly(_FRAME.size))
+    return await reader.readexactly(size)
+
+
+def _frame(payload: bytes) -> bytes:
+    return _FRAME.pack(len(payload)) + payload
+
+
+class UnixSocketBroker:
+    """Local broker that relays length-prefixed frames between connected clients.
+
+    Stands in for PostgreSQL in tests and single-host development.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._clients: Set[asyncio.StreamWriter] = set()
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_unix_server(self._handle, path=self.path)
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._clients):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._clients.add(writer)
+        try:
+            while True:
+                frame = _frame(await _read_frame(reader))
+                for client in list(self._clients):
+                    if client is not writer:
+                        client.write(frame)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._clients.discard(writer)
+            writer.close()
+
+
+class UnixSocketTransport(EventTransport):
+    """Client of a `UnixSocketBroker`."""
+
+    def __init__(self, path: str, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task] = None
+
+    async def _connect(self) -> None:
+        reader, self._writer = await asyncio.open_unix_connection(self.path)
+        self._reader_task = asyncio.create_task(self._read(reader))
+
+    async def _close(self) -> None:
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            await asyncio.gather(self._reader_task, return_exceptions=True)
+            self._reader_task = None
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    async def _read(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while True:
+                await self._received(await _read_frame(reader))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            logger.warning("Event transport broker connection closed")
+
+    async def _send_payloads(self, payloads: List[bytes]) -> None:
+        self._writer.write(b"".join(_frame(payload) for payload in payloads))
+        await self._writer.drain()
+
+
+def create_transport(kind: str = EVENT_TRANSPORT) -> Optional[EventTransport]:
+    """Build the transport selected by EVENT_TRANSPORT (`none` or `postgres`)."""
+    if kind == "none":
+        return None
+    if kind == "postgres":
+        return PostgresTransport()
+    raise ValueError(f"Unknown event transport: {kind}")
@@ -1,3 +1,3 @@
-from .manager import I18nManager
+from .manager import I18nManager, get_text, t
 
-__all__ = ["I18nManager"]
+__all__ = ["I18nManager", "get_text", "t"]
@@ -1,13 +1,18 @@
 from .models import *
 from .services import *
 from .processors import *
+from .related import RelatedIdeasProcessor, RelatedIdeasService
 
 __all__ = [
     "IdeaStatistics",
     "CommunityStatistics", 
     "WorkspaceStatistics",
+    "RelatedIdea",
+    "RelatedIdeasRun",
     "ReportingService",
     "IdeaStatProcessor",
     "CommunityStatProcessor",
-    "WorkspaceStatProcessor"
+    "WorkspaceStatProcessor",
+    "RelatedIdeasProcessor",
+    "RelatedIdeasService",
 ]
@@ -118,3 +118,28 @@ class ActivityLog(Base):
     session_id = Column(String(255), nullable=True)
     ip_address = Column(String(45), nullable=True)
     user_agent = Column(Text, nullable=True)
+
+
+class RelatedIdea(Base):
+    """One precomputed neighbour of an idea; (idea_id, rank) orders an idea's list."""
+    __tablename__ = "related_ideas"
+    __table_args__ = {'schema': 'reporting'}
+
+    idea_id = Column(Integer, primary_key=True)
+    rank = Column(Integer, primary_key=True, autoincrement=False)
+    related_idea_id = Column(Integer, nullable=False)
+    community_id = Column(Integer, nullable=False, index=True)
+    score = Column(Float, nullable=False)
+    computed_at = Column(DateTime(timezone=True), nullable=False)
+
+
+class RelatedIdeasRun(Base):
+    """Progress of the related ideas job per community."""
+    __tablename__ = "related_idea_runs"
+    __table_args__ = {'schema': 'reporting'}
+
+    community_id = Column(Integer, primary_key=True, autoincrement=False)
+    # Latest Idea.updated_at covered by the stored neighbours
+    watermark = Column(DateTime(timezone=True), nullable=False)
+    refreshed_at = Column(DateTime(timezone=True), nullable=False)
+    idea_count = Column(Integer, default=0)
@@ -0,0 +1,281 @@
+# Related ideas: batch TF-IDF cosine neighbours per community
+import heapq
+import math
+import os
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+from ideahub_platform.common.logging import get_logger
+from ideahub_platform.db.models.idea import Idea
+from ideahub_platform.reporting.models import RelatedIdea, RelatedIdeasRun
+from ideahub_platform.reporting.processors import ProcessorBase
+from ideahub_platform.search.index import tokenize
+
+logger = get_logger(__name__)
+
+# Related ideas job configuration
+RELATED_IDEAS_TOP_K = int(os.getenv("RELATED_IDEAS_TOP_K", "10"))
+RELATED_IDEAS_BLOCK_SIZE = int(os.getenv("RELATED_IDEAS_BLOCK_SIZE", "500"))
+RELATED_IDEAS_MIN_SCORE = float(os.getenv("RELATED_IDEAS_MIN_SCORE", "0.05"))
+# Terms in more than this share of a community's ideas are ignored (like max_df)
+RELATED_IDEAS_MAX_DF = float(os.getenv("RELATED_IDEAS_MAX_DF", "0.5"))
+# ...or in more than this many ideas, which bounds the work per idea (see TfidfMatrix)
+RELATED_IDEAS_MAX_POSTINGS = int(os.getenv("RELATED_IDEAS_MAX_POSTINGS", "2000"))
+# Recompute a whole community once this share of its ideas changed
+FULL_REFRESH_RATIO = 0.2
+
+Neighbours = List[Tuple[int, float]]
+
+
+class TfidfMatrix:
+    """L2-normalized TF-IDF document-term matrix in CSR layout.
+
+    Rows are ideas and columns terms, stored as `indptr`/`indices`/`data`
+    arrays like `scipy.sparse.csr_matrix`; a CSC copy (`col_*`) makes the
+    row-times-transpose products used for cosine similarity sparse too.
+    IDF is smoothed as in scikit-learn: ln((1 + n) / (1 + df)) + 1.
+
+    The products are interpreted Python, costing one step per posting of
+    each of a row's terms. Terms in more than `max_postings` documents are
+    pruned as stop terms (they carry little weight at that df), so a row
+    costs at most terms x `max_postings` steps and a full refresh grows
+    linearly with community size rather than quadratically. Communities of
+    a few hundred thousand ideas refresh in minutes; beyond that, lower
+    `max_postings` or run the job per community.
+    """
+
+    def __init__(self, documents: Sequence[Sequence[str]], max_df: float = RELATED_IDEAS_MAX_DF,
+                 max_postings: int = RELATED_IDEAS_MAX_POSTINGS):
+        n = len(documents)
+        df: Dict[str, int] = {}
+        counted = []
+        for tokens in documents:
+            counts: Dict[str, int] = {}
+            for token in tokens:
+                counts[token] = counts.get(token, 0) + 1
+            counted.append(counts)
+            for token in counts:
+                df[token] = df.get(token, 0) + 1
+        # A term shared by two ideas is never a stop term, or small communities get no pairs
+        limit = min(max(2, math.ceil(max_df * n)), max_postings)
+        self.vocabulary = {term: i for i, term in enumerate(sorted(t for t, d in df.items() if d <= limit))}
+        idf = {term: math.log((1 + n) / (1 + df[term])) + 1 for term in self.vocabulary}
+
+        self.indptr = array("q", [0])
+        self.indices = array("I")
+        self.data = array("d")
+        for counts in counted:
+            weights = [(self.vocabulary[t], c * idf[t]) for t, c in counts.items() if t in self.vocabulary]
+            norm = math.sqrt(sum(w * w for _, w in weights)) or 1.0
+            for column, weight in sorted(weights):
+                self.indices.append(column)
+                self.data.append(weight / norm)
+            self.indptr.append(len(self.indices))
+        self.shape = (n, len(self.vocabulary))
+        self._build_columns()
+
+    def _build_columns(self) -> None:
+        rows, columns = self.shape
+        counts = [0] * (columns + 1)
+        for column in self.indices:
+            counts[column + 1] += 1
+        self.col_indptr = array("q", [0]) * (columns + 1)
+        for column in range(columns):
+            self.col_indptr[column + 1] = self.col_indptr[column] + counts[column + 1]
+        fill = list(self.col_indptr[:-1])
+        self.col_rows = array("I", [0]) * len(self.indices)
+        self.col_data = array("d", [0.0]) * len(self.indices)
+        for row in range(rows):
+            for k in range(self.indptr[row], self.indptr[row + 1]):
+                column = self.indices[k]
+                self.col_rows[fill[column]] = row
+                self.col_data[fill[column]] = self.data[k]
+                fill[column] += 1
+
+    def similarities(self, row: int) -> Dict[int, float]:
+        """Cosine similarity of `row` to every row sharing a term with it."""
+        scores: Dict[int, float] = {}
+        get = scores.get
+        indices, data = self.indices, self.data
+        col_indptr, col_rows, col_data = self.col_indptr, self.col_rows, self.col_data
+        for k in range(self.indptr[row], self.indptr[row + 1]):
+            column, weight = indices[k], data[k]
+            for m in range(col_indptr[column], col_indptr[column + 1]):
+                other = col_rows[m]
+                scores[other] = get(other, 0.0) + weight * col_data[m]
+        scores.pop(row, None)
+        return scores
+
+    def top_k(self, rows: Iterable[int], k: int = RELATED_IDEAS_TOP_K,
+              min_score: float = RELATED_IDEAS_MIN_SCORE,
+              block_size: int = RELATED_IDEAS_BLOCK_SIZE) -> Iterable[Dict[int, Neighbours]]:
+        """Yield `{row: [(other_row, score), ...]}` for blocks of `block_size` rows."""
+        block: Dict[int, Neighbours] = {}
+        for row in rows:
+            scores = self.similarities(row)
+            best = heapq.nlargest(k, scores.items(), key=lambda item: (item[1], -item[0]))
+            block[row] = [(other, score) for other, score in best if score >= min_score]
+            if len(block) >= block_size:
+                yield block
+                block = {}
+        if block:
+            yield block
+
+
+def idea_tokens(title: Optional[str], description: Optional[str], tags: Any) -> List[str]:
+    return tokenize(f"{title or ''} {' '.join(map(str, tags or ()))} {description or ''}")
+
+
+class RelatedIdeasProcessor(ProcessorBase):
+    """Batch job filling `reporting.related_ideas` with each idea's nearest neighbours.
+
+    Per community, ideas become rows of a TF-IDF matrix and their top-k
+    cosine neighbours are computed a block of rows at a time, each block
+    written and committed before the next. Later runs only recompute the
+    ideas changed since the previous run plus the ideas whose stored
+    neighbours a change can affect (those listing a changed or deleted
+    idea, or that a changed idea now outranks); IDF weights of untouched
+    rows are refreshed by the next full run, which happens once a large
+    share of the community changed.
+    """
+
+    def process_workspace(self, workspace_id: int, start_date: datetime = None,
+                          end_date: datetime = None) -> Dict[str, Any]:
+        """Refresh related ideas for every community in a workspace."""
+        results = {}
+        for community_id in self.data_provider.find_community_ids(workspace_id):
+            results[community_id] = self.refresh_community(community_id)
+        return results
+
+    def refresh_community(self, community_id: int, full: bool = False) -> Dict[str, Any]:
+        """Recompute neighbours for one community; returns how many ideas were updated."""
+        session = self.db_session
+        started_at = datetime.now(timezone.utc)
+        rows = session.execute(
+            select(Idea.id, Idea.title, Idea.description, Idea.tags, Idea.updated_at)
+            .where(Idea.community_id == community_id)
+            .order_by(Idea.id)
+        ).all()
+        run = session.get(RelatedIdeasRun, community_id)
+        ids = [row.id for row in rows]
+        position = {idea_id: i for i, idea_id in enumerate(ids)}
+        matrix = TfidfMatrix([idea_tokens(r.title, r.description, r.tags) for r in rows])
+
+        stored = self._stored_neighbours(community_id)
+        deleted = set(stored) - set(position)
+        if run is None or full:
+            targets = set(range(len(ids)))
+        else:
+            watermark = _as_utc(run.watermark)
+            changed = {position[r.id] for r in rows
+                       if r.updated_at is None or _as_utc(r.updated_at) > watermark}
+            if len(changed) > FULL_REFRESH_RATIO * max(len(ids), 1):
+                targets = set(range(len(ids)))
+            else:
+                targets = set(changed) | self._affected(matrix, ids, position, stored,
+                                                        changed, deleted)
+
+        if deleted:
+            # Ideas moved to another community keep the rows written there
+            session.execute(delete(RelatedIdea).where(
+                RelatedIdea.community_id == community_id,
+                RelatedIdea.idea_id.in_(deleted),
+            ))
+        updated = 0
+        for block in matrix.top_k(sorted(targets)):
+            block_ids = [ids[row] for row in block]
+            session.execute(delete(RelatedIdea).where(RelatedIdea.idea_id.in_(block_ids)))
+            session.add_all(
+                RelatedIdea(
+                    idea_id=ids[row], rank=rank, related_idea_id=ids[other],
+                    community_id=community_id, score=score, computed_at=started_at,
+                )
+                for row, neighbours in block.items()
+                for rank, (other, score) in enumerate(neighbours)
+            )
+            session.commit()
+            updated += len(block)
+
+        watermark = max((_as_utc(r.updated_at) for r in rows if r.updated_at), default=None)
+        if run is None:
+            run = RelatedIdeasRun(community_id=community_id)
+            session.add(run)
+        run.watermark = watermark or started_at
+        run.refreshed_at = started_at
+        run.idea_count = len(ids)
+        session.commit()
+        logger.info(f"Related ideas for community {community_id}: {updated} ideas updated, "
+                    f"{len(deleted)} removed")
+        return {"ideas": len(ids), "updated": updated, "removed": len(deleted)}
+
+    def _stored_neighbours(self, community_id: int) -> Dict[int, Neighbours]:
+        stored: Dict[int, Neighbours] = {}
+        result = self.db_session.execute(
+            select(RelatedIdea.idea_id, RelatedIdea.related_idea_id, RelatedIdea.score)
+            .where(RelatedIdea.community_id == community_id)
+            .order_by(RelatedIdea.idea_id, RelatedIdea.rank)
+        )
+        for idea_id, related_id, score in result:
+            stored.setdefault(idea_id, []).append((related_id, score))
+        return stored
+
+    def _affected(self, matrix: TfidfMatrix, ids: List[int], position: Dict[int, int],
+                  stored: Dict[int, Neighbours], changed: set, deleted: set) -> set:
+        """Unchanged rows whose neighbour list a change or deletion can alter."""
+        gone = {ids[row] for row in changed} | deleted
+        affected = {position[idea_id] for idea_id, neighbours in stored.items()
+                    if idea_id in position and any(other in gone for other, _ in neighbours)}
+        for row in changed:
+            for other, score in matrix.similarities(row).items():
+                if score < RELATED_IDEAS_MIN_SCORE:
+                    continue
+                neighbours = stored.get(ids[other], [])
+                if len(neighbours) < RELATED_IDEAS_TOP_K or score > neighbours[-1][1]:
+                    affected.add(other)
+        return affected
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+class RelatedIdeasService:
+    """Reads precomputed related ideas."""
+
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+
+    def related(self, idea_id: int, limit: int = RELATED_IDEAS_TOP_K,
+                visibility_filter: Any = None) -> List[Dict[str, Any]]:
+        """Stored neighbours of an idea, best first (one primary-key range scan).
+
+        `visibility_filter` is an extra WHERE clause over the related `Idea`,
+        typically `Engine.sql_filter(subject, "IDEA_READ", IDEA_BINDING)`.
+        """
+        stmt = (
+            select(RelatedIdea.related_idea_id, RelatedIdea.score, Idea.title)
+            .join(Idea, Idea.id == RelatedIdea.related_idea_id)
+            .where(RelatedIdea.idea_id == idea_id)
+            .order_by(RelatedIdea.rank)
+            .limit(limit)
+        )
+        if visibility_filter is not None:
+            stmt = stmt.where(visibility_filter)
+        return [
+            {"id": related_id, "title": title, "score": round(score, 4)}
+            for related_id, score, title in self.db_session.execute(stmt)
+        ]
+
+
+if __name__ == "__main__":
+    # python -m ideahub_platform.reporting.related: refresh every workspace
+    from ideahub_platform.db.base import SessionLocal
+
+    with SessionLocal() as db_session:
+        summary = RelatedIdeasProcessor(db_session).process_all_workspaces()
+    logger.info(f"Related ideas refreshed for {summary['processed_workspaces']} workspaces, "
+                f"{len(summary['errors'])} errors")
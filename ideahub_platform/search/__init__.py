@@ -0,0 +1,16 @@
+# Idea search
+from .facets import TagFacetService
+from .index import InvertedIndex
+from .service import IdeaSearchService, SearchHit, SearchPage
+from .similar import SimilarIdeaIndex
+from .suggest import SuggestIndex
+
+__all__ = [
+    "IdeaSearchService",
+    "InvertedIndex",
+    "SearchHit",
+    "SearchPage",
+    "SimilarIdeaIndex",
+    "SuggestIndex",
+    "TagFacetService",
+]
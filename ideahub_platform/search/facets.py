@@ -0,0 +1,73 @@
+# Tag facet counts over the idea_tags table
+import os
+from typing import Any, Dict, List, Optional
+from sqlalchemy import and_, func, select
+from sqlalchemy.orm import Session
+from ideahub_platform.common.cache import TTLCache
+from ideahub_platform.db.models.idea_tag import IdeaTag, TagFacetVersion
+from ideahub_platform.search.service import IdeaSearchService
+
+# Entries are keyed by TagFacetVersion.version, so the TTL only bounds memory
+TAG_FACET_CACHE_TTL = float(os.getenv("TAG_FACET_CACHE_TTL", "3600"))
+TAG_FACET_CACHE_SIZE = int(os.getenv("TAG_FACET_CACHE_SIZE", "4096"))
+
+_facet_cache = TTLCache(maxsize=TAG_FACET_CACHE_SIZE, ttl=TAG_FACET_CACHE_TTL)
+
+
+class TagFacetService:
+    """Tag counts for a workspace, a community or a search result set.
+
+    Counts are `GROUP BY tag` over `idea_tags`, answered from its
+    (workspace_id, public, tag) / (community_id, public, tag) indexes.
+    Workspace and community counts cover either every idea or only public
+    ones and are cached per `TagFacetVersion`, which is bumped once the
+    writing transaction commits, so every worker sees a change on its next
+    request. Search result facets depend on the query and the caller's
+    visibility and are not cached.
+    """
+
+    def __init__(self, db_session: Session, cache: TTLCache = _facet_cache):
+        self.db_session = db_session
+        self.cache = cache
+
+    def facets(self, workspace_id: int, community_id: Optional[int] = None,
+               q: Optional[str] = None, limit: int = 20,
+               visibility_filter: Any = None, public_only: bool = False) -> List[Dict[str, Any]]:
+        """Most used tags, as `{"tag", "count"}` dicts, most used first.
+
+        Without `q`, `public_only` restricts the counts to public ideas;
+        with it, `visibility_filter` restricts the matching ideas.
+        """
+        if q:
+            matching = IdeaSearchService(self.db_session).matching_ids(
+                q, workspace_id=workspace_id, community_id=community_id,
+                visibility_filter=visibility_filter,
+            )
+            return self._counts(IdeaTag.idea_id.in_(matching), limit)
+
+        version = self.db_session.execute(
+            select(TagFacetVersion.version).where(TagFacetVersion.workspace_id == workspace_id)
+        ).scalar() or 0
+        key = ("tag_facets", workspace_id, version, community_id, public_only, limit)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        condition = IdeaTag.workspace_id == workspace_id
+        if community_id is not None:
+            condition = and_(IdeaTag.community_id == community_id, condition)
+        if public_only:
+            condition = and_(condition, IdeaTag.public.is_(True))
+        counts = self._counts(condition, limit)
+        self.cache.set(key, counts)
+        return counts
+
+    def _counts(self, condition, limit: int) -> List[Dict[str, Any]]:
+        count = func.count().label("count")
+        rows = self.db_session.execute(
+            select(IdeaTag.tag, count)
+            .where(condition)
+            .group_by(IdeaTag.tag)
+            .order_by(count.desc(), IdeaTag.tag)
+            .limit(limit)
+        )
+        return [{"tag": tag, "count": n} for tag, n in rows]
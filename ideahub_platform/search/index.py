@@ -0,0 +1,353 @@
+# In-process inverted index with BM25 ranking
+import heapq
+import math
+import os
+import pickle
+import re
+import threading
+import time
+from array import array
+from datetime import datetime
+from itertools import accumulate
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from ideahub_platform.common.metrics import SEARCH_QUERY_DURATION
+from ideahub_platform.common.pagination import decode_cursor, encode_cursor
+from ideahub_platform.search.service import SearchHit, SearchPage
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Title terms count this many times towards a term's frequency
+TITLE_BOOST = 2
+# Compact postings once this fraction of indexed documents is deleted
+COMPACT_DELETED_RATIO = 0.2
+SNAPSHOT_VERSION = 1
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have in into is it its of on or "
+    "that the their this to was were will with".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens without stopwords or single characters."""
+    return [t for t in _TOKEN.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+class Postings:
+    """Documents containing one term.
+
+    Document numbers only ever grow, so they are stored as deltas from the
+    previous entry in an unsigned array, with term frequencies alongside;
+    `itertools.accumulate` restores absolute numbers at C speed.
+    """
+    __slots__ = ("deltas", "tfs", "last")
+
+    def __init__(self):
+        self.deltas = array("I")
+        self.tfs = array("H")
+        self.last = 0
+
+    def append(self, docno: int, tf: int) -> None:
+        self.deltas.append(docno - self.last)
+        self.tfs.append(min(tf, 0xFFFF))
+        self.last = docno
+
+    def __len__(self) -> int:
+        return len(self.tfs)
+
+    def __iter__(self) -> Iterable[Tuple[int, int]]:
+        return zip(accumulate(self.deltas), self.tfs)
+
+
+class IndexedIdea:
+    """Attributes of an indexed idea, shaped for authz resource predicates."""
+    __slots__ = ("id", "title", "community_id", "workspace_id", "owner_id", "public")
+
+    def __init__(self, id, title, community_id, workspace_id, owner_id, public):
+        self.id = id
+        self.title = title
+        self.community_id = community_id
+        self.workspace_id = workspace_id
+        self.owner_id = owner_id
+        self.public = public
+
+
+class _Documents:
+    """Postings plus per-document attributes in parallel arrays by document number.
+
+    Compaction builds a new instance and swaps it in with one assignment, so
+    a search working from one instance never mixes old and new numbering.
+    """
+    __slots__ = ("postings", "ids", "lengths", "workspaces", "communities", "owners",
+                 "public", "live", "titles")
+
+    def __init__(self):
+        self.postings: Dict[str, Postings] = {}
+        self.ids = array("q")
+        self.lengths = array("I")
+        self.workspaces = array("q")
+        self.communities = array("q")
+        self.owners = array("q")
+        self.public = bytearray()
+        self.live = bytearray()
+        self.titles: List[str] = []
+
+    def append(self, idea_id: int, length: int, workspace_id: int, community_id: int,
+               owner_id: int, public: bool, title: str) -> int:
+        docno = len(self.ids)
+        self.ids.append(idea_id)
+        self.lengths.append(length)
+        self.workspaces.append(workspace_id or 0)
+        self.communities.append(community_id or 0)
+        self.owners.append(owner_id or 0)
+        self.public.append(1 if public else 0)
+        self.live.append(1)
+        self.titles.append(title)
+        return docno
+
+
+class InvertedIndex:
+    """BM25-ranked idea index held in memory.
+
+    Every indexed version of an idea gets a new internal document number;
+    updates and deletes tombstone the old number. Once more than
+    `COMPACT_DELETED_RATIO` of the document numbers are dead, live documents
+    are renumbered into fresh postings and attribute arrays, so memory and
+    posting scans stay proportional to the live ideas under update traffic.
+
+    Writers serialize on a lock; searches read without it (postings and
+    arrays are only appended to, or swapped whole by compaction).
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._docs = _Documents()
+        self._docnos: Dict[int, int] = {}
+        self._total_length = 0
+        self._deleted = 0
+        # Latest Idea.updated_at reflected in the index, for catch-up after a restart
+        self.watermark: Optional[datetime] = None
+
+    def __len__(self) -> int:
+        return len(self._docnos)
+
+    def __contains__(self, idea_id: int) -> bool:
+        return idea_id in self._docnos
+
+    def ids(self) -> List[int]:
+        """Ids of all indexed ideas."""
+        return list(self._docnos)
+
+    @property
+    def term_count(self) -> int:
+        return len(self._docs.postings)
+
+    @property
+    def document_slots(self) -> int:
+        """Document numbers in use, live or dead."""
+        return len(self._docs.ids)
+
+    def add(self, idea_id: int, title: str, description: str = "", tags: Sequence[str] = (),
+            community_id: int = 0, workspace_id: int = 0, owner_id: int = 0,
+            public: bool = True) -> None:
+        """Index an idea, replacing any previously indexed version."""
+        counts: Dict[str, int] = {}
+        for term in tokenize(title):
+            counts[term] = counts.get(term, 0) + TITLE_BOOST
+        for term in tokenize(" ".join(tags or ())):
+            counts[term] = counts.get(term, 0) + 1
+        for term in tokenize(description or ""):
+            counts[term] = counts.get(term, 0) + 1
+        length = sum(counts.values())
+
+        with self._lock:
+            self._remove(idea_id)
+            docs = self._docs
+            docno = docs.append(idea_id, length, workspace_id, community_id, owner_id,
+                                public, title)
+            self._total_length += length
+            postings = docs.postings
+            for term, tf in counts.items():
+                entry = postings.get(term)
+                if entry is None:
+                    entry = postings[term] = Postings()
+                entry.append(docno, tf)
+            self._docnos[idea_id] = docno
+            self._maybe_compact()
+
+    def remove(self, idea_id: int) -> None:
+        """Drop an idea from the index."""
+        with self._lock:
+            self._remove(idea_id)
+            self._maybe_compact()
+
+    def compact(self) -> None:
+        """Renumber live documents into fresh postings and arrays, dropping dead ones."""
+        with self._lock:
+            old = self._docs
+            docs = _Documents()
+            renumbered = array("q", [-1]) * len(old.ids)
+            for docno, alive in enumerate(old.live):
+                if alive:
+                    renumbered[docno] = docs.append(
+                        old.ids[docno], old.lengths[docno], old.workspaces[docno],
+                        old.communities[docno], old.owners[docno], old.public[docno],
+                        old.titles[docno],
+                    )
+            for term, entry in old.postings.items():
+                fresh = Postings()
+                for docno, tf in entry:
+                    new_docno = renumbered[docno]
+                    if new_docno >= 0:
+                        fresh.append(new_docno, tf)
+                if len(fresh):
+                    docs.postings[term] = fresh
+            self._docnos = {idea_id: docno for docno, idea_id in enumerate(docs.ids)}
+            self._docs = docs
+            self._deleted = 0
+
+    def _maybe_compact(self) -> None:
+        if self._deleted > COMPACT_DELETED_RATIO * max(len(self._docs.ids), 1):
+            self.compact()
+
+    def search(self, q: str, workspace_id: Optional[int] = None,
+               community_id: Optional[int] = None, limit: int = 20,
+               cursor: Optional[str] = None,
+               allow: Callable[[List[IndexedIdea]], Sequence[bool]] = None) -> SearchPage:
+        """BM25-ranked search; same paging contract as `IdeaSearchService.search`.
+
+        `allow` receives candidate ideas in rank order and returns which the
+        caller may see, e.g. `lambda ideas: engine.decide_many(subject,
+        "IDEA_READ", ideas).allow`.
+        """
+        started = time.perf_counter()
+        try:
+            docs = self._docs
+            scores = self._score(docs, tokenize(q), workspace_id, community_id)
+            after = decode_cursor(cursor, (float, int)) if cursor else None
+            return self._page(docs, scores, limit, after, allow)
+        finally:
+            SEARCH_QUERY_DURATION.labels("memory").observe(time.perf_counter() - started)
+
+    def _score(self, docs: _Documents, terms: List[str], workspace_id: Optional[int],
+               community_id: Optional[int]) -> Dict[int, float]:
+        live_docs = len(self._docnos)
+        if not terms or not live_docs:
+            return {}
+        lengths = docs.lengths
+        live = docs.live
+        avgdl = self._total_length / live_docs or 1.0
+        norm = BM25_K1 * (1 - BM25_B)
+        scale = BM25_K1 * BM25_B / avgdl
+        scores: Dict[int, float] = {}
+        for term in set(terms):
+            entry = docs.postings.get(term)
+            if entry is None:
+                continue
+            df = len(entry)
+            idf = math.log(1 + (live_docs - df + 0.5) / (df + 0.5))
+            weight = idf * (BM25_K1 + 1)
+            get = scores.get
+            for docno, tf in entry:
+                if live[docno]:
+                    scores[docno] = get(docno, 0.0) + weight * tf / (tf + norm + scale * lengths[docno])
+        if workspace_id is not None or community_id is not None:
+            workspaces, communities = docs.workspaces, docs.communities
+            scores = {
+                docno: score for docno, score in scores.items()
+                if (workspace_id is None or workspaces[docno] == workspace_id)
+                and (community_id is None or communities[docno] == community_id)
+            }
+        return scores
+
+    def _page(self, docs: _Documents, scores: Dict[int, float], limit: int,
+              after: Optional[list], allow) -> SearchPage:
+        ids = docs.ids
+        keyed = ((score, ids[docno], docno) for docno, score in scores.items())
+        if after is not None:
+            last_score, last_id = after
+            keyed = (k for k in keyed if (k[0], k[1]) < (last_score, last_id))
+        keyed = list(keyed)
+
+        hits: List[SearchHit] = []
+        want = limit + 1
+        fetch = want if allow is None else want * 2
+        while keyed and len(hits) < want:
+            batch = heapq.nlargest(fetch, keyed)
+            taken = {k[2] for k in batch}
+            keyed = [k for k in keyed if k[2] not in taken] if len(batch) < len(keyed) else []
+            ideas = [self._idea(docs, docno) for _, _, docno in batch]
+            allowed = allow(ideas) if allow is not None else [True] * len(ideas)
+            for (score, _, _), idea, ok in zip(batch, ideas, allowed):
+                if ok:
+                    hits.append(SearchHit(idea.id, idea.title, idea.community_id, score))
+                    if len(hits) == want:
+                        break
+            fetch *= 2
+
+        next_cursor = None
+        if len(hits) > limit:
+            hits = hits[:limit]
+            next_cursor = encode_cursor([hits[-1].score, hits[-1].id])
+        return SearchPage(items=hits, next_cursor=next_cursor)
+
+    @staticmethod
+    def _idea(docs: _Documents, docno: int) -> IndexedIdea:
+        return IndexedIdea(
+            docs.ids[docno], docs.titles[docno], docs.communities[docno],
+            docs.workspaces[docno], docs.owners[docno], bool(docs.public[docno]),
+        )
+
+    def _remove(self, idea_id: int) -> None:
+        docno = self._docnos.pop(idea_id, None)
+        if docno is not None:
+            docs = self._docs
+            docs.live[docno] = 0
+            self._total_length -= docs.lengths[docno]
+            docs.titles[docno] = ""
+            self._deleted += 1
+
+    def save(self, path: str) -> None:
+        """Write a snapshot atomically (temp file + rename)."""
+        with self._lock:
+            docs = self._docs
+            state = {
+                "version": SNAPSHOT_VERSION,
+                "postings": {term: (e.deltas, e.tfs, e.last) for term, e in docs.postings.items()},
+                "ids": docs.ids, "lengths": docs.lengths, "workspaces": docs.workspaces,
+                "communities": docs.communities, "owners": docs.owners,
+                "public": docs.public, "live": docs.live, "titles": docs.titles,
+                "total_length": self._total_length, "deleted": self._deleted,
+                "watermark": self.watermark,
+            }
+            tmp = f"{path}.tmp"
+            with open(tmp, "wb") as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "InvertedIndex":
+        """Restore an index written by `save` (a trusted local file)."""
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+        if state.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported search index snapshot version {state.get('version')}")
+        index = cls()
+        docs = index._docs
+        for term, (deltas, tfs, last) in state["postings"].items():
+            entry = Postings()
+            entry.deltas, entry.tfs, entry.last = deltas, tfs, last
+            docs.postings[term] = entry
+        for name in ("ids", "lengths", "workspaces", "communities", "owners",
+                     "public", "live", "titles"):
+            setattr(docs, name, state[name])
+        index._total_length = state["total_length"]
+        index._deleted = state["deleted"]
+        index.watermark = state["watermark"]
+        live = docs.live
+        index._docnos = {idea_id: docno for docno, idea_id in enumerate(docs.ids) if live[docno]}
+        return index
@@ -0,0 +1,238 @@
+# Keeps the in-memory idea index in sync with the database
+import os
+from abc import ABC, abstractmethod
+from typing import Callable, Iterable, List, Optional
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from ideahub_platform.common.logging import get_logger
+from ideahub_platform.db.models.community import Community
+from ideahub_platform.db.models.idea import Idea
+from ideahub_platform.events.bus import EventBus
+from ideahub_platform.events.event_types import Event, EventType, payload_dict
+from ideahub_platform.search.index import InvertedIndex
+from ideahub_platform.search.similar import SimilarIdeaIndex
+from ideahub_platform.search.suggest import SuggestIndex
+
+logger = get_logger(__name__)
+
+# Search backend for /search: "postgres" (full-text search) or "memory" (InvertedIndex)
+SEARCH_BACKEND = os.getenv("SEARCH_BACKEND", "postgres")
+# Snapshot file for the in-memory index; empty disables snapshots
+SEARCH_INDEX_SNAPSHOT_PATH = os.getenv("SEARCH_INDEX_SNAPSHOT_PATH", "")
+# Serve /search/suggest from an in-memory per-workspace prefix index
+SEARCH_SUGGEST_ENABLED = os.getenv("SEARCH_SUGGEST_ENABLED", "false").lower() == "true"
+
+IDEA_EVENTS = (EventType.IDEA_CREATED, EventType.IDEA_UPDATED, EventType.IDEA_DELETED)
+
+_COLUMNS = (
+    Idea.id,
+    Idea.title,
+    Idea.description,
+    Idea.tags,
+    Idea.community_id,
+    Community.workspace_id,
+    Idea.author_id,
+    Idea.visibility,
+    Idea.updated_at,
+)
+_LOAD_CHUNK = 1000
+
+
+class IdeaFeed(ABC):
+    """Feeds an in-memory structure from the ideas table.
+
+    Idea events only carry a summary of the idea, so changed ideas are
+    re-read from the database in batches; an id that no longer exists is
+    removed. Because the database is the source of truth, event order
+    between the created/updated/deleted batches does not matter.
+    Subclasses choose the columns and apply rows.
+    """
+
+    columns = _COLUMNS
+
+    def __init__(self, session_factory: Callable[[], Session] = None):
+        if session_factory is None:
+            from ideahub_platform.db.base import SessionLocal
+            session_factory = SessionLocal
+        self.session_factory = session_factory
+
+    def subscribe(self, bus: EventBus) -> None:
+        """Refresh from idea events."""
+        for event_type in IDEA_EVENTS:
+            bus.subscribe_batch(event_type, self.handle_events)
+
+    def handle_events(self, events: List[Event]) -> None:
+        ids = {payload_dict(event.data).get("idea_id") for event in events}
+        self.refresh(i for i in ids if i is not None)
+
+    def refresh(self, idea_ids: Iterable[int]) -> None:
+        """Re-read the given ideas, dropping those that were deleted."""
+        idea_ids = list(idea_ids)
+        with self.session_factory() as session:
+            for start in range(0, len(idea_ids), _LOAD_CHUNK):
+                chunk = idea_ids[start:start + _LOAD_CHUNK]
+                seen = set()
+                for row in session.execute(self._select().where(Idea.id.in_(chunk))):
+                    self._add(row)
+                    seen.add(row.id)
+                for idea_id in chunk:
+                    if idea_id not in seen:
+                        self._remove(idea_id)
+
+    def build(self) -> None:
+        """Load every idea (cold start)."""
+        count = 0
+        with self.session_factory() as session:
+            rows = session.execute(self._select().execution_options(yield_per=_LOAD_CHUNK))
+            for row in rows:
+                self._add(row)
+                count += 1
+        logger.info(f"{self.__class__.__name__} loaded {count} ideas")
+
+    def _select(self):
+        return select(*self.columns).join(Community, Community.id == Idea.community_id)
+
+    @abstractmethod
+    def _add(self, row) -> None:
+        """Apply a (new or changed) idea row."""
+
+    @abstractmethod
+    def _remove(self, idea_id: int) -> None:
+        """Drop an idea that no longer exists."""
+
+
+class IdeaIndexer(IdeaFeed):
+    """Keeps an `InvertedIndex` in sync with the ideas table."""
+
+    def __init__(self, index: InvertedIndex, session_factory: Callable[[], Session] = None):
+        super().__init__(session_factory)
+        self.index = index
+
+    def catch_up(self) -> None:
+        """Apply changes made since a snapshot was taken (e.g. while this worker was down)."""
+        with self.session_factory() as session:
+            stmt = self._select()
+            if self.index.watermark is not None:
+                stmt = stmt.where(Idea.updated_at > self.index.watermark)
+            changed = 0
+            for row in session.execute(stmt.execution_options(yield_per=_LOAD_CHUNK)):
+                self._add(row)
+                changed += 1
+            existing = set(session.scalars(select(Idea.id)))
+        removed = [idea_id for idea_id in self.index.ids() if idea_id not in existing]
+        for idea_id in removed:
+            self.index.remove(idea_id)
+        logger.info(f"Search index caught up: {changed} changed, {len(removed)} removed")
+
+    def _add(self, row) -> None:
+        self.index.add(
+            row.id, row.title, row.description or "", row.tags or (),
+            community_id=row.community_id, workspace_id=row.workspace_id,
+            owner_id=row.author_id, public=row.visibility == "public",
+        )
+        if row.updated_at is not None and (
+            self.index.watermark is None or row.updated_at > self.index.watermark
+        ):
+            self.index.watermark = row.updated_at
+
+    def _remove(self, idea_id: int) -> None:
+        self.index.remove(idea_id)
+
+
+class SuggestIndexer(IdeaFeed):
+    """Keeps a `SuggestIndex` in sync with the ideas table."""
+
+    columns = (Idea.id, Idea.title, Idea.tags, Community.workspace_id, Idea.visibility)
+
+    def __init__(self, index: SuggestIndex, session_factory: Callable[[], Session] = None):
+        super().__init__(session_factory)
+        self.index = index
+
+    def _add(self, row) -> None:
+        self.index.add(row.id, row.workspace_id, row.title, row.tags or (),
+                       public=row.visibility == "public")
+
+    def _remove(self, idea_id: int) -> None:
+        self.index.remove(idea_id)
+
+
+class SimilarIdeaIndexer(IdeaFeed):
+    """Keeps a `SimilarIdeaIndex` in sync with the ideas table."""
+
+    columns = (Idea.id, Idea.title, Idea.description, Community.workspace_id)
+
+    def __init__(self, index: SimilarIdeaIndex, session_factory: Callable[[], Session] = None):
+        super().__init__(session_factory)
+        self.index = index
+
+    def _add(self, row) -> None:
+        self.index.add(row.id, row.workspace_id, idea_text(row.title, row.description))
+
+    def _remove(self, idea_id: int) -> None:
+        self.index.remove(idea_id)
+
+
+def idea_text(title: Optional[str], description: Optional[str]) -> str:
+    """Text compared for near-duplicate detection."""
+    return f"{title or ''}\n{description or ''}"
+
+
+idea_index: Optional[InvertedIndex] = None
+suggest_index: Optional[SuggestIndex] = None
+similar_index: Optional[SimilarIdeaIndex] = None
+
+
+def open_idea_index(path: str = SEARCH_INDEX_SNAPSHOT_PATH, bus: EventBus = None) -> InvertedIndex:
+    """Load (or build) the process-wide idea index and subscribe it to idea events."""
+    global idea_index
+    if bus is None:
+        from ideahub_platform.events.bus import event_bus
+        bus = event_bus
+    index = None
+    if path and os.path.exists(path):
+        try:
+            index = InvertedIndex.load(path)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable search index snapshot {path}: {e}")
+    indexer = IdeaIndexer(index if index is not None else InvertedIndex())
+    # Subscribe first so changes made while loading are not missed
+    indexer.subscribe(bus)
+    if index is None:
+        indexer.build()
+    else:
+        indexer.catch_up()
+    idea_index = indexer.index
+    return idea_index
+
+
+def close_idea_index(path: str = SEARCH_INDEX_SNAPSHOT_PATH) -> None:
+    """Snapshot the idea index for the next start."""
+    if idea_index is not None and path:
+        idea_index.save(path)
+        logger.info(f"Search index snapshot written to {path}")
+
+
+def open_suggest_index(bus: EventBus = None) -> SuggestIndex:
+    """Build the process-wide suggestion index and subscribe it to idea events."""
+    global suggest_index
+    if bus is None:
+        from ideahub_platform.events.bus import event_bus
+        bus = event_bus
+    indexer = SuggestIndexer(SuggestIndex())
+    indexer.subscribe(bus)
+    indexer.build()
+    suggest_index = indexer.index
+    return suggest_index
+
+
+def open_similar_index(bus: EventBus = None) -> SimilarIdeaIndex:
+    """Build the process-wide near-duplicate index and subscribe it to idea events."""
+    global similar_index
+    if bus is None:
+        from ideahub_platform.events.bus import event_bus
+        bus = event_bus
+    indexer = SimilarIdeaIndexer(SimilarIdeaIndex())
+    indexer.subscribe(bus)
+    indexer.build()
+    similar_index = indexer.index
+    return similar_index
@@ -0,0 +1,99 @@
+# PostgreSQL full-text search over ideas
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+from sqlalchemy import REAL, Select, cast, func, select, tuple_
+from sqlalchemy.orm import Session
+from ideahub_platform.common.logging import get_logger
+from ideahub_platform.common.metrics import SEARCH_QUERY_DURATION
+from ideahub_platform.common.pagination import decode_cursor, encode_cursor
+from ideahub_platform.db.models.community import Community
+from ideahub_platform.db.models.idea import SEARCH_LANGUAGE, Idea
+
+logger = get_logger(__name__)
+
+# ts_rank_cd normalization: 32 scales ranks into [0, 1)
+_RANK_NORMALIZATION = 32
+
+
+@dataclass
+class SearchHit:
+    """One matching idea."""
+    id: int
+    title: str
+    community_id: int
+    score: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class SearchPage:
+    """A page of hits plus the cursor for the next one (None on the last page)."""
+    items: List[SearchHit] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+class IdeaSearchService:
+    """Ranked idea search backed by the `ideas.search_vector` GIN index.
+
+    Queries use `websearch_to_tsquery` syntax (quoted phrases, `or`, `-term`).
+    Results are ordered by `ts_rank_cd` and then id, and paginated by keyset
+    on that pair, so deep pages cost the same as the first one.
+    """
+
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+
+    def search(self, q: str, workspace_id: Optional[int] = None,
+               community_id: Optional[int] = None, limit: int = 20,
+               cursor: Optional[str] = None, visibility_filter: Any = None) -> SearchPage:
+        """Search ideas, optionally scoped to a workspace or community.
+
+        `visibility_filter` is an extra WHERE clause, typically
+        `Engine.sql_filter(subject, "IDEA_READ", IDEA_BINDING)`.
+        """
+        started = time.perf_counter()
+        query = func.websearch_to_tsquery(SEARCH_LANGUAGE, q)
+        rank = func.ts_rank_cd(Idea.search_vector, query, _RANK_NORMALIZATION)
+        stmt = self._matching(
+            select(Idea.id, Idea.title, Idea.community_id, rank.label("rank")),
+            query, workspace_id, community_id, visibility_filter,
+        )
+        if cursor:
+            last_rank, last_id = decode_cursor(cursor, (float, int))
+            # Compare as real (ts_rank_cd's type) so the cursor rank matches exactly
+            stmt = stmt.where(tuple_(rank, Idea.id) < tuple_(cast(last_rank, REAL), last_id))
+        stmt = stmt.order_by(rank.desc(), Idea.id.desc()).limit(limit + 1)
+
+        try:
+            rows = self.db_session.execute(stmt).all()
+        finally:
+            SEARCH_QUERY_DURATION.labels("postgres").observe(time.perf_counter() - started)
+
+        hits = [SearchHit(row.id, row.title, row.community_id, row.rank) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            last = hits[-1]
+            next_cursor = encode_cursor([last.score, last.id])
+        return SearchPage(items=hits, next_cursor=next_cursor)
+
+    def matching_ids(self, q: str, workspace_id: Optional[int] = None,
+                     community_id: Optional[int] = None, visibility_filter: Any = None) -> Select:
+        """SELECT of the ids of every idea `search` can return, e.g. for facet counts."""
+        query = func.websearch_to_tsquery(SEARCH_LANGUAGE, q)
+        return self._matching(select(Idea.id), query, workspace_id, community_id, visibility_filter)
+
+    def _matching(self, stmt: Select, query, workspace_id: Optional[int],
+                  community_id: Optional[int], visibility_filter: Any) -> Select:
+        stmt = stmt.where(Idea.search_vector.op("@@")(query))
+        if workspace_id is not None:
+            stmt = stmt.join(Community, Community.id == Idea.community_id).where(
+                Community.workspace_id == workspace_id
+            )
+        if community_id is not None:
+            stmt = stmt.where(Idea.community_id == community_id)
+        if visibility_filter is not None:
+            stmt = stmt.where(visibility_filter)
+        return stmt
@@ -0,0 +1,164 @@
+# Near-duplicate idea detection with MinHash signatures and LSH banding
+import os
+import random
+import threading
+import time
+import zlib
+from array import array
+from typing import Dict, List, Optional, Tuple
+from ideahub_platform.common.metrics import SEARCH_QUERY_DURATION
+from ideahub_platform.search.index import tokenize
+
+# Similar-ideas configuration
+SIMILAR_IDEAS_ENABLED = os.getenv("SIMILAR_IDEAS_ENABLED", "false").lower() == "true"
+SIMILAR_IDEAS_NUM_PERM = int(os.getenv("SIMILAR_IDEAS_NUM_PERM", "64"))
+SIMILAR_IDEAS_THRESHOLD = float(os.getenv("SIMILAR_IDEAS_THRESHOLD", "0.5"))
+SIMILAR_IDEAS_MAX_MEMORY_MB = float(os.getenv("SIMILAR_IDEAS_MAX_MEMORY_MB", "256"))
+
+# Words per shingle
+SHINGLE_SIZE = 3
+# Rough per-idea bookkeeping cost beyond the signature (dict entries, bucket slots)
+_IDEA_OVERHEAD_BYTES = 160
+_BUCKET_ENTRY_BYTES = 16
+_PRIME = (1 << 61) - 1
+_MASK = (1 << 32) - 1
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> List[int]:
+    """32-bit hashes of the text's overlapping word n-grams (single words for short texts)."""
+    words = tokenize(text)
+    if len(words) < size:
+        grams = words
+    else:
+        grams = [" ".join(words[i:i + size]) for i in range(len(words) - size + 1)]
+    return list({zlib.crc32(gram.encode()) for gram in grams})
+
+
+def choose_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """`(bands, rows)` with `bands * rows == num_perm` whose LSH threshold is closest to `threshold`.
+
+    Two ideas with Jaccard similarity s share at least one band with
+    probability 1 - (1 - s^rows)^bands, which rises steeply around
+    (1 / bands)^(1 / rows).
+    """
+    options = [(b, num_perm // b) for b in range(1, num_perm + 1) if num_perm % b == 0]
+    return min(options, key=lambda o: abs((1 / o[0]) ** (1 / o[1]) - threshold))
+
+
+class _Workspace:
+    __slots__ = ("buckets",)
+
+    def __init__(self, bands: int):
+        self.buckets: List[Dict[int, List[int]]] = [{} for _ in range(bands)]
+
+
+class SimilarIdeaIndex:
+    """MinHash signatures of idea texts, bucketed per workspace by LSH band.
+
+    A lookup hashes the query text's bands and only compares signatures of
+    ideas sharing a bucket, so its cost depends on the number of near
+    matches rather than on the number of ideas. Similarity is the estimated
+    Jaccard similarity of word 3-gram shingles.
+
+    Memory is capped at roughly `max_memory_bytes`; beyond it the ideas
+    indexed (or updated) longest ago are evicted first.
+    """
+
+    def __init__(self, num_perm: int = SIMILAR_IDEAS_NUM_PERM,
+                 threshold: float = SIMILAR_IDEAS_THRESHOLD,
+                 max_memory_bytes: int = int(SIMILAR_IDEAS_MAX_MEMORY_MB * 1024 * 1024),
+                 seed: int = 1):
+        self.num_perm = num_perm
+        self.threshold = threshold
+        self.bands, self.rows = choose_bands(num_perm, threshold)
+        rng = random.Random(seed)
+        self._perms = [(rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)]
+        per_idea = 4 * num_perm + _IDEA_OVERHEAD_BYTES + self.bands * _BUCKET_ENTRY_BYTES
+        self.capacity = max(1, max_memory_bytes // per_idea)
+        self._lock = threading.Lock()
+        self._workspaces: Dict[int, _Workspace] = {}
+        # Insertion ordered, so the first entry is the eviction candidate
+        self._signatures: Dict[int, Tuple[int, array]] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def signature(self, text: str) -> Optional[array]:
+        """MinHash signature of a text, or None if it has no indexable words."""
+        hashes = shingles(text)
+        if not hashes:
+            return None
+        return array("I", [
+            min(((a * h + b) % _PRIME) & _MASK for h in hashes) for a, b in self._perms
+        ])
+
+    def add(self, idea_id: int, workspace_id: int, text: str) -> None:
+        """Index an idea's text, replacing a previous version."""
+        signature = self.signature(text)
+        with self._lock:
+            self._remove(idea_id)
+            if signature is None:
+                return
+            workspace = self._workspaces.get(workspace_id)
+            if workspace is None:
+                workspace = self._workspaces[workspace_id] = _Workspace(self.bands)
+            for buckets, key in zip(workspace.buckets, self._band_keys(signature)):
+                buckets.setdefault(key, []).append(idea_id)
+            self._signatures[idea_id] = (workspace_id, signature)
+            while len(self._signatures) > self.capacity:
+                self._remove(next(iter(self._signatures)))
+
+    def remove(self, idea_id: int) -> None:
+        with self._lock:
+            self._remove(idea_id)
+
+    def similar(self, workspace_id: int, text: str, limit: int = 10,
+                threshold: float = None, exclude: int = None) -> List[Tuple[int, float]]:
+        """`(idea_id, similarity)` of indexed ideas resembling `text`, most similar first.
+
+        Only ideas sharing an LSH band are considered, so a `threshold` well
+        below the index's tuned one finds fewer of the weaker matches.
+        """
+        started = time.perf_counter()
+        threshold = self.threshold if threshold is None else threshold
+        try:
+            signature = self.signature(text)
+            if signature is None:
+                return []
+            with self._lock:
+                workspace = self._workspaces.get(workspace_id)
+                if workspace is None:
+                    return []
+                candidates = set()
+                for buckets, key in zip(workspace.buckets, self._band_keys(signature)):
+                    candidates.update(buckets.get(key, ()))
+                candidates.discard(exclude)
+                signatures = [(i, self._signatures[i][1]) for i in candidates]
+            num_perm = self.num_perm
+            scored = []
+            for idea_id, other in signatures:
+                score = sum(1 for x, y in zip(signature, other) if x == y) / num_perm
+                if score >= threshold:
+                    scored.append((idea_id, score))
+            scored.sort(key=lambda item: (-item[1], item[0]))
+            return scored[:limit]
+        finally:
+            SEARCH_QUERY_DURATION.labels("similar").observe(time.perf_counter() - started)
+
+    def _band_keys(self, signature: array) -> List[int]:
+        rows = self.rows
+        return [hash(signature[start:start + rows].tobytes())
+                for start in range(0, self.num_perm, rows)]
+
+    def _remove(self, idea_id: int) -> None:
+        entry = self._signatures.pop(idea_id, None)
+        if entry is None:
+            return
+        workspace_id, signature = entry
+        workspace = self._workspaces[workspace_id]
+        for buckets, key in zip(workspace.buckets, self._band_keys(signature)):
+            members = buckets.get(key)
+            if members is not None:
+                members.remove(idea_id)
+                if not members:
+                    del buckets[key]
@@ -0,0 +1,143 @@
+# Per-workspace prefix suggestions over idea title terms and tags
+import heapq
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple
+from ideahub_platform.common.metrics import SEARCH_QUERY_DURATION
+from ideahub_platform.db.models.idea_tag import normalize_tag
+from ideahub_platform.search.index import tokenize
+
+# Suggestions kept per cached prefix (the largest `limit` served)
+MAX_SUGGESTIONS = 20
+# Cached prefixes per workspace before the cache is reset
+PREFIX_CACHE_SIZE = 10000
+
+
+class _WorkspaceTerms:
+    """Sorted terms of one workspace with the number of ideas using each."""
+    __slots__ = ("terms", "counts", "cache")
+
+    def __init__(self):
+        self.terms: List[str] = []
+        self.counts: Dict[str, int] = {}
+        self.cache: Dict[str, List[Tuple[str, int]]] = {}
+
+    def change(self, term: str, delta: int) -> None:
+        count = self.counts.get(term, 0) + delta
+        if count > 0:
+            if term not in self.counts:
+                terms = self.terms
+                terms.insert(bisect_left(terms, term), term)
+            self.counts[term] = count
+        else:
+            self.counts.pop(term, None)
+            terms = self.terms
+            i = bisect_left(terms, term)
+            if i < len(terms) and terms[i] == term:
+                del terms[i]
+        cache = self.cache
+        if cache:
+            for end in range(1, len(term) + 1):
+                cache.pop(term[:end], None)
+
+    def top(self, prefix: str) -> List[Tuple[str, int]]:
+        cached = self.cache.get(prefix)
+        if cached is not None:
+            return cached
+        terms, counts = self.terms, self.counts
+        lo = bisect_left(terms, prefix)
+        hi = bisect_left(terms, prefix + "\U0010ffff", lo)
+        best = heapq.nlargest(MAX_SUGGESTIONS, terms[lo:hi], key=counts.__getitem__)
+        result = [(term, counts[term]) for term in best]
+        if len(self.cache) >= PREFIX_CACHE_SIZE:
+            self.cache.clear()
+        self.cache[prefix] = result
+        return result
+
+
+class SuggestIndex:
+    """Autocomplete over the title terms and tags of each workspace's ideas.
+
+    Each workspace keeps its distinct terms in a sorted list, so the terms
+    starting with a prefix are one contiguous slice found by binary search;
+    suggestions are the most popular of them (by number of ideas using the
+    term). The top suggestions for a prefix are cached until a term under
+    that prefix changes, which keeps short, busy prefixes cheap.
+
+    Terms of public ideas are also kept in a separate per-workspace set, so
+    callers who may not read every idea of a workspace are only shown terms
+    from its public ideas (`public_only=True`).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._workspaces: Dict[Tuple[int, bool], _WorkspaceTerms] = {}
+        self._ideas: Dict[int, Tuple[int, bool, array]] = {}
+        self._term_ids: Dict[str, int] = {}
+        self._terms: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._ideas)
+
+    def add(self, idea_id: int, workspace_id: int, title: str, tags: Sequence[str] = (),
+            public: bool = True) -> None:
+        """Index an idea's title terms and tags, replacing a previous version."""
+        terms = set(tokenize(title))
+        terms.update(tag for tag in map(normalize_tag, tags or ()) if tag)
+        with self._lock:
+            ids = array("I", (self._term_id(term) for term in terms))
+            self._update(self._ideas.get(idea_id), (workspace_id, public, ids))
+            self._ideas[idea_id] = (workspace_id, public, ids)
+
+    def remove(self, idea_id: int) -> None:
+        """Drop an idea's terms."""
+        with self._lock:
+            self._update(self._ideas.pop(idea_id, None), None)
+
+    def suggest(self, workspace_id: int, prefix: str, limit: int = 10,
+                public_only: bool = False) -> List[Tuple[str, int]]:
+        """Up to `limit` `(term, idea_count)` pairs starting with `prefix`, most used first."""
+        started = time.perf_counter()
+        prefix = normalize_tag(prefix)
+        try:
+            with self._lock:
+                workspace = self._workspaces.get((workspace_id, public_only))
+                if not prefix or workspace is None:
+                    return []
+                return workspace.top(prefix)[:limit]
+        finally:
+            SEARCH_QUERY_DURATION.labels("suggest").observe(time.perf_counter() - started)
+
+    def _term_id(self, term: str) -> int:
+        term_id = self._term_ids.get(term)
+        if term_id is None:
+            term_id = self._term_ids[term] = len(self._terms)
+            self._terms.append(term)
+        return term_id
+
+    def _update(self, previous: Optional[Tuple[int, bool, array]],
+                current: Optional[Tuple[int, bool, array]]) -> None:
+        """Move an idea's term counts from `previous` to `current` in both term sets."""
+        for public_only in (False, True):
+            old = previous if previous is not None and (previous[1] or not public_only) else None
+            new = current if current is not None and (current[1] or not public_only) else None
+            if old is not None and new is not None and old[0] == new[0]:
+                # Same workspace: only touch changed terms, keeping cached prefixes
+                old_ids, new_ids = set(old[2]), set(new[2])
+                self._apply((old[0], public_only), old_ids - new_ids, -1)
+                self._apply((new[0], public_only), new_ids - old_ids, 1)
+                continue
+            if old is not None:
+                self._apply((old[0], public_only), old[2], -1)
+            if new is not None:
+                self._apply((new[0], public_only), new[2], 1)
+
+    def _apply(self, key: Tuple[int, bool], term_ids, delta: int) -> None:
+        workspace = self._workspaces.get(key)
+        if workspace is None:
+            workspace = self._workspaces[key] = _WorkspaceTerms()
+        terms = self._terms
+        for term_id in term_ids:
+            workspace.change(terms[term_id], delta)
@@ -26,3 +26,14 @@ def test_workspace_endpoint_not_found():
     r = client.get("/workspaces/999")
     assert r.status_code == 404
     assert "workspace_not_found" in r.json()["detail"]
+
+def test_server_timing_header():
+    from fastapi.testclient import TestClient
+    from apps.gateway.main import app
+
+    client = TestClient(app)
+    r = client.get("/workspaces/1")
+    timing = r.headers["server-timing"]
+    assert "db;dur=" in timing
+    assert "authz;dur=" in timing
+    assert "serialize;dur=" in timing
@@ -6,3 +6,34 @@ def test_health():
     r = client.get("/health")
     assert r.status_code == 200
     assert r.json()["status"] == "ok"
+
+def test_detailed_health_uses_sampler(monkeypatch):
+    from fastapi.testclient import TestClient
+    from apps.gateway.main import app
+    from ideahub_platform.common.health import health_sampler
+
+    calls = []
+    monkeypatch.setattr(health_sampler, "db_probe", lambda: calls.append(1) or True)
+    monkeypatch.setattr(health_sampler, "_database", None)
+
+    client = TestClient(app)
+    for _ in range(3):
+        r = client.get("/health/detailed")
+        assert r.status_code == 200
+    body = r.json()
+    assert body["status"] == "healthy"
+    assert "sampled_at" in body["checks"]["system"]
+    assert client.get("/health/ready").json() == {"status": "ready"}
+    # Probed once, then served from the cached status
+    assert calls == [1]
+
+def test_metrics_endpoint_records_route_template():
+    from fastapi.testclient import TestClient
+    from apps.gateway.main import app
+
+    client = TestClient(app)
+    client.get("/workspaces/1")
+    r = client.get("/metrics")
+    assert r.status_code == 200
+    assert 'route="/workspaces/{workspace_id}"' in r.text
+    assert "ideahub_authz_decision_duration_seconds" in r.text
@@ -0,0 +1,47 @@
+from datetime import datetime, timedelta
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from apps.gateway.main import app
+from ideahub_platform.db.base import Base, get_db
+from ideahub_platform.db.models import Community, Workspace
+
+ANON = {"X-Debug-Auth": "anon"}
+
+@pytest.fixture
+def client():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine, tables=[t.__table__ for t in (Workspace, Community)])
+    session = sessionmaker(bind=engine)()
+    session.add(Workspace(id=1, name="w", url="w", owner_id=1))
+    start = datetime(2024, 1, 1)
+    session.add_all([
+        Community(id=i, workspace_id=1, name=f"community {i}", public=i != 2,
+                  created_at=start + timedelta(minutes=i))
+        for i in range(1, 5)
+    ])
+    session.commit()
+    app.dependency_overrides[get_db] = lambda: session
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db, None)
+    session.close()
+
+def test_get_community_separates_forbidden_from_missing(client):
+    """Test 200 for readable communities, 403 for private ones and 404 for unknown ids."""
+    assert client.get("/communities/1", headers=ANON).json()["name"] == "community 1"
+    assert client.get("/communities/2", headers=ANON).status_code == 403
+    assert client.get("/communities/2").json()["id"] == 2
+    assert client.get("/communities/99").status_code == 404
+    r = client.get("/communities/1", params={"fields": "name,password"})
+    assert r.status_code == 400
+
+def test_list_communities_pages_over_readable_rows(client):
+    """Test that anonymous pages skip private communities and tampered cursors are rejected."""
+    first = client.get("/communities", params={"limit": 2}, headers=ANON).json()
+    assert [item["id"] for item in first["items"]] == [4, 3]
+    rest = client.get("/communities", params={"limit": 2, "cursor": first["next_cursor"]}, headers=ANON).json()
+    assert [item["id"] for item in rest["items"]] == [1] and rest["next_cursor"] is None
+    assert client.get("/communities", params={"fields": "id"}).json()["items"][0] == {"id": 4}
+    assert client.get("/communities", params={"cursor": "bogus"}).status_code == 400
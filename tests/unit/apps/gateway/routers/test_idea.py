@@ -0,0 +1,72 @@
+from datetime import datetime
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from apps.gateway.main import app
+from ideahub_platform.db.base import Base, get_db
+from ideahub_platform.db.models import Community, Idea, Workspace
+from ideahub_platform.reporting.models import RelatedIdea
+from ideahub_platform.search import indexer
+from ideahub_platform.search.similar import SimilarIdeaIndex
+
+ANON = {"X-Debug-Auth": "anon"}
+TEXT = ("Install solar panels on the roof of the main office building to cut "
+        "our electricity bill and reduce carbon emissions every year")
+
+@pytest.fixture
+def session():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        execution_options={"schema_translate_map": {"reporting": None}},
+    )
+    Base.metadata.create_all(engine, tables=[t.__table__ for t in (Workspace, Community, RelatedIdea)])
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE ideas (id INTEGER PRIMARY KEY, community_id INTEGER, author_id INTEGER,"
+            " title TEXT, description TEXT, visibility TEXT, status TEXT, tags JSON,"
+            " metadata JSON, created_at TIMESTAMP, updated_at TIMESTAMP, search_vector TEXT)"
+        )
+    session = sessionmaker(bind=engine)()
+    session.add(Workspace(id=1, name="w", url="w", owner_id=1))
+    session.add(Community(id=10, workspace_id=1, name="a"))
+    session.execute(Idea.__table__.insert(), [
+        {"id": 1, "community_id": 10, "author_id": 1, "title": "solar roof", "visibility": "private"},
+        {"id": 2, "community_id": 10, "author_id": 2, "title": "solar carport", "visibility": "public"},
+    ])
+    session.add_all([
+        RelatedIdea(idea_id=1, related_idea_id=2, community_id=10, rank=1, score=0.9,
+                    computed_at=datetime(2024, 1, 1)),
+        RelatedIdea(idea_id=2, related_idea_id=1, community_id=10, rank=1, score=0.9,
+                    computed_at=datetime(2024, 1, 1)),
+    ])
+    session.commit()
+    app.dependency_overrides[get_db] = lambda: session
+    yield session
+    app.dependency_overrides.pop(get_db, None)
+    session.close()
+
+def test_related_ideas_require_reading_the_source_idea(session):
+    """Test that a private idea's neighbours are not served to callers who cannot read it."""
+    client = TestClient(app)
+    assert client.get("/ideas/1/related", headers=ANON).status_code == 403
+    assert client.get("/ideas/99/related").status_code == 404
+    assert client.get("/ideas/2/related", headers=ANON).json()["items"] == []
+    assert [item["id"] for item in client.get("/ideas/1/related").json()["items"]] == [2]
+
+def test_similar_ideas_hide_private_near_duplicates(session, monkeypatch):
+    """Test that a private near-duplicate is dropped for an anonymous caller but shown to its author."""
+    index = SimilarIdeaIndex(num_perm=64, threshold=0.5)
+    index.add(1, 1, indexer.idea_text("solar roof", TEXT))
+    index.add(2, 1, indexer.idea_text("solar carport", TEXT.replace("every year", "each year")))
+    monkeypatch.setattr(indexer, "similar_index", index)
+    client = TestClient(app)
+    query = {"title": "solar roof", "description": TEXT, "workspace_id": 1}
+
+    anonymous = client.post("/ideas/similar", json=query, headers=ANON).json()["items"]
+    assert [item["id"] for item in anonymous] == [2]
+    author = client.post("/ideas/similar", json=query).json()["items"]
+    assert sorted(item["id"] for item in author) == [1, 2]
@@ -0,0 +1 @@
+# Domain unit tests package
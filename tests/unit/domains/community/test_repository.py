@@ -0,0 +1,68 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from domains.community.repository import CommunityRepository
+from domains.community.rules import COMMUNITY_BINDING
+from domains.community.service import CommunityService
+from ideahub_platform.authz.registry import get_engine
+from ideahub_platform.common.errors import ValidationError
+from ideahub_platform.db.base import Base
+from ideahub_platform.db.models import Community, Workspace
+
+def make_service():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[t.__table__ for t in (Workspace, Community)])
+    session = sessionmaker(bind=engine)()
+    session.add_all([Workspace(id=1, name="w", url="w", owner_id=1), Workspace(id=2, name="v", url="v", owner_id=1)])
+    # Communities 1-3 share a timestamp so pages must break ties on id; even ids are private
+    start = datetime(2024, 1, 1)
+    session.add_all([
+        Community(id=i, workspace_id=1 if i < 6 else 2, name=f"community {i}", description="long text",
+                  public=bool(i % 2), created_at=start + timedelta(minutes=max(i, 3)))
+        for i in range(1, 8)
+    ])
+    session.commit()
+    return CommunityService(CommunityRepository(session))
+
+def test_keyset_pages_cover_every_community_once():
+    """Test newest-first keyset pages, including ties on created_at, and the workspace scope."""
+    svc = make_service()
+    fields = svc.fields(None)
+    seen, cursor = [], None
+    while True:
+        items, cursor = svc.list(fields, limit=3, cursor=cursor)
+        seen.extend(item["id"] for item in items)
+        if cursor is None:
+            break
+    assert seen == [7, 6, 5, 4, 3, 2, 1]
+
+    items, cursor = svc.list(fields, workspace_id=2, limit=5)
+    assert [item["id"] for item in items] == [7, 6] and cursor is None
+
+def test_fields_projection():
+    """Test that description is opt-in and unknown fields are rejected."""
+    svc = make_service()
+    assert "description" not in svc.get(1, svc.fields(None))
+    assert svc.get(1, svc.fields("name,description")) == {
+        "id": 1, "name": "community 1", "description": "long text"
+    }
+    with pytest.raises(ValidationError) as exc:
+        svc.fields("name,password")
+    assert exc.value.error_code == "INVALID_FIELDS"
+
+def test_community_binding_filters_like_decide():
+    """Test that COMMUNITY_READ compiled over COMMUNITY_BINDING hides private communities from anonymous callers."""
+    svc = make_service()
+    engine = get_engine()
+    fields = svc.fields("id")
+    anonymous = SimpleNamespace(is_authenticated=False, id=None, roles=[], is_admin=False)
+    member = SimpleNamespace(is_authenticated=True, id=1, roles=["user"], is_admin=False)
+
+    items, _ = svc.list(fields, visibility_filter=engine.sql_filter(anonymous, "COMMUNITY_READ", COMMUNITY_BINDING))
+    assert [item["id"] for item in items] == [7, 5, 3, 1]
+    items, _ = svc.list(fields, visibility_filter=engine.sql_filter(member, "COMMUNITY_READ", COMMUNITY_BINDING))
+    assert len(items) == 7
+    assert svc.get(2, fields, engine.sql_filter(anonymous, "COMMUNITY_READ", COMMUNITY_BINDING)) is None
+    assert svc.exists(2) and not svc.exists(99)
@@ -0,0 +1 @@
+# Idea domain unit tests package
@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from domains.idea.repository import IdeaRepository
+from domains.idea.service import IdeaService
+from ideahub_platform.common.errors import ValidationError
+from ideahub_platform.common.pagination import encode_cursor
+from ideahub_platform.db.base import Base
+from ideahub_platform.db.models import Community, Idea, Member, Workspace
+
+def make_service():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[t.__table__ for t in (Workspace, Community, Member)])
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE ideas (id INTEGER PRIMARY KEY, community_id INTEGER, author_id INTEGER,"
+            " title TEXT, description TEXT, visibility TEXT, status TEXT, tags JSON,"
+            " metadata JSON, created_at TIMESTAMP, updated_at TIMESTAMP, search_vector TEXT)"
+        )
+    session = sessionmaker(bind=engine)()
+    session.add(Workspace(id=1, name="w", url="w", owner_id=1))
+    session.add_all([Community(id=10, workspace_id=1, name="a"), Community(id=11, workspace_id=1, name="b")])
+    # Ideas 1-3 share a timestamp so pages must break ties on id
+    start = datetime(2024, 1, 1)
+    session.add_all([
+        Idea(id=i, community_id=10 if i % 2 else 11, author_id=1, title=f"idea {i}",
+             description="long text", created_at=start + timedelta(minutes=max(i, 3)))
+        for i in range(1, 8)
+    ])
+    session.commit()
+    return IdeaService(IdeaRepository(session))
+
+def test_keyset_pages_cover_every_idea_once():
+    """Test newest-first keyset pages, including ties on created_at."""
+    svc = make_service()
+    fields = svc.fields(None)
+    seen, cursor = [], None
+    while True:
+        items, cursor = svc.list(fields, limit=3, cursor=cursor)
+        seen.extend(item["id"] for item in items)
+        if cursor is None:
+            break
+    assert seen == [7, 6, 5, 4, 3, 2, 1]
+
+    items, cursor = svc.list(fields, community_id=11, limit=5)
+    assert [item["id"] for item in items] == [6, 4, 2] and cursor is None
+    with pytest.raises(ValidationError):
+        svc.list(fields, cursor=encode_cursor(["x", 1]))
+
+def test_fields_projection():
+    """Test that description is opt-in and unknown fields are rejected."""
+    svc = make_service()
+    assert "description" not in svc.get(1, svc.fields(None))
+    assert svc.get(1, svc.fields("title,description")) == {
+        "id": 1, "title": "idea 1", "description": "long text"
+    }
+    with pytest.raises(ValidationError) as exc:
+        svc.fields("title,password")
+    assert exc.value.error_code == "INVALID_FIELDS"
+
+def test_get_many_keeps_request_order_and_filters():
+    """Test bulk lookup order, missing ids and the visibility filter."""
+    svc = make_service()
+    fields = svc.fields("id")
+    assert [i["id"] for i in svc.get_many([5, 99, 2, 5], fields)] == [5, 2]
+    hidden = svc.get_many([5, 2], fields, visibility_filter=Idea.community_id == 11)
+    assert hidden == [{"id": 2}]
+    assert svc.get(5, fields, visibility_filter=Idea.community_id == 11) is None
+    assert svc.exists(5) and not svc.exists(99)
@@ -0,0 +1 @@
+# Member domain unit tests package
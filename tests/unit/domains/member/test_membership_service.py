@@ -0,0 +1,47 @@
+from domains.member.service import MembershipService, MembershipSet, attach_memberships
+from ideahub_platform.events.bus import Event, EventBus
+from ideahub_platform.events.event_types import EventType
+
+class FakeRepository:
+    def __init__(self, memberships):
+        self.memberships = memberships
+        self.calls = 0
+
+    def get_memberships(self, member_id):
+        self.calls += 1
+        return self.memberships.get(member_id, [])
+
+def test_membership_set_lookup():
+    """Test sorted-array membership checks and role lookup."""
+    memberships = MembershipSet([(9, "admin"), (2, "member"), (5, "member")])
+    assert list(memberships) == [2, 5, 9]
+    assert 5 in memberships
+    assert 4 not in memberships
+    assert "5" not in memberships
+    assert memberships.role_in(9) == "admin"
+    assert memberships.role_in(3) is None
+
+def test_membership_service_caches_and_invalidates_on_events():
+    """Test that memberships are loaded once and reloaded after a membership event."""
+    repo = FakeRepository({1: [(3, "member")]})
+    service = MembershipService(repo)
+    bus = EventBus()
+    service.subscribe(bus)
+
+    assert service.is_member(1, 3)
+    assert not service.is_member(1, 4)
+    assert repo.calls == 1
+
+    repo.memberships[1] = [(3, "member"), (4, "admin")]
+    bus.publish_sync(Event(EventType.MEMBER_JOINED, {"member_id": 1, "workspace_id": 4}))
+    assert service.memberships_for(1).role_in(4) == "admin"
+    assert repo.calls == 2
+
+def test_attach_memberships_to_subjects():
+    """Test that authenticated subjects get their membership set and anonymous ones do not."""
+    service = MembershipService(FakeRepository({1: [(3, "member")]}))
+    Subject = type('Subject', (), {'id': 1})
+    user, anon = Subject(), Subject()
+    user.is_authenticated, anon.is_authenticated = True, False
+    assert 3 in attach_memberships(user, service).workspace_memberships
+    assert not hasattr(attach_memberships(anon, service), "workspace_memberships")
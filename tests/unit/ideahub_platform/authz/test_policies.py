@@ -81,3 +81,175 @@ def test_action_matches_predicate():
     req = Request(subject=None, action="TEST_ACTION", resource=None, ctx={})
     assert action_matches(req, "TEST_ACTION") is True
     assert action_matches(req, "OTHER_ACTION") is False
+
+def test_engine_dispatch_keeps_priority_and_deny_semantics():
+    """Test that action-indexed dispatch decides exactly like a linear scan."""
+    from ideahub_platform.authz.dsl import action_is
+
+    policies = [
+        Policy("deny", [action_is("READ")], reason="deny_read_low", priority=5),
+        Policy("deny", [action_is("READ")], reason="deny_read_high", priority=50),
+        Policy("allow", [is_admin], reason="admin", priority=100),
+        Policy("allow", [is_authenticated, action_is("READ")], reason="read_auth", priority=40),
+        Policy("allow", [action_is("READ"), action_is("WRITE")], reason="never", priority=90),
+    ]
+    engine = Engine(policies)
+    anon = type('Subject', (), {'is_authenticated': False, 'is_admin': False})()
+    user = type('Subject', (), {'is_authenticated': True, 'is_admin': False})()
+    admin = type('Subject', (), {'is_authenticated': True, 'is_admin': True})()
+
+    assert engine.decide(Request(admin, "WRITE", None, {})).reason == "admin"
+    assert engine.decide(Request(user, "READ", None, {})).reason == "read_auth"
+    # All matching denies are evaluated; the lowest-priority one is reported
+    assert engine.decide(Request(anon, "READ", None, {})).reason == "deny_read_low"
+    assert engine.decide(Request(anon, "OTHER", None, {})).reason == "no_policy_matched"
+    # Contradictory action constraints can never match and are not indexed
+    assert all(c.policy.reason != "never" for c in engine.candidates("READ"))
+    assert [c.policy.reason for c in engine.candidates("UNKNOWN")] == ["admin"]
+
+def test_engine_load_recompiles_and_bumps_version():
+    """Test that reloading policies recompiles the dispatch table in place."""
+    from ideahub_platform.authz.dsl import action_is
+
+    engine = Engine([Policy("allow", [action_is("READ")], reason="read")])
+    version = engine.version
+    req = Request(subject=None, action="READ", resource=None, ctx={})
+    assert engine.decide(req).allow is True
+
+    engine.load([Policy("deny", [action_is("READ")], reason="read_denied")])
+    assert engine.version == version + 1
+    assert engine.decide(req).reason == "read_denied"
+
+def test_engine_decision_cache_and_versioned_invalidation():
+    """Test that cached decisions are reused until policies are reloaded."""
+    from ideahub_platform.authz.cache import DecisionCache
+    from ideahub_platform.authz.dsl import action_is
+
+    calls = []
+
+    def counting(req):
+        calls.append(req.action)
+        return True
+
+    engine = Engine([Policy("allow", [counting, action_is("READ")], reason="read")],
+                    cache=DecisionCache(ttl=60, maxsize=10))
+    subject = type('Subject', (), {'id': 1, 'is_authenticated': True, 'roles': ['user']})()
+    for _ in range(3):
+        assert engine.decide(Request(subject, "READ", {"id": 1}, {"request_id": "x"})).allow
+    assert len(calls) == 1
+    # A different resource is a different key
+    engine.decide(Request(subject, "READ", {"id": 2}, {}))
+    assert len(calls) == 2
+    assert engine.cache.stats()["hits"] == 2
+
+    engine.load([Policy("deny", [action_is("READ")], reason="read_denied")])
+    assert engine.decide(Request(subject, "READ", {"id": 1}, {})).reason == "read_denied"
+
+def test_decision_audit_samples_denies_and_allows():
+    """Test that the audit stream keeps every deny and only sampled allows."""
+    from ideahub_platform.authz.audit import DecisionAuditor
+    from ideahub_platform.authz.dsl import action_is
+
+    draws = iter([0.5, 0.005])
+    auditor = DecisionAuditor(allow_sample_rate=0.01, deny_sample_rate=1.0,
+                              sampler=lambda: next(draws))
+    engine = Engine([Policy("allow", [action_is("READ")], reason="read"),
+                     Policy("deny", [action_is("DELETE")], reason="delete_denied")],
+                    auditor=auditor)
+    subject = type('Subject', (), {'id': 7})()
+    engine.decide(Request(subject, "READ", {"id": 1}, {}))
+    engine.decide(Request(subject, "READ", {"id": 2}, {"request_id": "r2"}))
+    engine.decide(Request(subject, "DELETE", {"id": 3}, {}))
+    engine.decide_many(subject, "DELETE", [{"id": 4}, {"id": 5}])
+    auditor.stop()
+
+    recent = auditor.recent()
+    assert [(r.action, r.resource_id) for r in recent] == [
+        ("DELETE", 5), ("DELETE", 4), ("DELETE", 3), ("READ", 2)
+    ]
+    assert recent[3].request_id == "r2" and recent[3].subject_id == 7
+    assert [r.reason for r in auditor.recent(allow=False)] == ["delete_denied"] * 3
+
+def test_decide_many_matches_decide_per_item():
+    """Test that batch decisions equal per-item decisions and share subject checks."""
+    from ideahub_platform.authz.registry import policies
+
+    calls = []
+
+    def counted(r):
+        calls.append(1)
+        return is_authenticated(r)
+    counted.scope = "subject"
+    engine = Engine(list(policies) + [Policy("allow", [counted, lambda r: False], priority=60)])
+    Resource = type('Resource', (), {})
+    resources = []
+    for owner_id, public in [(1, False), (2, False), (2, True), (1, True)]:
+        resource = Resource()
+        resource.owner_id, resource.public = owner_id, public
+        resources.append(resource)
+
+    for authenticated in (True, False):
+        subject = type('Subject', (), {'id': 1, 'is_authenticated': authenticated,
+                                       'is_admin': False, 'roles': []})()
+        for action in ("IDEA_READ", "IDEA_WRITE", "COMMUNITY_READ", "UNKNOWN"):
+            batch = engine.decide_many(subject, action, resources)
+            for i, resource in enumerate(resources):
+                single = engine.decide(Request(subject, action, resource, {}))
+                assert bool(batch.allow[i]) == single.allow
+                assert batch.reasons[i] == single.reason
+
+    calls.clear()
+    engine.decide_many(subject, "IDEA_WRITE", resources)
+    assert len(calls) == 1
+
+def test_sql_filter_compiles_registry_policies():
+    """Test that list filters mirror the policies for each subject."""
+    from sqlalchemy.dialects import postgresql
+    from domains.idea.rules import IDEA_BINDING
+    from ideahub_platform.authz.registry import policies
+
+    engine = Engine(policies)
+
+    def render(subject, action):
+        clause = engine.sql_filter(subject, action, IDEA_BINDING)
+        return str(clause.compile(dialect=postgresql.dialect(),
+                                  compile_kwargs={"literal_binds": True}))
+
+    anon = type('Subject', (), {'id': None, 'is_authenticated': False, 'is_admin': False})()
+    user = type('Subject', (), {'id': 5, 'is_authenticated': True, 'is_admin': False})()
+    admin = type('Subject', (), {'id': 1, 'is_authenticated': True, 'is_admin': True})()
+
+    assert render(admin, "IDEA_READ") == "true"
+    assert render(user, "IDEA_READ") == "true"
+    assert render(anon, "IDEA_READ") == "ideas.visibility = 'public'"
+    assert render(user, "IDEA_WRITE") == "ideas.author_id = 5"
+    assert render(anon, "IDEA_WRITE") == "false"
+
+def test_sql_filter_workspace_member_and_opaque_predicates():
+    """Test membership compilation and that opaque predicates are rejected."""
+    import pytest
+    from sqlalchemy.dialects import postgresql
+    from domains.idea.rules import IDEA_BINDING
+    from ideahub_platform.authz.dsl import action_is, workspace_member
+    from ideahub_platform.common.errors import PolicyCompilationError
+
+    engine = Engine([Policy("allow", [workspace_member(), action_is("IDEA_READ")])])
+    member = type('Subject', (), {'id': 5, 'workspace_memberships': [3, 4]})()
+    sql = str(engine.sql_filter(member, "IDEA_READ", IDEA_BINDING).compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    assert "IN (3, 4)" in sql
+
+    engine = Engine([Policy("allow", [lambda r: True, action_is("IDEA_READ")])])
+    with pytest.raises(PolicyCompilationError):
+        engine.sql_filter(member, "IDEA_READ", IDEA_BINDING)
+
+def test_resource_owner_denies_anonymous_subjects():
+    """Test that a subject without an id owns nothing, at runtime and in SQL."""
+    from ideahub_platform.authz.dsl import ResourceOwner
+    from ideahub_platform.authz.predicates import is_resource_owner
+
+    anon = type('Subject', (), {'id': None})()
+    orphan = type('Resource', (), {'owner_id': None})()
+    assert not is_resource_owner(Request(anon, "READ", orphan, {}))
+    assert ResourceOwner().batch(anon, [orphan]) == [False]
+    assert str(ResourceOwner().to_sql(anon, None)) == "false"
@@ -0,0 +1 @@
+# Common unit tests package
@@ -0,0 +1,68 @@
+from ideahub_platform.common.tenant import (
+    CachedTenantResolver, WorkspaceRef, slug_from_host, slug_from_path
+)
+
+def test_slug_from_path():
+    """Test that the workspace slug is read from the /workspace/<slug> prefix."""
+    assert slug_from_path("/workspace/acme/communities") == "acme"
+    assert slug_from_path("http://example.com/workspace/acme") == "acme"
+    assert slug_from_path("/workspaces/1") is None
+    assert slug_from_path("/health") is None
+
+def test_slug_from_host():
+    """Test that the workspace slug is read from the subdomain."""
+    assert slug_from_host("acme.ideahub.com", "ideahub.com") == "acme"
+    assert slug_from_host("ACME.ideahub.com:8443", "ideahub.com") == "acme"
+    assert slug_from_host("www.ideahub.com", "ideahub.com") is None
+    assert slug_from_host("a.b.ideahub.com", "ideahub.com") is None
+    assert slug_from_host("ideahub.com", "ideahub.com") is None
+    assert slug_from_host("acme.ideahub.com", "") is None
+
+def test_cached_resolver_hits_loader_once():
+    """Test that repeat lookups, including misses, are served from the cache."""
+    calls = []
+
+    def loader(slug):
+        calls.append(slug)
+        return WorkspaceRef(id=7, name="Acme", url=slug) if slug == "acme" else None
+
+    resolver = CachedTenantResolver(loader=loader, base_domain="ideahub.com")
+    assert resolver.peek("acme") == (False, None)
+    for _ in range(3):
+        assert resolver.resolve("acme").id == 7
+        assert resolver.resolve("missing") is None
+    assert calls == ["acme", "missing"]
+    assert resolver.peek("acme") == (True, WorkspaceRef(id=7, name="Acme", url="acme"))
+
+    resolver.invalidate("acme")
+    resolver.resolve("acme")
+    assert calls == ["acme", "missing", "acme"]
+
+def test_tenant_middleware_sets_request_state():
+    """Test that the middleware exposes the resolved workspace on request.state."""
+    from fastapi import FastAPI, Request
+    from fastapi.testclient import TestClient
+    from apps.gateway.middleware import TenantMiddleware
+
+    calls = []
+
+    def loader(slug):
+        calls.append(slug)
+        return WorkspaceRef(id=3, name="Acme", url=slug)
+
+    app = FastAPI()
+    app.add_middleware(
+        TenantMiddleware,
+        resolver=CachedTenantResolver(loader=loader, base_domain="ideahub.com"),
+    )
+
+    @app.get("/{path:path}")
+    def echo(request: Request):
+        workspace = request.state.workspace
+        return {"workspace_id": workspace.id if workspace else None}
+
+    client = TestClient(app)
+    assert client.get("/workspace/acme/ideas").json() == {"workspace_id": 3}
+    assert client.get("/x", headers={"host": "acme.ideahub.com"}).json() == {"workspace_id": 3}
+    assert client.get("/health").json() == {"workspace_id": None}
+    assert calls == ["acme"]
@@ -0,0 +1 @@
+# DB unit tests package
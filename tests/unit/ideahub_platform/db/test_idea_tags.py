@@ -0,0 +1,88 @@
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from ideahub_platform.common.cache import TTLCache
+from ideahub_platform.db.base import Base
+from ideahub_platform.db.models import Community, Idea, IdeaTag, Member, TagFacetVersion, Workspace
+from ideahub_platform.search.facets import TagFacetService
+
+def make_session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[
+        t.__table__ for t in (Workspace, Community, Member, IdeaTag, TagFacetVersion)
+    ])
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE ideas (id INTEGER PRIMARY KEY, community_id INTEGER, author_id INTEGER,"
+            " title TEXT, description TEXT, visibility TEXT, status TEXT, tags JSON,"
+            " metadata JSON, created_at TIMESTAMP, updated_at TIMESTAMP, search_vector TEXT)"
+        )
+    session = sessionmaker(bind=engine)()
+    session.add(Workspace(id=1, name="w", url="w", owner_id=1))
+    session.add_all([Community(id=10, workspace_id=1, name="a"), Community(id=11, workspace_id=1, name="b")])
+    session.commit()
+    return session
+
+def version(session):
+    return session.scalar(select(TagFacetVersion.version).where(TagFacetVersion.workspace_id == 1))
+
+def test_tags_sync_on_write_and_facets_follow_version():
+    """Test that idea writes maintain idea_tags, bump the version and refresh cached facets."""
+    session = make_session()
+    first = Idea(id=1, community_id=10, author_id=1, title="a", tags=["Solar", " solar ", "Energy"])
+    session.add_all([first, Idea(id=2, community_id=11, author_id=1, title="b", tags=["energy"])])
+    session.commit()
+    assert sorted(session.scalars(select(IdeaTag.tag).where(IdeaTag.idea_id == 1))) == ["energy", "solar"]
+    assert version(session) == 1
+
+    service = TagFacetService(session, cache=TTLCache())
+    assert service.facets(1) == [{"tag": "energy", "count": 2}, {"tag": "solar", "count": 1}]
+    assert service.facets(1, community_id=11) == [{"tag": "energy", "count": 1}]
+    assert service.cache.stats()["misses"] == 2
+
+    first.title = "renamed"
+    session.commit()
+    assert version(session) == 1
+    service.facets(1)
+    assert service.cache.stats()["hits"] == 1
+
+    first.tags = ["Wind"]
+    session.commit()
+    assert version(session) == 2
+    assert service.facets(1) == [{"tag": "energy", "count": 1}, {"tag": "wind", "count": 1}]
+
+    session.delete(first)
+    session.commit()
+    assert service.facets(1) == [{"tag": "energy", "count": 1}]
+    assert version(session) == 3
+
+def test_public_only_facets_skip_private_ideas_and_are_cached_apart():
+    """Test that public-only counts leave out private ideas and follow visibility changes."""
+    session = make_session()
+    secret = Idea(id=1, community_id=10, author_id=1, title="a", visibility="private", tags=["secret", "solar"])
+    session.add_all([secret, Idea(id=2, community_id=10, author_id=1, title="b", tags=["solar"])])
+    session.commit()
+    service = TagFacetService(session, cache=TTLCache())
+    assert service.facets(1, public_only=True) == [{"tag": "solar", "count": 1}]
+    assert service.facets(1) == [{"tag": "solar", "count": 2}, {"tag": "secret", "count": 1}]
+
+    secret.visibility = "public"
+    session.commit()
+    assert version(session) == 2
+    assert service.facets(1, public_only=True) == [{"tag": "solar", "count": 2}, {"tag": "secret", "count": 1}]
+
+    secret.tags = ["wind"]
+    session.flush()
+    session.rollback()
+    secret.title = "renamed"
+    session.commit()
+    assert version(session) == 2
+
+def test_rebuild_backfills_existing_ideas():
+    """Test the backfill for ideas written before idea_tags existed."""
+    from ideahub_platform.db.models.idea_tag import rebuild_idea_tags
+    session = make_session()
+    session.execute(Idea.__table__.insert().values(id=5, community_id=10, author_id=1, title="x",
+                                                   tags=["Solar", "solar", "Wind"]))
+    assert rebuild_idea_tags(session.connection(), chunk_size=1) == 2
+    assert sorted(session.scalars(select(IdeaTag.tag))) == ["solar", "wind"]
+    assert version(session) == 1
@@ -0,0 +1,88 @@
+import pytest
+from sqlalchemy import create_engine, text
+from ideahub_platform.common.profiling import profile_request, query_budget
+from ideahub_platform.db.instrumentation import install_query_instrumentation
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    install_query_instrumentation(engine)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+        conn.execute(text("INSERT INTO items (id) VALUES (1), (2), (3)"))
+    return engine
+
+def test_profile_counts_statements(engine):
+    """Test that statements and DB time are counted inside a profile only."""
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        with profile_request() as profile:
+            conn.execute(text("SELECT id FROM items")).all()
+            conn.execute(text("SELECT 2"))
+    assert profile.statements == 2
+    assert profile.db_time > 0
+    assert "db;dur=" in profile.server_timing()
+
+def test_repeated_shapes_flag_n_plus_one(engine):
+    """Test that a statement repeated per row is reported as a repeated shape."""
+    with engine.connect() as conn, profile_request(repeat_threshold=2) as profile:
+        for item_id in (1, 2, 3):
+            conn.execute(text("SELECT id FROM items WHERE id = :id"), {"id": item_id})
+    assert list(profile.repeated_shapes().values()) == [3]
+
+def test_query_budget(engine):
+    """Test that query_budget fails when the block runs too many statements."""
+    with engine.connect() as conn:
+        with query_budget(1):
+            conn.execute(text("SELECT 1"))
+        with pytest.raises(AssertionError, match="Query budget exceeded"):
+            with query_budget(1):
+                conn.execute(text("SELECT 1"))
+                conn.execute(text("SELECT 2"))
+
+def test_slow_query_recorder_keeps_shapes_not_values(engine):
+    """Test that slow statements are recorded with parameter types only."""
+    from ideahub_platform.db.slow_queries import SlowQueryRecorder
+
+    recorder = SlowQueryRecorder(threshold_ms=0, explain_sample_rate=1.0, capacity=2)
+    recorder.install(engine)
+    with engine.connect() as conn:
+        for item_id in (1, 2, 3):
+            conn.execute(text("SELECT id FROM items WHERE id = :id"), {"id": item_id})
+    entries = recorder.entries()
+    assert len(entries) == 2
+    # sqlite uses positional (qmark) parameters
+    assert entries[0].parameter_shapes == ["int"]
+    # EXPLAIN is PostgreSQL-only
+    assert entries[0].plan is None
+
+def test_explain_always_rolls_back_its_savepoint():
+    """Test that EXPLAIN side effects are discarded and WITH queries are not executed."""
+    from ideahub_platform.db.slow_queries import SlowQueryRecorder
+
+    class FakeCursor:
+        def __init__(self):
+            self.connection = self
+            self.executed = []
+
+        def cursor(self):
+            return self
+
+        def execute(self, statement, parameters=None):
+            self.executed.append(statement)
+
+        def fetchone(self):
+            return [{"Plan": {}}]
+
+        def close(self):
+            pass
+
+    recorder = SlowQueryRecorder()
+    cursor = FakeCursor()
+    assert recorder._explain(cursor, "SELECT 1", None) == ({"Plan": {}}, None)
+    assert cursor.executed[1].startswith("EXPLAIN (ANALYZE")
+    assert cursor.executed[-2:] == ["ROLLBACK TO SAVEPOINT ideahub_explain",
+                                    "RELEASE SAVEPOINT ideahub_explain"]
+    cursor.executed.clear()
+    recorder._explain(cursor, "WITH d AS (DELETE FROM items RETURNING id) SELECT * FROM d", None)
+    assert cursor.executed[1].startswith("EXPLAIN (FORMAT JSON) WITH")
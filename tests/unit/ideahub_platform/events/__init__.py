@@ -0,0 +1 @@
+# Event bus unit tests package
@@ -0,0 +1,93 @@
+import asyncio
+import threading
+from ideahub_platform.events.bus import Event, EventBus
+from ideahub_platform.events.event_types import EventType
+
+def test_worker_pool_keeps_per_key_order_and_runs_sync_handlers_off_loop():
+    """Test that events with the same workspace are handled in publish order."""
+    seen = {}
+    threads = set()
+
+    def handler(event):
+        threads.add(threading.get_ident())
+        seen.setdefault(event.data["workspace_id"], []).append(event.data["n"])
+
+    async def run():
+        bus = EventBus(workers=3, ordering="key")
+        bus.subscribe(EventType.IDEA_CREATED, handler)
+        runner = asyncio.create_task(bus.start())
+        await asyncio.sleep(0)
+        for n in range(20):
+            await bus.publish(Event(EventType.IDEA_CREATED, {"workspace_id": n % 4, "n": n}))
+        await bus.stop()
+        await runner
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+    assert seen == {w: list(range(w, 20, 4)) for w in range(4)}
+    assert loop_thread not in threads
+
+def test_drop_oldest_overflow_policy():
+    """Test that a full queue discards its oldest event instead of blocking."""
+    handled = []
+
+    async def run():
+        bus = EventBus(workers=1, max_queue_size=2, overflow="drop_oldest", ordering="none")
+        bus.subscribe(EventType.IDEA_CREATED, lambda event: handled.append(event.data["n"]))
+        for n in range(5):
+            await bus.publish(Event(EventType.IDEA_CREATED, {"n": n}))
+        assert bus.queue_depth == 2
+        runner = asyncio.create_task(bus.start())
+        await asyncio.sleep(0)
+        await bus.stop()
+        await runner
+
+    asyncio.run(run())
+    assert handled == [3, 4]
+
+def test_drop_oldest_never_drops_stop_sentinels():
+    """Test that a publish during stop() cannot evict a worker's stop sentinel."""
+    handled = []
+
+    async def run():
+        bus = EventBus(workers=1, max_queue_size=1, overflow="drop_oldest", ordering="none")
+        release = asyncio.Event()
+
+        async def handler(event):
+            await release.wait()
+            handled.append(event.data["n"])
+
+        bus.subscribe(EventType.IDEA_CREATED, handler)
+        runner = asyncio.create_task(bus.start())
+        await bus.publish(Event(EventType.IDEA_CREATED, {"n": 0}))
+        await asyncio.sleep(0.01)
+        stopping = asyncio.create_task(bus.stop())
+        await asyncio.sleep(0.01)
+        await bus.publish(Event(EventType.IDEA_CREATED, {"n": 1}))
+        release.set()
+        await asyncio.wait_for(stopping, timeout=1)
+        await runner
+
+    asyncio.run(run())
+    assert handled == [0]
+
+def test_subscribe_batch_flushes_by_size_time_and_on_stop():
+    """Test that batch handlers get full batches, timed partial batches and a final flush."""
+    batches = []
+
+    async def handler(events):
+        batches.append([event.data["n"] for event in events])
+
+    async def run():
+        bus = EventBus(workers=2, ordering="event_type")
+        bus.subscribe_batch(EventType.IDEA_CREATED, handler, max_size=3, max_wait_ms=20)
+        runner = asyncio.create_task(bus.start())
+        for n in range(4):
+            await bus.publish(Event(EventType.IDEA_CREATED, {"n": n}))
+        await asyncio.sleep(0.1)
+        await bus.publish(Event(EventType.IDEA_CREATED, {"n": 4}))
+        await bus.stop()
+        await runner
+
+    asyncio.run(run())
+    assert batches == [[0, 1, 2], [3], [4]]
@@ -0,0 +1,24 @@
+from datetime import datetime, timezone
+import pytest
+from ideahub_platform.events import codec
+from ideahub_platform.events.event_types import Event, EventType, IdeaEventData, MemberEventData
+
+def test_codec_round_trips_typed_and_free_form_payloads():
+    """Test that typed payloads, dict payloads and envelope ids survive encoding."""
+    events = [
+        Event(EventType.IDEA_CREATED, IdeaEventData(1, 2, 3, "Ünïcode title", "public"),
+              event_id="e1", correlation_id="c1"),
+        Event(EventType.MEMBER_JOINED,
+              MemberEventData(5, 6, "admin", datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)),
+              user_id="42"),
+        Event(EventType.IDEA_VOTED, {"idea_id": 1, "delta": -1}),
+    ]
+    for event in events:
+        assert codec.decode(codec.encode(event)) == event
+
+def test_codec_is_compact_and_versioned():
+    """Test that typed payloads carry no field names and unknown versions are rejected."""
+    payload = codec.encode(Event(EventType.IDEA_CREATED, IdeaEventData(1, 2, 3, "t", "public")))
+    assert b"idea_id" not in payload and len(payload) < 60
+    with pytest.raises(codec.EventCodecError):
+        codec.decode(bytes((codec.CODEC_VERSION + 1,)) + payload[1:])
@@ -0,0 +1,52 @@
+import asyncio
+from ideahub_platform.events.bus import Event, EventBus
+from ideahub_platform.events.dedup import EventDeduplicator
+from ideahub_platform.events.event_types import EventType
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_deduplicator_window_and_bound():
+    """Test that ids are remembered for the window and memory stays bounded."""
+    clock = FakeClock()
+    dedup = EventDeduplicator(window_seconds=10, max_entries=3, clock=clock)
+    event = Event(EventType.IDEA_VOTED, {"idea_id": 1}, event_id="a")
+    assert not dedup.is_duplicate(event)
+    assert dedup.is_duplicate(event)
+    clock.now = 11
+    assert not dedup.is_duplicate(event)
+    for event_id in "bcde":
+        dedup.is_duplicate(Event(EventType.IDEA_VOTED, {}, event_id=event_id))
+    assert len(dedup) == 3
+    assert not dedup.is_duplicate(Event(EventType.IDEA_VOTED, {}, event_id=None))
+
+def test_dedup_middleware_drops_redelivered_events():
+    """Test that publish assigns ids and middleware drops a redelivered event."""
+    counted = []
+    wrapped = []
+    dedup = EventDeduplicator()
+
+    async def run():
+        bus = EventBus(workers=1)
+        bus.add_middleware(dedup)
+        bus.subscribe(EventType.IDEA_VOTED, lambda event: counted.append(event.event_id))
+        runner = asyncio.create_task(bus.start())
+        await asyncio.sleep(0)
+        first = Event(EventType.IDEA_VOTED, {"idea_id": 1})
+        await bus.publish(first)
+        await bus.publish(Event(EventType.IDEA_VOTED, {"idea_id": 1}, event_id=first.event_id))
+        await bus.publish(Event(EventType.IDEA_VOTED, {"idea_id": 1}))
+        await bus.stop()
+        await runner
+
+    asyncio.run(run())
+    assert len(counted) == 2 and counted[0] is not None
+
+    handler = dedup.wrap(lambda event: wrapped.append(event.event_id))
+    for event_id in ("x", "x", "y"):
+        handler(Event(EventType.IDEA_VOTED, {}, event_id=event_id))
+    assert wrapped == ["x", "y"]
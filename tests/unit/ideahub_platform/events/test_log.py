@@ -0,0 +1,63 @@
+import os
+import pytest
+from ideahub_platform.events.bus import Event
+from ideahub_platform.events.event_types import EventType
+from ideahub_platform.events.log import EventLog, EventLogLockedError
+
+def test_event_log_replays_across_segments_and_reopens(tmp_path):
+    """Test offsets, type-filtered replay, rotation and recovery after reopening."""
+    log = EventLog(str(tmp_path), segment_bytes=512)
+    for n in range(20):
+        event_type = EventType.IDEA_CREATED if n % 2 == 0 else EventType.IDEA_VOTED
+        assert log.append(Event(event_type, {"n": n})) == n
+    assert len([name for name in os.listdir(tmp_path) if name.endswith(".log")]) > 1
+
+    assert [offset for offset, _ in log.replay(15)] == [15, 16, 17, 18, 19]
+    voted = [event.data["n"] for _, event in log.replay(0, [EventType.IDEA_VOTED])]
+    assert voted == list(range(1, 20, 2))
+    with pytest.raises(EventLogLockedError):
+        EventLog(str(tmp_path))
+    log.close()
+
+    reopened = EventLog(str(tmp_path), segment_bytes=512)
+    assert reopened.next_offset == 20
+    assert reopened.append(Event(EventType.IDEA_CREATED, {"n": 20})) == 20
+    assert [event.data["n"] for _, event in reopened.replay(18)] == [18, 19, 20]
+    reopened.close()
+
+def test_event_log_retention_drops_oldest_segments(tmp_path):
+    """Test that sealed segments beyond the size budget are removed oldest first."""
+    log = EventLog(str(tmp_path), segment_bytes=256, retention_bytes=600)
+    for n in range(40):
+        log.append(Event(EventType.IDEA_CREATED, {"n": n}))
+    offsets = [offset for offset, _ in log.replay()]
+    assert offsets[0] > 0 and offsets[-1] == 39
+    assert offsets == list(range(offsets[0], 40))
+    log.close()
+
+def test_each_worker_logs_its_own_events_and_replay_merges_them(tmp_path):
+    """Test per-worker logs: no transport needed, and replay sees every worker's events."""
+    import asyncio
+    from ideahub_platform.events.bus import EventBus
+    from ideahub_platform.events.log import open_event_log
+
+    first, second = open_event_log(str(tmp_path)), open_event_log(str(tmp_path))
+    assert os.path.basename(first.directory) == "worker-0"
+    assert os.path.basename(second.directory) == "worker-1"
+
+    async def publish(bus, timestamps):
+        for ts in timestamps:
+            await bus.publish(Event(EventType.IDEA_CREATED, {"ts": ts}, timestamp=ts))
+
+    buses = [EventBus(workers=1), EventBus(workers=1)]
+    for bus, event_log in zip(buses, (first, second)):
+        bus.set_event_log(event_log)
+    asyncio.run(publish(buses[0], [1.0, 3.0]))
+    asyncio.run(publish(buses[1], [2.0, 4.0]))
+
+    replayed = list(buses[0].replay())
+    assert [event.data["ts"] for _, _, event in replayed] == [1.0, 2.0, 3.0, 4.0]
+    assert [(name, offset) for name, offset, _ in replayed][:2] == [("worker-0", 0), ("worker-1", 0)]
+    assert [e.data["ts"] for _, _, e in buses[1].replay(since=2.5)] == [3.0, 4.0]
+    first.close()
+    second.close()
@@ -0,0 +1,85 @@
+from datetime import datetime, timezone
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from ideahub_platform.db.models.outbox import OutboxEvent
+from ideahub_platform.events.bus import Event, EventBus
+from ideahub_platform.events.event_types import EventType, MemberEventData
+from ideahub_platform.events.outbox import OutboxRelay, add_to_outbox
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite://")
+    OutboxEvent.__table__.create(engine)
+    return sessionmaker(bind=engine)
+
+def test_outbox_rows_follow_the_session_transaction(session_factory):
+    """Test that only committed outbox rows are relayed, in order, and marked processed."""
+    with session_factory() as session:
+        add_to_outbox(session, Event(EventType.IDEA_CREATED, {"idea_id": 1}))
+        session.rollback()
+    with session_factory() as session:
+        for idea_id in (2, 3, 4):
+            add_to_outbox(session, Event(EventType.IDEA_CREATED, {"idea_id": idea_id}))
+        session.commit()
+
+    relay = OutboxRelay(session_factory, EventBus(), batch_size=2)
+    dispatched = []
+    assert relay.relay_batch(dispatched.extend) == 2
+    assert relay.relay_batch(dispatched.extend) == 1
+    assert relay.relay_batch(dispatched.extend) == 0
+    assert [event.data["idea_id"] for event in dispatched] == [2, 3, 4]
+    assert all(event.event_id for event in dispatched)
+    with session_factory() as session:
+        pending = session.scalars(select(OutboxEvent).where(OutboxEvent.processed_at.is_(None)))
+        assert pending.all() == []
+
+def test_failed_dispatch_leaves_rows_pending(session_factory):
+    """Test that a batch is re-delivered when dispatch fails before commit."""
+    with session_factory() as session:
+        add_to_outbox(session, Event(EventType.IDEA_CREATED, {"idea_id": 1}))
+        session.commit()
+
+    def failing(events):
+        raise RuntimeError("bus unavailable")
+
+    relay = OutboxRelay(session_factory, EventBus())
+    with pytest.raises(RuntimeError):
+        relay.relay_batch(failing)
+    dispatched = []
+    assert relay.relay_batch(dispatched.extend) == 1
+    assert dispatched[0].data == {"idea_id": 1}
+
+def test_typed_payloads_with_datetimes_are_staged_and_relayed(session_factory):
+    """Test that a MemberEventData payload is stored as JSON and relayed as the same dataclass."""
+    joined = MemberEventData(5, 6, "admin", datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc))
+    with session_factory() as session:
+        add_to_outbox(session, Event(EventType.MEMBER_JOINED, joined))
+        add_to_outbox(session, Event(EventType.IDEA_VOTED, {"idea_id": 1, "at": joined.joined_at}))
+        session.commit()
+
+    dispatched = []
+    assert OutboxRelay(session_factory, EventBus()).relay_batch(dispatched.extend) == 2
+    assert dispatched[0].data == joined
+    assert dispatched[1].data == {"idea_id": 1, "at": joined.joined_at}
+
+def test_undecodable_rows_are_dead_lettered(session_factory):
+    """Test that a row with an unknown event type or bad payload does not block the rows after it."""
+    with session_factory() as session:
+        add_to_outbox(session, Event(EventType.IDEA_CREATED, {"idea_id": 1}))
+        session.add(OutboxEvent(event_type="idea.renamed", payload={}, event_id="bad-type"))
+        session.add(OutboxEvent(event_type="member.joined", payload={"$schema": 99}, event_id="bad-payload"))
+        add_to_outbox(session, Event(EventType.IDEA_CREATED, {"idea_id": 2}))
+        session.commit()
+
+    dispatched = []
+    relay = OutboxRelay(session_factory, EventBus())
+    assert relay.relay_batch(dispatched.extend) == 4
+    assert [event.data["idea_id"] for event in dispatched] == [1, 2]
+    assert relay.relay_batch(dispatched.extend) == 0
+    with session_factory() as session:
+        failed = session.execute(
+            select(OutboxEvent.event_id, OutboxEvent.error).where(OutboxEvent.error.is_not(None))
+        ).all()
+        assert [event_id for event_id, _ in failed] == ["bad-type", "bad-payload"]
+        assert "ValueError" in failed[0].error and "schema 99" in failed[1].error
@@ -0,0 +1,155 @@
+import asyncio
+import base64
+import os
+import socket
+import tempfile
+from types import SimpleNamespace
+import psycopg2
+import pytest
+from ideahub_platform.events.bus import Event, EventBus
+from ideahub_platform.events.event_types import EventType
+from ideahub_platform.events.transport import (
+    PostgresTransport,
+    UnixSocketBroker,
+    UnixSocketTransport,
+    coalesce_key,
+    decode_event,
+    encode_event,
+)
+
+def test_event_codec_round_trip():
+    """Test that the compact encoding round-trips event fields."""
+    event = Event(EventType.MEMBER_JOINED, {"member_id": 1}, event_id="e1", user_id="7")
+    payload = encode_event(event, "w1")
+    origin, decoded = decode_event(payload)
+    assert origin == "w1"
+    assert (decoded.event_type, decoded.data, decoded.event_id, decoded.user_id) == \
+        (event.event_type, event.data, "e1", "7")
+    assert decoded.timestamp == event.timestamp
+
+def test_only_opt_in_event_types_coalesce():
+    """Test that events are never merged unless their type opted in."""
+    event = Event(EventType.MEMBER_JOINED, {"member_id": 1})
+    assert coalesce_key(event, frozenset()) is None
+    assert coalesce_key(event, frozenset([EventType.MEMBER_JOINED])) == \
+        coalesce_key(Event(EventType.MEMBER_JOINED, {"member_id": 1}), frozenset([EventType.MEMBER_JOINED]))
+
+def fan_out(member_ids, coalesce_types):
+    received = {"a": [], "b": []}
+
+    async def run(path):
+        broker = UnixSocketBroker(path)
+        await broker.start()
+        buses = {}
+        runners = []
+        for name in ("a", "b"):
+            bus = EventBus(workers=1)
+            bus.subscribe(EventType.MEMBER_JOINED,
+                          lambda event, name=name: received[name].append(event.data["member_id"]))
+            bus.set_transport(UnixSocketTransport(path, coalesce_ms=20, coalesce_types=coalesce_types))
+            runners.append(asyncio.create_task(bus.start()))
+            buses[name] = bus
+        await asyncio.sleep(0.05)
+
+        for member_id in member_ids:
+            await buses["a"].publish(Event(EventType.MEMBER_JOINED, {"member_id": member_id}))
+        await asyncio.sleep(0.2)
+        for bus in buses.values():
+            await bus.stop()
+        await asyncio.gather(*runners)
+        await broker.stop()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(run(os.path.join(tmp, "events.sock")))
+    return received
+
+def test_unix_socket_fan_out_delivers_every_event():
+    """Test that by default every event reaches the other buses."""
+    received = fan_out((1, 1, 2, 1), coalesce_types=())
+    assert received["a"] == received["b"] == [1, 1, 2, 1]
+
+def test_unix_socket_fan_out_coalesces_opt_in_invalidations():
+    """Test that repeats of an opted-in invalidation type are sent once per window."""
+    received = fan_out((1, 1, 2, 1), coalesce_types=[EventType.MEMBER_JOINED])
+    assert received["a"] == [1, 1, 2, 1]
+    assert received["b"] == [1, 2]
+
+class FakeConnection:
+    """psycopg2 connection stand-in whose socket can be made readable and whose calls can fail."""
+
+    def __init__(self):
+        self.reader, self.writer = socket.socketpair()
+        self.notifies = []
+        self.statements = []
+        self.broken = False
+        self.closed = False
+
+    def fileno(self):
+        return self.reader.fileno()
+
+    def poll(self):
+        self.reader.recv(64)
+        if self.broken:
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+
+    def cursor(self):
+        conn = self
+
+        class Cursor:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def execute(self, statement, params=None):
+                if conn.broken:
+                    raise psycopg2.OperationalError("server closed the connection unexpectedly")
+                conn.statements.append(statement)
+
+        return Cursor()
+
+    def close(self):
+        self.closed = True
+        self.reader.close()
+        self.writer.close()
+
+def test_postgres_transport_reconnects_lost_connections():
+    """Test that a dropped LISTEN connection is reopened and a dropped NOTIFY connection is replaced."""
+    connections = []
+    received = []
+
+    def connect_raw():
+        connections.append(FakeConnection())
+        return connections[-1]
+
+    async def deliver(event):
+        received.append(event.data["member_id"])
+
+    async def run():
+        transport = PostgresTransport(channel="events", coalesce_ms=0)
+        transport._connect_raw = connect_raw
+        await transport.start(deliver)
+        listen, notify = connections
+
+        listen.broken = True
+        listen.writer.send(b"x")
+        await asyncio.sleep(0.05)
+        assert listen.closed and len(connections) == 3
+        relistened = connections[2]
+        assert relistened.statements == ['LISTEN "events"']
+        payload = encode_event(Event(EventType.MEMBER_JOINED, {"member_id": 7}), "other-worker")
+        relistened.notifies.append(SimpleNamespace(payload=base64.b64encode(payload).decode()))
+        relistened.writer.send(b"x")
+        await asyncio.sleep(0.05)
+        assert received == [7]
+
+        notify.broken = True
+        with pytest.raises(psycopg2.OperationalError):
+            await transport._send_payloads([payload])
+        await transport._send_payloads([payload])
+        assert notify.closed and len(connections[3].statements) == 1
+        await transport.stop()
+        assert relistened.closed and connections[3].closed
+
+    asyncio.run(run())
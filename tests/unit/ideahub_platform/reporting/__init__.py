@@ -0,0 +1 @@
+# Reporting unit tests package
@@ -0,0 +1,100 @@
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from ideahub_platform.db.base import Base
+from ideahub_platform.db.models.idea import Idea
+from ideahub_platform.reporting.models import RelatedIdea, RelatedIdeasRun
+from ideahub_platform.reporting.related import (
+    RelatedIdeasProcessor,
+    RelatedIdeasService,
+    TfidfMatrix,
+)
+
+def test_tfidf_cosine_neighbours():
+    """Test normalization, sparse similarities and blocked top-k."""
+    matrix = TfidfMatrix([
+        ["solar", "roof", "panels"],
+        ["solar", "panels", "carport"],
+        ["bike", "sharing"],
+        ["bike", "lanes", "sharing"],
+    ], max_df=1.0)
+    assert matrix.shape == (4, 7)
+    row = range(matrix.indptr[0], matrix.indptr[1])
+    assert abs(sum(matrix.data[k] ** 2 for k in row) - 1.0) < 1e-9
+    assert set(matrix.similarities(0)) == {1}
+
+    blocks = list(matrix.top_k(range(4), k=2, min_score=0.0, block_size=3))
+    assert [len(block) for block in blocks] == [3, 1]
+    assert blocks[0][0][0][0] == 1 and blocks[1][3][0][0] == 2
+
+    capped = TfidfMatrix([["solar", "roof"], ["solar", "carport"], ["solar", "bike"]],
+                         max_df=1.0, max_postings=2)
+    assert "solar" not in capped.vocabulary
+
+def test_small_communities_keep_shared_terms():
+    """Test that max_df does not prune the terms two near-duplicates share in a tiny community."""
+    matrix = TfidfMatrix([["solar", "roof", "panels"], ["solar", "roof", "panel"], ["bike", "lanes"]])
+    assert "solar" in matrix.vocabulary
+    assert [i for i, _ in next(matrix.top_k(range(3), k=2, min_score=0.0))[0]] == [1]
+
+def make_session():
+    engine = create_engine("sqlite://", execution_options={"schema_translate_map": {"reporting": None}})
+    Base.metadata.create_all(engine, tables=[RelatedIdea.__table__, RelatedIdeasRun.__table__])
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE ideas (id INTEGER PRIMARY KEY, community_id INTEGER, author_id INTEGER,"
+            " title TEXT, description TEXT, visibility TEXT, status TEXT, tags JSON,"
+            " metadata JSON, created_at TIMESTAMP, updated_at TIMESTAMP)"
+        )
+    return sessionmaker(bind=engine)()
+
+def add_idea(session, idea_id, title, updated_at, community_id=1):
+    session.execute(
+        Idea.__table__.insert().values(
+            id=idea_id, community_id=community_id, author_id=1, title=title, description="",
+            visibility="public", tags=[], updated_at=updated_at,
+        )
+    )
+    session.commit()
+
+def test_job_refreshes_incrementally_and_serves_lookups():
+    """Test a full run, an incremental run for a changed idea, and the read path."""
+    session = make_session()
+    earlier = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for idea_id, title in enumerate(["solar roof panels", "solar panels carport",
+                                     "bike sharing scheme", "bike lanes sharing",
+                                     "quiet phone booths"], start=1):
+        add_idea(session, idea_id, title, earlier)
+    processor = RelatedIdeasProcessor(session)
+    assert processor.refresh_community(1)["updated"] == 5
+
+    related = RelatedIdeasService(session).related(1)
+    assert [item["id"] for item in related] == [2]
+    assert related[0]["title"] == "solar panels carport"
+
+    add_idea(session, 6, "rooftop solar panels", earlier + timedelta(days=1))
+    result = processor.refresh_community(1)
+    assert 0 < result["updated"] < 6
+    assert 6 in [item["id"] for item in RelatedIdeasService(session).related(1)]
+    assert [item["id"] for item in RelatedIdeasService(session).related(3)] == [4]
+    run = session.scalars(select(RelatedIdeasRun)).one()
+    assert run.idea_count == 6
+
+def test_moved_idea_keeps_rows_of_its_new_community():
+    """Test that refreshing the old community does not delete a moved idea's new rows."""
+    session = make_session()
+    earlier = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for idea_id, title in enumerate(["solar roof panels", "solar panels carport",
+                                     "bike sharing scheme"], start=1):
+        add_idea(session, idea_id, title, earlier)
+    for idea_id, title in enumerate(["solar carport roof", "bike lanes", "quiet booths"], start=4):
+        add_idea(session, idea_id, title, earlier, community_id=2)
+    processor = RelatedIdeasProcessor(session)
+    processor.refresh_community(1)
+
+    session.execute(Idea.__table__.update().where(Idea.id == 2).values(
+        community_id=2, updated_at=earlier + timedelta(days=1)))
+    session.commit()
+    processor.refresh_community(2)
+    processor.refresh_community(1)
+    assert [item["id"] for item in RelatedIdeasService(session).related(2)] == [4]
@@ -0,0 +1 @@
+# Search unit tests package
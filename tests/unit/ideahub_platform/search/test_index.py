@@ -0,0 +1,104 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from ideahub_platform.common.errors import ValidationError
+from ideahub_platform.common.pagination import decode_cursor, encode_cursor
+from ideahub_platform.db.base import Base
+from ideahub_platform.db.models import Community, Member, Workspace
+from ideahub_platform.events.event_types import Event, EventType, IdeaEventData
+from ideahub_platform.search.index import InvertedIndex, tokenize
+from ideahub_platform.search.indexer import IdeaIndexer
+
+def build_index():
+    index = InvertedIndex()
+    index.add(1, "Solar panels on the roof", "Cut energy costs with solar", community_id=10, workspace_id=1)
+    index.add(2, "Bike sharing", "Shared bikes and solar charging", community_id=10, workspace_id=1)
+    index.add(3, "Solar carport", "", ["solar", "parking"], community_id=20, workspace_id=2)
+    index.add(4, "Quiet rooms", "Phone booths for calls", community_id=10, workspace_id=1, public=False)
+    return index
+
+def test_bm25_ranking_scoping_and_pagination():
+    """Test ranking, workspace scoping, cursor paging and the allow callback."""
+    assert tokenize("The Solar-Panels of 2024!") == ["solar", "panels", "2024"]
+    index = build_index()
+
+    page = index.search("solar", workspace_id=1)
+    assert [hit.id for hit in page.items] == [1, 2]
+    assert page.items[0].score > page.items[1].score
+    assert page.next_cursor is None
+
+    first = index.search("solar", limit=2)
+    assert len(first.items) == 2 and first.next_cursor
+    assert decode_cursor(first.next_cursor, (float, int))[1] == first.items[-1].id
+    rest = index.search("solar", limit=2, cursor=first.next_cursor)
+    assert {h.id for h in first.items + rest.items} == {1, 2, 3}
+    with pytest.raises(ValidationError):
+        index.search("solar", cursor=encode_cursor(["x", 1]))
+
+    page = index.search("phone solar", allow=lambda ideas: [idea.public for idea in ideas])
+    assert 4 not in [hit.id for hit in page.items]
+    assert index.search("the of", workspace_id=1).items == []
+
+def test_updates_deletes_and_snapshot(tmp_path):
+    """Test that updates replace postings, deletes compact, and snapshots round-trip."""
+    index = build_index()
+    index.add(2, "Bike lanes", "Protected lanes", community_id=10, workspace_id=1)
+    assert [hit.id for hit in index.search("solar", workspace_id=1).items] == [1]
+    assert [hit.id for hit in index.search("lanes").items] == [2]
+
+    index.remove(1)
+    index.compact()
+    assert index.search("roof").items == []
+    assert len(index) == 3
+
+    path = str(tmp_path / "ideas.idx")
+    index.save(path)
+    restored = InvertedIndex.load(path)
+    assert len(restored) == 3
+    assert [hit.id for hit in restored.search("solar").items] == [3]
+    restored.add(5, "Solar roof tiles", community_id=10, workspace_id=1)
+    assert [hit.id for hit in restored.search("roof").items] == [5]
+
+def test_updates_compact_and_renumber_documents():
+    """Test that repeated updates trigger compaction and keep slots bounded."""
+    index = build_index()
+    for version in range(50):
+        index.add(3, f"Solar carport v{version}", community_id=20, workspace_id=2)
+    assert index.document_slots <= 6
+    assert len(index) == 4
+    assert [hit.id for hit in index.search("carport").items] == [3]
+    assert [hit.id for hit in index.search("v49").items] == [3]
+    assert index.search("v48").items == []
+    assert [hit.id for hit in index.search("bike").items] == [2]
+
+def test_indexer_refreshes_from_database():
+    """Test that idea events re-read ideas from the database."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[t.__table__ for t in (Workspace, Community, Member)])
+    session_factory = sessionmaker(bind=engine)
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE ideas (id INTEGER PRIMARY KEY, community_id INTEGER, author_id INTEGER,"
+            " title TEXT, description TEXT, visibility TEXT, status TEXT, tags JSON,"
+            " metadata JSON, created_at TIMESTAMP, updated_at TIMESTAMP)"
+        )
+        conn.exec_driver_sql("INSERT INTO workspaces (id, name, url, owner_id) VALUES (1, 'w', 'w', 5)")
+        conn.exec_driver_sql("INSERT INTO communities (id, workspace_id, name) VALUES (10, 1, 'c')")
+        conn.exec_driver_sql(
+            "INSERT INTO ideas (id, community_id, author_id, title, description, visibility, tags)"
+            " VALUES (1, 10, 5, 'Solar roof', 'panels', 'public', '[\"energy\"]')"
+        )
+
+    index = InvertedIndex()
+    indexer = IdeaIndexer(index, session_factory)
+    indexer.handle_events([
+        Event(EventType.IDEA_CREATED, IdeaEventData(1, 10, 5, "Solar roof", "public")),
+        Event(EventType.IDEA_DELETED, {"idea_id": 2}),
+    ])
+    hits = index.search("energy", workspace_id=1).items
+    assert [(hit.id, hit.community_id) for hit in hits] == [(1, 10)]
+
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DELETE FROM ideas")
+    indexer.refresh([1])
+    assert len(index) == 0
@@ -0,0 +1,47 @@
+from types import SimpleNamespace
+import pytest
+from sqlalchemy.dialects import postgresql
+from ideahub_platform.common.errors import ValidationError
+from ideahub_platform.common.pagination import decode_cursor, encode_cursor
+from ideahub_platform.search import IdeaSearchService
+
+class FakeSession:
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    def execute(self, stmt):
+        self.statements.append(stmt)
+        return SimpleNamespace(all=lambda: self.rows)
+
+def compiled(stmt):
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+def test_search_is_ranked_scoped_and_keyset_paginated():
+    """Test the generated FTS query and cursor handling."""
+    rows = [SimpleNamespace(id=n, title=f"idea {n}", community_id=3, rank=0.5) for n in (9, 8, 7)]
+    session = FakeSession(rows)
+    page = IdeaSearchService(session).search("solar panels", workspace_id=1, limit=2)
+    sql = compiled(session.statements[0])
+    assert "ideas.search_vector @@ websearch_to_tsquery" in sql
+    assert "communities.workspace_id =" in sql
+    assert "ORDER BY ts_rank_cd(ideas.search_vector" in sql
+    assert [hit.id for hit in page.items] == [9, 8]
+    assert decode_cursor(page.next_cursor, (float, int)) == [0.5, 8]
+
+    IdeaSearchService(session).search("solar", cursor=page.next_cursor)
+    assert "(ts_rank_cd(ideas.search_vector" in compiled(session.statements[1])
+    assert "CAST(%(param_1)s AS REAL)" in compiled(session.statements[1])
+
+def test_cursor_round_trip_and_validation():
+    """Test that cursors round-trip datetimes and reject tampering."""
+    from datetime import datetime, timezone
+    moment = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+    assert decode_cursor(encode_cursor([moment, 42]), (datetime, int)) == [moment, 42]
+    tampered = ["not-a-cursor", encode_cursor([{"$dt": "nope"}, 1]), encode_cursor(["x", 1]),
+                encode_cursor([0.5, True]), encode_cursor([moment])]
+    for cursor in tampered:
+        with pytest.raises(ValidationError) as exc:
+            decode_cursor(cursor, (datetime, int))
+        assert exc.value.error_code == "INVALID_CURSOR"
+    assert decode_cursor(encode_cursor([1, 8]), (float, int)) == [1, 8]
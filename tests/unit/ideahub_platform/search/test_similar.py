@@ -0,0 +1,31 @@
+from ideahub_platform.search.similar import SimilarIdeaIndex, choose_bands
+
+BASE = ("Install solar panels on the roof of the main office building to cut "
+        "our electricity bill and reduce carbon emissions every year")
+
+def test_near_duplicates_are_found_per_workspace():
+    """Test that edited copies match, unrelated text and other workspaces do not."""
+    index = SimilarIdeaIndex(num_perm=64, threshold=0.5)
+    index.add(1, 1, BASE)
+    index.add(2, 1, "Offer bike sharing and showers for staff who cycle to work daily")
+    index.add(3, 2, BASE)
+
+    matches = index.similar(1, BASE.replace("every year", "each year"))
+    assert [idea_id for idea_id, _ in matches] == [1]
+    assert 0.5 <= matches[0][1] < 1.0
+    assert index.similar(1, BASE, exclude=1) == []
+    assert index.similar(9, BASE) == []
+
+    index.remove(1)
+    assert index.similar(1, BASE) == []
+
+def test_band_layout_and_memory_budget():
+    """Test band selection and eviction of the oldest ideas beyond the budget."""
+    bands, rows = choose_bands(64, 0.5)
+    assert bands * rows == 64 and abs((1 / bands) ** (1 / rows) - 0.5) < 0.1
+
+    index = SimilarIdeaIndex(num_perm=16, max_memory_bytes=1)
+    index.add(1, 1, BASE)
+    index.add(2, 1, BASE + " with batteries")
+    assert len(index) == 1
+    assert [idea_id for idea_id, _ in index.similar(1, BASE, threshold=0.1)] == [2]
@@ -0,0 +1,38 @@
+from ideahub_platform.search.suggest import SuggestIndex
+
+def test_suggestions_rank_by_popularity_and_track_updates():
+    """Test prefix lookup, popularity order, workspace isolation and incremental updates."""
+    index = SuggestIndex()
+    index.add(1, 1, "Solar roof", ["Green Energy"])
+    index.add(2, 1, "Solar carport", ["green energy"])
+    index.add(3, 1, "Software licenses")
+    index.add(4, 2, "Solitaire breaks")
+
+    assert index.suggest(1, "so") == [("solar", 2), ("software", 1)]
+    assert index.suggest(1, "So", limit=1) == [("solar", 2)]
+    assert index.suggest(1, "green e") == [("green energy", 2)]
+    assert index.suggest(2, "so") == [("solitaire", 1)]
+    assert index.suggest(3, "so") == []
+    assert index.suggest(1, "") == []
+
+    index.add(3, 1, "Solar lights")
+    index.remove(1)
+    assert index.suggest(1, "so") == [("solar", 2)]
+    index.add(2, 2, "Solar carport")
+    assert index.suggest(1, "so") == [("solar", 1)]
+    assert index.suggest(2, "so") == [("solar", 1), ("solitaire", 1)]
+
+def test_public_only_suggestions_skip_private_ideas():
+    """Test that private ideas only contribute to the full term set, including across updates."""
+    index = SuggestIndex()
+    index.add(1, 1, "Solar roof")
+    index.add(2, 1, "Secret merger", public=False)
+    assert index.suggest(1, "s") == [("secret", 1), ("solar", 1)]
+    assert index.suggest(1, "s", public_only=True) == [("solar", 1)]
+
+    index.add(2, 1, "Secret merger", public=True)
+    index.add(1, 1, "Solar roof", public=False)
+    assert index.suggest(1, "s", public_only=True) == [("secret", 1)]
+    index.remove(2)
+    assert index.suggest(1, "s", public_only=True) == []
+    assert index.suggest(1, "s") == [("solar", 1)]